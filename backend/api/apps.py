@@ -8,3 +8,8 @@ class ApiConfig(AppConfig):
         """Import signals when Django app is ready."""
         import api.signals  # noqa: F401
         import api.signals_lockout  # noqa: F401
+        from api.encryption import EncryptionManager
+
+        # Build the Fernet keys once per process at startup rather than on the
+        # first encrypted field access; a malformed key also fails here
+        EncryptionManager()
@@ -11,16 +11,20 @@ This module ensures that audit logs are tamper-evident and maintain
 a verifiable chain of custody for compliance and security auditing.
 """
 
+import functools
 import hashlib
 import hmac
 import json
+import os
 import secrets
 from typing import Optional
 
 import structlog
 from django.conf import settings
+from django.core.signals import setting_changed
 from django.db import transaction
 from django.db.models import Max
+from django.dispatch import receiver
 
 logger = structlog.get_logger(__name__)
 
@@ -38,8 +42,12 @@ def get_signing_key() -> bytes:
     Raises:
         ValueError: If AUDIT_SIGNING_KEY is not configured
     """
-    import os
+    return _cached_key()
 
+
+@functools.lru_cache(maxsize=1)
+def _cached_key() -> bytes:
+    """Resolve and encode the signing key once; chain verification calls it per entry."""
     # Check settings first, then environment as fallback
     key = getattr(settings, "AUDIT_SIGNING_KEY", "") or os.environ.get(
         "AUDIT_SIGNING_KEY", ""
@@ -53,6 +61,12 @@ def get_signing_key() -> bytes:
     return key.encode("utf-8")
 
 
+@receiver(setting_changed)
+def _reset_signing_key(setting, **kwargs):
+    if setting == "AUDIT_SIGNING_KEY":
+        _cached_key.cache_clear()
+
+
 def generate_nonce() -> str:
     """
     Generate a cryptographically secure nonce.
@@ -94,7 +108,7 @@ def compute_entry_hash(audit_log) -> str:
     return hashlib.sha256(content.encode("utf-8")).hexdigest()
 
 
-def sign_audit_entry(audit_log) -> str:
+def sign_audit_entry(audit_log, entry_hash: Optional[str] = None) -> str:
     """
     Generate HMAC-SHA256 signature for an audit entry.
 
@@ -103,6 +117,7 @@ def sign_audit_entry(audit_log) -> str:
 
     Args:
         audit_log: AuditLog instance with computed hash
+        entry_hash: Precomputed compute_entry_hash(audit_log), if the caller has it
 
     Returns:
         str: HMAC signature as hex string
@@ -112,19 +127,21 @@ def sign_audit_entry(audit_log) -> str:
         return ""
 
     # Compute hash of the entry
-    entry_hash = compute_entry_hash(audit_log)
+    if entry_hash is None:
+        entry_hash = compute_entry_hash(audit_log)
 
     # Sign the hash with HMAC
     signature = hmac.new(key, entry_hash.encode("utf-8"), hashlib.sha256)
     return signature.hexdigest()
 
 
-def verify_signature(audit_log) -> bool:
+def verify_signature(audit_log, entry_hash: Optional[str] = None) -> bool:
     """
     Verify the HMAC signature of an audit entry.
 
     Args:
         audit_log: AuditLog instance with signature field populated
+        entry_hash: Precomputed compute_entry_hash(audit_log), if the caller has it
 
     Returns:
         bool: True if signature is valid, False otherwise
@@ -138,7 +155,7 @@ def verify_signature(audit_log) -> bool:
         return False
 
     # Recompute signature and compare
-    expected_signature = sign_audit_entry(audit_log)
+    expected_signature = sign_audit_entry(audit_log, entry_hash=entry_hash)
 
     # Use constant-time comparison to prevent timing attacks
     is_valid = hmac.compare_digest(audit_log.signature, expected_signature)
@@ -267,41 +284,54 @@ def verify_chain_integrity(
     # Avoid circular import
     from api.models import AuditLog
 
-    # Build query
-    query = AuditLog.objects.all().order_by("sequence_number")
+    # Build query; load only the hashed/checked columns, not metadata etc.
+    query = AuditLog.objects.order_by("sequence_number").only(
+        "id",
+        "timestamp",
+        "actor_id",
+        "org_id",
+        "resource_type",
+        "resource_id",
+        "action",
+        "changes",
+        "nonce",
+        "sequence_number",
+        "previous_hash",
+        "signature",
+    )
 
     if org_id:
         query = query.filter(org_id=org_id)
 
+    sequence_numbers = AuditLog.objects.values_list("sequence_number", flat=True)
     if start_id:
-        start_entry = AuditLog.objects.get(id=start_id)
-        query = query.filter(sequence_number__gte=start_entry.sequence_number)
+        query = query.filter(sequence_number__gte=sequence_numbers.get(id=start_id))
 
     if end_id:
-        end_entry = AuditLog.objects.get(id=end_id)
-        query = query.filter(sequence_number__lte=end_entry.sequence_number)
+        query = query.filter(sequence_number__lte=sequence_numbers.get(id=end_id))
 
-    entries = list(query)
     entries_checked = 0
     errors = []
     broken_at = None
+    # Only the previous entry's hash and sequence number are needed for the
+    # chain checks, so stream rows instead of holding the whole range
+    previous_hash = None
+    previous_sequence = None
 
-    for i, entry in enumerate(entries):
+    for entry in query.iterator(chunk_size=2000):
         entries_checked += 1
+        entry_hash = compute_entry_hash(entry)
 
         # Check signature validity
-        if not verify_signature(entry):
+        if not verify_signature(entry, entry_hash=entry_hash):
             error_msg = f"Invalid signature at entry {entry.id} (seq {entry.sequence_number})"
             errors.append(error_msg)
             if not broken_at:
                 broken_at = str(entry.id)
 
         # Check chain continuity (skip first entry)
-        if i > 0:
-            previous_entry = entries[i - 1]
-            expected_previous_hash = compute_entry_hash(previous_entry)
-
-            if entry.previous_hash != expected_previous_hash:
+        if previous_sequence is not None:
+            if entry.previous_hash != previous_hash:
                 error_msg = (
                     f"Broken chain at entry {entry.id} (seq {entry.sequence_number}): "
                     f"previous_hash mismatch"
@@ -311,16 +341,19 @@ def verify_chain_integrity(
                     broken_at = str(entry.id)
 
             # Check sequence number ordering
-            if entry.sequence_number != previous_entry.sequence_number + 1:
+            if entry.sequence_number != previous_sequence + 1:
                 error_msg = (
                     f"Sequence number gap at entry {entry.id}: "
-                    f"expected {previous_entry.sequence_number + 1}, "
+                    f"expected {previous_sequence + 1}, "
                     f"got {entry.sequence_number}"
                 )
                 errors.append(error_msg)
                 if not broken_at:
                     broken_at = str(entry.id)
 
+        previous_hash = entry_hash
+        previous_sequence = entry.sequence_number
+
     result = {
         "valid": len(errors) == 0,
         "broken_at": broken_at,
@@ -276,14 +276,16 @@ class HybridJWTAuthentication(authentication.BaseAuthentication):
         if not user_id:
             raise exceptions.AuthenticationFailed(gettext("Invalid token: no subject"))
 
+        # The profile is read for the email verification check below
+        users = User.objects.select_related("local_profile")
         try:
-            user = User.objects.get(id=user_id)
+            user = users.get(id=user_id)
         except User.DoesNotExist:
             raise exceptions.AuthenticationFailed(gettext("User not found"))
         except ValueError:
             # If user_id is not a valid UUID, try username lookup
             try:
-                user = User.objects.get(username=user_id)
+                user = users.get(username=user_id)
             except User.DoesNotExist:
                 raise exceptions.AuthenticationFailed(gettext("User not found"))
 
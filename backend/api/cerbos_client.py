@@ -1,7 +1,10 @@
 import functools
 import hashlib
 import json
-from typing import Any, Dict, Set
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set
 
 from cerbos.sdk.client import CerbosClient
 from cerbos.sdk.model import Effect, Principal, Resource, ResourceAction, ResourceList
@@ -13,6 +16,46 @@ CERBOS_CACHE_ALIAS = "cerbos"
 DECISION_CACHE_PREFIX = "decision:"
 
 
+class _LocalDecisionCache:
+    """
+    Small in-process LRU with a TTL, in front of the shared Redis decision cache.
+
+    Hot decisions resolve without a network round trip. Entries live only a
+    few seconds, which bounds how long another process's invalidation can
+    go unseen here.
+    """
+
+    def __init__(self):
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bool]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, allowed = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return allowed
+
+    def set(self, key: str, allowed: bool, ttl: float, maxsize: int) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, allowed)
+            self._entries.move_to_end(key)
+            while len(self._entries) > maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_local_decisions = _LocalDecisionCache()
+
+
 @functools.lru_cache(maxsize=1)
 def get_client() -> CerbosClient:
     """
@@ -66,9 +109,17 @@ def check_action(
     except Exception:
         cache = caches["default"]
     key = _cache_key(principal_id, roles, resource_kind, resource_id, resource_attrs, action)
+    local_ttl = min(getattr(settings, "CERBOS_LOCAL_CACHE_TTL", 0), cache_ttl)
+    local_size = getattr(settings, "CERBOS_LOCAL_CACHE_SIZE", 10000)
+    if local_ttl > 0:
+        cached = _local_decisions.get(key)
+        if cached is not None:
+            return cached
     if cache_ttl > 0:
         cached = cache.get(key)
         if cached is not None:
+            if local_ttl > 0:
+                _local_decisions.set(key, cached, local_ttl, local_size)
             return cached
 
     client = get_client()
@@ -96,11 +147,18 @@ def check_action(
 
     if cache_ttl > 0:
         cache.set(key, allowed, timeout=cache_ttl)
+    if local_ttl > 0:
+        _local_decisions.set(key, allowed, local_ttl, local_size)
     return allowed
 
 
 def invalidate_decision_cache():
-    """Clear Cerbos decision cache (coarse-grained)."""
+    """
+    Clear Cerbos decision cache (coarse-grained).
+
+    Other processes drop their local copies within CERBOS_LOCAL_CACHE_TTL.
+    """
+    _local_decisions.clear()
     try:
         caches[CERBOS_CACHE_ALIAS].clear()
     except Exception:
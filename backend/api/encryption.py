@@ -13,7 +13,9 @@ from typing import Any, Optional
 
 from cryptography.fernet import Fernet, MultiFernet
 from django.conf import settings
+from django.core.signals import setting_changed
 from django.db import models
+from django.dispatch import receiver
 
 
 class EncryptionManager:
@@ -146,6 +148,12 @@ class EncryptionManager:
         return new_ciphertext.decode("ascii")
 
 
+@receiver(setting_changed)
+def _reset_encryption_manager(setting, **kwargs):
+    if setting == "FIELD_ENCRYPTION_KEYS":
+        EncryptionManager.reset()
+
+
 class EncryptedCharField(models.CharField):
     """
     A CharField that encrypts its value before storing in the database.
@@ -6,6 +6,7 @@ from django.utils import timezone
 
 from api.cerbos_client import invalidate_decision_cache
 from api.models import Org, Settings
+from api.stripe_client import get_tier_features
 
 # Import Division model for type hints
 from typing import TYPE_CHECKING
@@ -72,12 +73,10 @@ def get_effective_license(org: Org, division=None, team=None) -> Dict:
     Returns:
         dict with 'license_tier' and 'features' keys
     """
-    # Get tier features from settings
-    tier_features = getattr(settings, "STRIPE_TIER_FEATURES", {})
-
-    # Start with org tier
+    # Start with org tier. Tier feature dicts are shared (memoized from
+    # settings), so only ever merge them into new dicts, never mutate them.
     base_tier = org.license_tier or "free"
-    base_features = tier_features.get(base_tier, tier_features.get("free", {})).copy()
+    base_features = get_tier_features(base_tier)
 
     # Merge org feature_flags (can override tier defaults)
     effective_features = {**base_features, **(org.feature_flags or {})}
@@ -88,8 +87,7 @@ def get_effective_license(org: Org, division=None, team=None) -> Dict:
         if division.billing_mode == "independent" and division.license_tier:
             # Division has independent billing - use its tier as base
             effective_tier = division.license_tier
-            division_tier_features = tier_features.get(effective_tier, tier_features.get("free", {})).copy()
-            effective_features = {**division_tier_features}
+            effective_features = {**get_tier_features(effective_tier)}
 
         # Merge division feature_flags (can go up or down)
         if division.feature_flags:
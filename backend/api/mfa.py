@@ -32,10 +32,13 @@ Usage:
     Add 'api.mfa.MFAMiddleware' to MIDDLEWARE in settings
 """
 
+import functools
 from functools import wraps
 from typing import Any, Dict, List, Optional
 
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.http import JsonResponse
 from django.utils.translation import gettext as _
 from rest_framework import exceptions
@@ -131,11 +134,19 @@ def _is_endpoint_mfa_required(path: str) -> bool:
     Returns:
         True if the endpoint requires MFA, False otherwise
     """
-    mfa_settings = _get_mfa_settings()
-    for endpoint_prefix in mfa_settings["mfa_required_endpoints"]:
-        if path.startswith(endpoint_prefix):
-            return True
-    return False
+    return path.startswith(_mfa_endpoint_prefixes())
+
+
+@functools.lru_cache(maxsize=1)
+def _mfa_endpoint_prefixes() -> tuple:
+    """MFA_REQUIRED_ENDPOINTS as a tuple, so str.startswith checks them all in one call."""
+    return tuple(_get_mfa_settings()["mfa_required_endpoints"])
+
+
+@receiver(setting_changed)
+def _reset_mfa_endpoint_prefixes(setting, **kwargs):
+    if setting == "MFA_REQUIRED_ENDPOINTS":
+        _mfa_endpoint_prefixes.cache_clear()
 
 
 def _is_user_admin(request: Request) -> bool:
@@ -0,0 +1,25 @@
+# Generated by Django 6.0 on 2026-10-17 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0016_add_refresh_token_rotation'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='division',
+            index=models.Index(fields=['org', '-created_at', '-id'], name='api_divisio_org_id_91a342_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='membership',
+            index=models.Index(fields=['org', '-created_at', '-id'], name='api_members_org_id_db9064_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='team',
+            index=models.Index(fields=['org', '-created_at', '-id'], name='api_team_org_id_28e772_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 6.0 on 2026-10-17 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0017_add_org_created_at_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='localuserprofile',
+            name='api_localus_email_v_f41d1b_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='localuserprofile',
+            name='api_localus_passwor_ec2479_idx',
+        ),
+        migrations.AddIndex(
+            model_name='localuserprofile',
+            index=models.Index(condition=models.Q(('email_verification_token', ''), _negated=True), fields=['email_verification_token'], name='localus_verify_token_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='localuserprofile',
+            index=models.Index(condition=models.Q(('password_reset_token', ''), _negated=True), fields=['password_reset_token'], name='localus_reset_token_idx'),
+        ),
+    ]
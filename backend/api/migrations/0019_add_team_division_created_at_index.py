@@ -0,0 +1,21 @@
+# Generated by Django 6.0 on 2026-10-17 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0018_partial_local_auth_token_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='team',
+            index=models.Index(fields=['division', '-created_at', '-id'], name='api_team_divisio_f2492a_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='team',
+            name='api_team_divisio_56db48_idx',
+        ),
+    ]
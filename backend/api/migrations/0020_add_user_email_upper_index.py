@@ -0,0 +1,36 @@
+# Generated by Django 6.0 on 2026-10-17 12:00
+
+from django.conf import settings
+from django.db import migrations
+
+# Django compiles email__iexact on PostgreSQL to UPPER("email"::text) = UPPER(%s),
+# which a plain btree index on email can't serve. Index that exact expression.
+INDEX_NAME = "auth_user_email_upper_idx"
+
+
+def create_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+    table = schema_editor.quote_name(User._meta.db_table)
+    schema_editor.execute(
+        f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} ON {table} (UPPER(email::text))"
+    )
+
+
+def drop_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f"DROP INDEX IF EXISTS {INDEX_NAME}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0019_add_team_division_created_at_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
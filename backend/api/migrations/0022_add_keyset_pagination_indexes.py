@@ -0,0 +1,25 @@
+# Generated by Django 6.0 on 2026-10-17 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0021_add_webhook_delivery_endpoint_created_at_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='division',
+            index=models.Index(fields=['-created_at', '-id'], name='api_divisio_created_3f8cb1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='webhookendpoint',
+            index=models.Index(fields=['org_id', '-created_at', '-id'], name='api_webhook_org_id_926156_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='webhookendpoint',
+            index=models.Index(fields=['-created_at', '-id'], name='api_webhook_created_d92d54_idx'),
+        ),
+    ]
@@ -99,6 +99,8 @@ class Division(TimeStampedModel):
         unique_together = [("org", "name")]
         indexes = [
             models.Index(fields=["org"]),
+            models.Index(fields=["org", "-created_at", "-id"]),
+            models.Index(fields=["-created_at", "-id"]),
             models.Index(fields=["billing_mode"]),
             models.Index(fields=["stripe_customer_id"]),
         ]
@@ -119,7 +121,8 @@ class Team(TimeStampedModel):
         unique_together = [("org", "division", "name")]
         indexes = [
             models.Index(fields=["org"]),
-            models.Index(fields=["division"]),
+            models.Index(fields=["org", "-created_at", "-id"]),
+            models.Index(fields=["division", "-created_at", "-id"]),
         ]
 
     def __str__(self) -> str:  # pragma: no cover
@@ -145,6 +148,7 @@ class Membership(TimeStampedModel):
         indexes = [
             models.Index(fields=["user", "org"]),
             models.Index(fields=["org"]),
+            models.Index(fields=["org", "-created_at", "-id"]),
             models.Index(fields=["division"]),
             models.Index(fields=["team"]),
         ]
@@ -239,7 +243,11 @@ class WebhookEndpoint(TimeStampedModel):
     headers = models.JSONField(default=dict, blank=True)
 
     class Meta:
-        indexes = [models.Index(fields=["org_id", "is_active"])]
+        indexes = [
+            models.Index(fields=["org_id", "is_active"]),
+            models.Index(fields=["org_id", "-created_at", "-id"]),
+            models.Index(fields=["-created_at", "-id"]),
+        ]
 
     def __str__(self) -> str:  # pragma: no cover
         return f"WebhookEndpoint<{self.name}>"
@@ -267,7 +275,11 @@ class WebhookDelivery(TimeStampedModel):
 
     class Meta:
         ordering = ["-created_at"]
-        indexes = [models.Index(fields=["endpoint", "status"])]
+        indexes = [
+            models.Index(fields=["endpoint", "status"]),
+            # Keyset pagination of an endpoint's deliveries, newest first
+            models.Index(fields=["endpoint", "-created_at", "-id"]),
+        ]
 
     def __str__(self) -> str:  # pragma: no cover
         return f"WebhookDelivery<{self.event_type} -> {self.endpoint.name}>"
@@ -94,8 +94,18 @@ class LocalUserProfile(TimeStampedModel):
         verbose_name = "Local User Profile"
         verbose_name_plural = "Local User Profiles"
         indexes = [
-            models.Index(fields=["email_verification_token"]),
-            models.Index(fields=["password_reset_token"]),
+            # Tokens are blank for most profiles; partial indexes only cover
+            # the rows with an outstanding token.
+            models.Index(
+                fields=["email_verification_token"],
+                name="localus_verify_token_idx",
+                condition=~models.Q(email_verification_token=""),
+            ),
+            models.Index(
+                fields=["password_reset_token"],
+                name="localus_reset_token_idx",
+                condition=~models.Q(password_reset_token=""),
+            ),
             models.Index(fields=["stripe_customer_id"]),
         ]
 
@@ -451,11 +461,11 @@ class RefreshToken(TimeStampedModel):
         self.save(update_fields=["revoked_at"])
 
     @classmethod
-    def revoke_all_for_user(cls, user: User) -> int:
+    def revoke_all_for_user(cls, user: User | int) -> int:
         """
-        Revoke all refresh tokens for a user.
+        Revoke all refresh tokens for a user in a single UPDATE.
 
-        Returns the number of tokens revoked.
+        Accepts a User or a user primary key. Returns the number of tokens revoked.
         """
         return cls.objects.filter(
             user=user,
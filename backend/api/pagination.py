@@ -0,0 +1,162 @@
+"""
+Keyset (cursor) pagination for created_at-ordered list endpoints.
+
+LIMIT/OFFSET makes the database walk and discard every skipped row, so deep
+pages get linearly slower. Passing the opaque ``cursor`` returned with the
+previous page instead seeks straight to the next row using the
+(org, created_at, id) indexes. ``offset`` keeps working for existing clients.
+
+KeysetLimitOffsetPagination is the DRF default. It falls back to plain
+LIMIT/OFFSET for models without a ``created_at`` field and for querysets
+ordered some other way.
+
+Usage:
+    from api.pagination import keyset_page
+
+    cursor = request.query_params.get("cursor")
+    results, next_cursor = keyset_page(queryset, cursor, offset, limit)
+"""
+
+import base64
+import binascii
+from datetime import datetime
+
+from django.core.exceptions import FieldDoesNotExist
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+KEYSET_ORDERING = ("-created_at", "-id")
+# Orderings a keyset page reproduces exactly (it only adds the id tie-breaker)
+_KEYSET_COMPATIBLE_ORDERINGS = {(), ("-created_at",), KEYSET_ORDERING, ("-created_at", "-pk")}
+CURSOR_QUERY_PARAM = "cursor"
+
+
+def encode_cursor(obj) -> str:
+    """Encode the position of ``obj`` (a model instance or ``values()`` row) as a cursor."""
+    if isinstance(obj, dict):
+        created_at, pk = obj["created_at"], obj["id"]
+    else:
+        created_at, pk = obj.created_at, obj.pk
+    raw = f"{created_at.isoformat()}|{pk}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Decode a cursor into its (created_at, pk) position."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        created_at, pk = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), pk
+    except (ValueError, UnicodeError, binascii.Error):
+        raise ValidationError({CURSOR_QUERY_PARAM: "Invalid cursor."})
+
+
+def keyset_page(queryset, cursor: str | None, offset: int, limit: int) -> tuple[list, str | None]:
+    """
+    Return one page of ``queryset`` ordered newest first, plus the next cursor.
+
+    When ``cursor`` is given, rows are selected by seeking past that position
+    and ``offset`` is ignored. ``next_cursor`` is None on the last page.
+    """
+    queryset = queryset.order_by(*KEYSET_ORDERING)
+    if cursor:
+        created_at, pk = decode_cursor(cursor)
+        try:
+            queryset = queryset.filter(
+                Q(created_at__lt=created_at) | Q(created_at=created_at, pk__lt=pk)
+            )
+        except (ValueError, TypeError, DjangoValidationError):
+            raise ValidationError({CURSOR_QUERY_PARAM: "Invalid cursor."})
+        offset = 0
+
+    # Fetch one extra row to learn whether another page exists
+    rows = list(queryset[offset : offset + limit + 1])
+    if len(rows) > limit:
+        rows = rows[:limit]
+        return rows, encode_cursor(rows[-1])
+    return rows, None
+
+
+def supports_keyset(model) -> bool:
+    """Return True if ``model`` has the created_at field keyset pages are ordered by."""
+    try:
+        model._meta.get_field("created_at")
+    except FieldDoesNotExist:
+        return False
+    return True
+
+
+def has_keyset_ordering(queryset) -> bool:
+    """Return True if ``queryset`` is unordered or already ordered newest first."""
+    ordering = tuple(queryset.query.order_by)
+    if not ordering and queryset.query.default_ordering:
+        ordering = tuple(queryset.model._meta.ordering)
+    return ordering in _KEYSET_COMPATIBLE_ORDERINGS
+
+
+class KeysetLimitOffsetPagination(LimitOffsetPagination):
+    """
+    LimitOffsetPagination that also accepts a ``cursor`` query parameter.
+
+    Responses carry a ``next_cursor`` alongside the usual next/previous links.
+    On keyset pages ``next`` carries the next cursor instead of an offset. On
+    cursor requests ``previous`` is None and ``count`` is skipped (None), since
+    counting would scan the whole set.
+    """
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = False
+        self.cursor = None
+        self.next_cursor = None
+        if not supports_keyset(queryset.model) or not has_keyset_ordering(queryset):
+            return super().paginate_queryset(queryset, request, view)
+
+        self.limit = self.get_limit(request)
+        if self.limit is None:
+            return None
+
+        self.request = request
+        self.keyset = True
+        self.cursor = request.query_params.get(CURSOR_QUERY_PARAM)
+        if self.cursor:
+            self.count = None
+            self.offset = 0
+        else:
+            self.count = self.get_count(queryset)
+            self.offset = self.get_offset(request)
+        page, self.next_cursor = keyset_page(queryset, self.cursor, self.offset, self.limit)
+        return page
+
+    def get_next_link(self):
+        if not self.keyset:
+            return super().get_next_link()
+        if self.next_cursor is None:
+            return None
+        url = remove_query_param(self.request.build_absolute_uri(), self.offset_query_param)
+        return replace_query_param(url, CURSOR_QUERY_PARAM, self.next_cursor)
+
+    def get_previous_link(self):
+        if self.cursor:
+            return None
+        return super().get_previous_link()
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "count": self.count,
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "next_cursor": self.next_cursor,
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["properties"]["count"]["nullable"] = True
+        response_schema["properties"]["next_cursor"] = {"type": "string", "nullable": True}
+        return response_schema
@@ -0,0 +1,27 @@
+"""
+Fast JSON parser backed by orjson.
+
+DRF's default JSONParser decodes request bodies with the stdlib json module.
+orjson parses the raw bytes directly and is several times faster; like DRF's
+strict mode it rejects NaN/Infinity.
+
+Usage:
+    from api.parsers import ORJSONParser
+
+    class MyView(APIView):
+        parser_classes = [ORJSONParser]
+"""
+
+import orjson
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+
+class ORJSONParser(JSONParser):
+    """JSON parser that decodes with orjson instead of the stdlib json module."""
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
@@ -5,11 +5,16 @@ These permissions allow org admins to manage their own organization
 without requiring platform_admin access.
 """
 
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
 from django.utils.translation import gettext_lazy as _
 from rest_framework import permissions
 
+# Shared read-only default for requests without token claims, so lookups
+# don't allocate a new dict each time and callers can't mutate it.
+EMPTY_CLAIMS: Mapping[str, Any] = MappingProxyType({})
+
 
 def _extract_roles_from_claims(claims: Dict[str, Any]) -> list:
     """Extract roles from JWT claims, handling different token formats."""
@@ -45,7 +50,7 @@ class IsOrgAdminForOrg(permissions.BasePermission):
         if not request.user or not request.user.is_authenticated:
             return False
 
-        claims = getattr(request, "token_claims", {})
+        claims = getattr(request, "token_claims", EMPTY_CLAIMS)
         roles = _extract_roles_from_claims(claims)
 
         # Platform admins can access any org
@@ -90,7 +95,7 @@ class IsDivisionAdminForDivision(permissions.BasePermission):
         if not request.user or not request.user.is_authenticated:
             return False
 
-        claims = getattr(request, "token_claims", {})
+        claims = getattr(request, "token_claims", EMPTY_CLAIMS)
         roles = _extract_roles_from_claims(claims)
 
         # Platform admins can access any division
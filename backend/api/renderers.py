@@ -0,0 +1,35 @@
+"""
+Fast JSON renderers backed by orjson.
+
+DRF's default JSONRenderer goes through the stdlib json module. For views that
+return large, dict-heavy payloads (monitoring, metrics, org list endpoints)
+orjson is several times faster and natively handles datetime and UUID values.
+
+Usage:
+    from api.renderers import ORJSONRenderer
+
+    class MyView(APIView):
+        renderer_classes = [ORJSONRenderer]
+"""
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# DRF's encoder knows how to handle Decimal, lazy translation strings,
+# querysets and other types orjson does not serialize natively.
+_fallback_encoder = JSONEncoder()
+
+
+class ORJSONRenderer(JSONRenderer):
+    """JSON renderer that serializes with orjson instead of the stdlib json module."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return orjson.dumps(
+            data,
+            default=_fallback_encoder.default,
+            # OPT_UTC_Z renders UTC as "Z", matching DRF's JSONEncoder output.
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z,
+        )
@@ -79,6 +79,76 @@ class MembershipListSerializer(serializers.ModelSerializer):
         return f"{obj.user.first_name} {obj.user.last_name}".strip() or obj.user.email
 
 
+# Columns fetched by list endpoints that render with serialize_membership_list()
+MEMBERSHIP_LIST_VALUES = (
+    "id",
+    "user_id",
+    "user__email",
+    "user__first_name",
+    "user__last_name",
+    "org_id",
+    "org__name",
+    "division_id",
+    "division__name",
+    "team_id",
+    "team__name",
+    "org_roles",
+    "division_roles",
+    "team_roles",
+    "created_at",
+)
+
+# Relations and model fields MembershipListSerializer reads, for list querysets
+MEMBERSHIP_LIST_SELECT = ("user", "org", "division", "team")
+MEMBERSHIP_LIST_ONLY = (
+    "id",
+    "org_roles",
+    "division_roles",
+    "team_roles",
+    "created_at",
+    "user__email",
+    "user__first_name",
+    "user__last_name",
+    "org__name",
+    "division__name",
+    "team__name",
+)
+
+_created_at_field = serializers.DateTimeField()
+
+
+def serialize_membership_list(rows) -> list[dict]:
+    """
+    Render ``values(*MEMBERSHIP_LIST_VALUES)`` rows in MembershipListSerializer's shape.
+
+    Skips model instantiation and per-row serializer field binding, which
+    dominates list responses at large page sizes.
+    """
+    to_datetime = _created_at_field.to_representation
+    return [
+        {
+            "id": str(row["id"]),
+            "user": row["user_id"],
+            "user_email": row["user__email"],
+            "user_name": (
+                f"{row['user__first_name']} {row['user__last_name']}".strip()
+                or row["user__email"]
+            ),
+            "org": row["org_id"],
+            "org_name": row["org__name"],
+            "division": row["division_id"],
+            "division_name": row["division__name"],
+            "team": row["team_id"],
+            "team_name": row["team__name"],
+            "org_roles": row["org_roles"],
+            "division_roles": row["division_roles"],
+            "team_roles": row["team_roles"],
+            "created_at": to_datetime(row["created_at"]),
+        }
+        for row in rows
+    ]
+
+
 class MembershipCreateSerializer(serializers.ModelSerializer):
     """Serializer for creating a new Membership."""
 
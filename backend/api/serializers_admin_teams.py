@@ -63,6 +63,50 @@ class TeamListSerializer(serializers.ModelSerializer):
         return obj.memberships.count()
 
 
+# Team columns fetched by list endpoints that render with serialize_team_list()
+TEAM_LIST_COLUMNS = (
+    "id",
+    "name",
+    "org_id",
+    "division_id",
+    "_members_count",
+    "created_at",
+)
+# Columns plus the joined org/division names, when they differ per row
+TEAM_LIST_VALUES = TEAM_LIST_COLUMNS + ("org__name", "division__name")
+
+# Relations and model fields TeamListSerializer reads, for list querysets
+TEAM_LIST_SELECT = ("org", "division")
+TEAM_LIST_ONLY = ("id", "name", "created_at", "org__name", "division__name")
+
+_created_at_field = serializers.DateTimeField()
+
+
+def serialize_team_list(rows, org_name=None, division_name=None) -> list[dict]:
+    """
+    Render ``values()`` rows in TeamListSerializer's shape.
+
+    Skips model instantiation and per-row serializer field binding, which
+    dominates list responses at large page sizes. When every row shares the
+    same org or division, pass its name and fetch ``TEAM_LIST_COLUMNS``
+    without the corresponding join.
+    """
+    to_datetime = _created_at_field.to_representation
+    return [
+        {
+            "id": str(row["id"]),
+            "name": row["name"],
+            "org": row["org_id"],
+            "org_name": row["org__name"] if org_name is None else org_name,
+            "division": row["division_id"],
+            "division_name": row["division__name"] if division_name is None else division_name,
+            "members_count": row["_members_count"],
+            "created_at": to_datetime(row["created_at"]),
+        }
+        for row in rows
+    ]
+
+
 class TeamCreateSerializer(serializers.ModelSerializer):
     """Serializer for creating a new Team."""
 
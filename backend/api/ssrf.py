@@ -17,13 +17,18 @@ Usage:
     response = safe_request("https://example.com/webhook", json=payload)
 """
 
+import http.cookiejar
 import ipaddress
+import os
 import socket
+import threading
 from typing import Optional
 from urllib.parse import urlparse
 
+import requests
 import structlog
 from django.conf import settings
+from requests.adapters import HTTPAdapter
 
 logger = structlog.get_logger(__name__)
 
@@ -326,6 +331,49 @@ def validate_webhook_url(url: str) -> tuple[str, list[str]]:
     return (hostname, ip_addresses)
 
 
+# ========================================
+# Shared HTTP Session
+# ========================================
+
+# Connections kept per destination host; webhook URLs are rewritten to the
+# resolved IP, so the pool is keyed by (scheme, IP, port)
+WEBHOOK_POOL_MAXSIZE = 100
+
+_session: Optional[requests.Session] = None
+_session_pid: Optional[int] = None
+_session_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """
+    Return the process-wide session used for webhook requests.
+
+    Reusing one session keeps TCP/TLS connections to a destination alive
+    between deliveries. Sockets must not be shared across fork, so each
+    (Celery worker) process builds its own. The session is shared by every
+    org's deliveries, so it stores no cookies: one receiver's Set-Cookie would
+    otherwise be replayed to other endpoints on the same IP. Proxy and CA
+    bundle settings from the environment still apply, as with requests.request.
+    """
+    global _session, _session_pid
+
+    pid = os.getpid()
+    if _session_pid == pid:
+        return _session
+    with _session_lock:
+        if _session_pid != pid:
+            session = requests.Session()
+            session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+            adapter = HTTPAdapter(
+                pool_connections=WEBHOOK_POOL_MAXSIZE, pool_maxsize=WEBHOOK_POOL_MAXSIZE
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+            _session_pid = pid
+    return _session
+
+
 # ========================================
 # Safe HTTP Request Wrapper
 # ========================================
@@ -342,7 +390,7 @@ def safe_request(
     """
     Make a safe HTTP request with SSRF protection.
 
-    This function wraps requests.request with SSRF validation. It:
+    This function wraps a pooled requests.Session with SSRF validation. It:
     1. Validates the URL against SSRF attacks
     2. Resolves DNS and validates IP addresses
     3. Makes the request to the resolved IP with the original Host header
@@ -354,7 +402,7 @@ def safe_request(
         json: JSON payload to send
         headers: HTTP headers
         timeout: Request timeout in seconds
-        **kwargs: Additional arguments to pass to requests.request
+        **kwargs: Additional arguments to pass to Session.request
 
     Returns:
         requests.Response object
@@ -363,8 +411,6 @@ def safe_request(
         SSRFProtectionError: If URL validation fails
         requests.exceptions.RequestException: If HTTP request fails
     """
-    import requests
-
     # Validate URL and get resolved IPs
     hostname, ip_addresses = validate_webhook_url(url)
 
@@ -375,7 +421,7 @@ def safe_request(
     # If SSRF protection is disabled or allowlist is used, make direct request
     if not ip_addresses:
         logger.debug("ssrf_direct_request", url=url)
-        return requests.request(
+        return _get_session().request(
             method=method,
             url=url,
             json=json,
@@ -419,7 +465,7 @@ def safe_request(
     )
 
     # Make the request to the IP address with original Host header
-    return requests.request(
+    return _get_session().request(
         method=method,
         url=request_url,
         json=json,
@@ -5,14 +5,26 @@ Provides a clean interface for Stripe API calls with proper error handling,
 logging, and configuration management.
 """
 
+import functools
 from typing import Any, Optional
 
 import stripe
 import structlog
 from django.conf import settings
+from django.core.cache import cache
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 
 logger = structlog.get_logger(__name__)
 
+# Customer subscription lists are cached until a Stripe webhook for the
+# customer invalidates them (or the TTL lapses as a safety net).
+SUBSCRIPTIONS_CACHE_TTL = 86400
+
+
+def _subscriptions_cache_key(customer_id: str) -> str:
+    return f"stripe_subs:{customer_id}"
+
 
 def _get_stripe_client() -> stripe.StripeClient:
     """Get configured Stripe client instance."""
@@ -276,18 +288,26 @@ def get_customer_subscriptions(customer_id: str) -> list[dict]:
     """
     Get all subscriptions for a customer.
 
+    Results are served from the cache when present; only successful Stripe
+    responses are cached.
+
     Args:
         customer_id: The Stripe customer ID
 
     Returns:
         List of subscription dicts
     """
+    cache_key = _subscriptions_cache_key(customer_id)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         client = _get_stripe_client()
         subscriptions = client.subscriptions.list(
             params={"customer": customer_id, "status": "all", "limit": 10}
         )
-        return [sub.to_dict() for sub in subscriptions.data]
+        result = [sub.to_dict() for sub in subscriptions.data]
     except stripe.StripeError as e:
         logger.warning(
             "stripe_subscriptions_list_failed",
@@ -296,6 +316,19 @@ def get_customer_subscriptions(customer_id: str) -> list[dict]:
         )
         return []
 
+    cache.set(cache_key, result, SUBSCRIPTIONS_CACHE_TTL)
+    return result
+
+
+def invalidate_customer_subscriptions(customer_id: str | None) -> None:
+    """
+    Drop the cached subscription list for a customer.
+
+    Called from Stripe webhooks so the next billing status read refetches.
+    """
+    if customer_id:
+        cache.delete(_subscriptions_cache_key(customer_id))
+
 
 def cancel_subscription(subscription_id: str, at_period_end: bool = True) -> bool:
     """
@@ -348,14 +381,25 @@ def map_price_to_tier(price_id: str) -> str:
     return settings.STRIPE_PRICE_TIER_MAP.get(price_id, "free")
 
 
+@functools.lru_cache(maxsize=16)
 def get_tier_features(tier: str) -> dict:
     """
     Get the feature flags for a license tier.
 
+    The tier map comes from settings and is memoized per tier; callers must
+    not mutate the returned dict.
+
     Args:
         tier: The license tier name
 
     Returns:
         Feature flags dict for the tier
     """
-    return settings.STRIPE_TIER_FEATURES.get(tier, settings.STRIPE_TIER_FEATURES["free"])
+    tier_features = getattr(settings, "STRIPE_TIER_FEATURES", {})
+    return tier_features.get(tier, tier_features.get("free", {}))
+
+
+@receiver(setting_changed)
+def _reset_tier_features(setting, **kwargs):
+    if setting == "STRIPE_TIER_FEATURES":
+        get_tier_features.cache_clear()
@@ -11,6 +11,7 @@ import structlog
 from celery import shared_task
 from django.conf import settings
 from django.core.cache import caches
+from django.core.exceptions import ObjectDoesNotExist
 
 from api.ssrf import SSRFProtectionError, safe_request
 
@@ -243,6 +244,51 @@ def send_email_task(
     return send_email(to, subject, template, context, from_email)
 
 
+@shared_task
+def send_password_reset_email_task(email: str) -> None:
+    """
+    Issue a password reset token and email it, if the account exists.
+
+    Runs the whole lookup off the request path so the API response takes
+    the same time whether or not the email matches an account.
+    """
+    from django.contrib.auth import get_user_model
+
+    from api.email import send_email
+
+    try:
+        user = get_user_model().objects.select_related("local_profile").get(email__iexact=email)
+        profile = user.local_profile
+    except ObjectDoesNotExist:
+        return
+
+    token = profile.generate_password_reset_token()
+    frontend_url = getattr(settings, "FRONTEND_URL", "http://localhost:3000")
+
+    send_email(
+        [user.email],
+        "Reset your password",
+        "email/password_reset.html",
+        {
+            "user": {"first_name": user.first_name, "email": user.email},
+            "reset_url": f"{frontend_url}/reset-password?token={token}",
+        },
+    )
+
+
+@shared_task
+def dispatch_webhook_event(event_type: str, payload: dict, org_id: str = None) -> list[str]:
+    """
+    Fan a webhook event out to its matching endpoints from a worker.
+
+    Not retried automatically: a partial failure after the delivery rows are
+    created would otherwise queue duplicate deliveries.
+    """
+    from api.webhooks import dispatch_webhook
+
+    return dispatch_webhook(event_type, payload, org_id=org_id)
+
+
 @shared_task(
     bind=True,
     autoretry_for=(Exception,),
@@ -361,6 +361,26 @@ class TestChainVerification:
         assert result2["valid"] is True
         assert result2["entries_checked"] == 2
 
+    def test_verify_chain_integrity_range(self, clean_audit_logs, mock_signing_key):
+        """start_id/end_id should bound the streamed range and still check links within it."""
+        entry1 = self._create_signed_entry("user-1", "org-1", "user-1", 1)
+        entry2 = self._create_signed_entry(
+            "user-2", "org-1", "user-2", 2, compute_entry_hash(entry1)
+        )
+        entry3 = self._create_signed_entry(
+            "user-3", "org-1", "user-3", 3, compute_entry_hash(entry2)
+        )
+        self._create_signed_entry("user-4", "org-1", "user-4", 4, compute_entry_hash(entry3))
+
+        result = verify_chain_integrity(start_id=str(entry2.id), end_id=str(entry3.id))
+        assert result["valid"] is True, f"Verification failed: {result}"
+        assert result["entries_checked"] == 2
+
+        # Breaking the link into entry3 is detected inside the range
+        AuditLog.objects.filter(id=entry3.id).update(previous_hash="wrong-hash")
+        result = verify_chain_integrity(start_id=str(entry2.id), end_id=str(entry3.id))
+        assert result["broken_at"] == str(entry3.id)
+
     def test_nonce_uniqueness(self, mock_signing_key):
         """Test that nonces are unique across entries."""
         nonces = set()
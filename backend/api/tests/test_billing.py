@@ -5,6 +5,7 @@ Tests for Stripe billing integration.
 import json
 from unittest.mock import MagicMock, patch
 
+from django.core.cache import cache
 from django.test import TestCase, override_settings
 from rest_framework import status
 from rest_framework.test import APITestCase
@@ -12,6 +13,7 @@ from rest_framework.test import APITestCase
 from api.models import Org
 from api.stripe_client import (
     StripeNotConfiguredError,
+    get_customer_subscriptions,
     get_tier_features,
     map_price_to_tier,
 )
@@ -57,6 +59,11 @@ class TierMappingTests(TestCase):
         features = get_tier_features("enterprise")
         self.assertEqual(features["max_users"], 5)
 
+    @override_settings(STRIPE_TIER_FEATURES={"pro": {"max_users": 100}})
+    def test_get_tier_features_without_free_tier(self):
+        """A partial tier map without "free" should yield no features, not KeyError."""
+        self.assertEqual(get_tier_features("enterprise"), {})
+
 
 class StripeClientTests(TestCase):
     """Test Stripe client wrapper."""
@@ -77,6 +84,21 @@ class StripeClientTests(TestCase):
         with self.assertRaises(StripeNotConfiguredError):
             _get_stripe_client()
 
+    @patch("api.stripe_client._get_stripe_client")
+    def test_customer_subscriptions_cached(self, mock_get_client):
+        """Test subscription lists are fetched from Stripe once, then cached."""
+        cache.clear()
+        sub = MagicMock()
+        sub.to_dict.return_value = {"id": "sub_1", "status": "active"}
+        mock_get_client.return_value.subscriptions.list.return_value.data = [sub]
+
+        first = get_customer_subscriptions("cus_cached")
+        second = get_customer_subscriptions("cus_cached")
+
+        self.assertEqual(first, [{"id": "sub_1", "status": "active"}])
+        self.assertEqual(second, first)
+        mock_get_client.return_value.subscriptions.list.assert_called_once()
+
 
 class BillingStatusViewTests(APITestCase):
     """Test billing status endpoint."""
@@ -265,6 +287,23 @@ class StripeWebhookTests(APITestCase):
         self.assertEqual(self.org.license_tier, "pro")
         self.assertEqual(self.org.stripe_subscription_id, "sub_test123")
 
+    @override_settings(STRIPE_ENABLED=False)
+    def test_webhook_subscription_event_invalidates_cache(self):
+        """Test subscription webhooks drop the customer's cached subscription list."""
+        cache.set("stripe_subs:cus_test123", [{"id": "sub_old"}])
+        payload = {
+            "type": "customer.subscription.updated",
+            "data": {"object": {"id": "sub_test123", "customer": "cus_test123"}},
+        }
+
+        self.client.post(
+            "/api/v1/stripe/webhook",
+            data=json.dumps(payload),
+            content_type="application/json",
+        )
+
+        self.assertIsNone(cache.get("stripe_subs:cus_test123"))
+
     @override_settings(
         STRIPE_ENABLED=False,
         STRIPE_TIER_FEATURES={"free": {"max_users": 5}},
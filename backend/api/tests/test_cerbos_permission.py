@@ -2,6 +2,8 @@ from types import SimpleNamespace
 
 import pytest
 from cerbos.sdk.model import Effect
+from django.core.cache import caches
+from django.test import override_settings
 from django.urls import reverse
 from rest_framework.test import APIClient
 
@@ -103,3 +105,32 @@ def test_cerbos_decision_cache(monkeypatch):
         cerbos_client.invalidate_decision_cache()
         # Clear the LRU cache on the original function
         original_get_client.cache_clear()
+
+
+def test_cerbos_local_cache_serves_hot_decisions(monkeypatch):
+    calls = {"count": 0}
+
+    class FakeClient:
+        def check_resources(self, principal, resources):
+            calls["count"] += 1
+            return SimpleNamespace(results=[SimpleNamespace(actions={"read": Effect.ALLOW})])
+
+    monkeypatch.setattr("api.cerbos_client.get_client", lambda: FakeClient())
+    cerbos_client.invalidate_decision_cache()
+    org_attrs = {"org_id": "org-1"}
+    args = ("u2", {"org_admin"}, org_attrs, "sample_resource", "2", org_attrs, "read")
+
+    try:
+        assert cerbos_client.check_action(*args) is True
+        # Drop only the shared Redis entry; the in-process copy still answers
+        caches[cerbos_client.CERBOS_CACHE_ALIAS].clear()
+        assert cerbos_client.check_action(*args) is True
+        assert calls["count"] == 1
+
+        # With the local layer disabled, a missing Redis entry goes back to Cerbos
+        with override_settings(CERBOS_LOCAL_CACHE_TTL=0):
+            caches[cerbos_client.CERBOS_CACHE_ALIAS].clear()
+            assert cerbos_client.check_action(*args) is True
+        assert calls["count"] == 2
+    finally:
+        cerbos_client.invalidate_decision_cache()
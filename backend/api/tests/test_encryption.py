@@ -17,6 +17,7 @@ import pytest
 from cryptography.fernet import Fernet
 from django.conf import settings
 from django.db import connection
+from django.test import override_settings
 
 from api.encryption import (
     EncryptedCharField,
@@ -173,6 +174,18 @@ class TestEncryptionManager:
         # Old ciphertext should still decrypt (using key1)
         assert manager2.decrypt(old_ciphertext) == plaintext
 
+    def test_override_settings_reloads_keys(self, encryption_keys):
+        """Overriding FIELD_ENCRYPTION_KEYS should rebuild the cached Fernet keys."""
+        key1, key2 = encryption_keys
+
+        with override_settings(FIELD_ENCRYPTION_KEYS=[key1]):
+            ciphertext = EncryptionManager().encrypt("test data")
+        assert Fernet(key1.encode()).decrypt(ciphertext.encode()) == b"test data"
+
+        with override_settings(FIELD_ENCRYPTION_KEYS=[key2]):
+            ciphertext = EncryptionManager().encrypt("test data")
+        assert Fernet(key2.encode()).decrypt(ciphertext.encode()) == b"test data"
+
 
 @pytest.mark.django_db
 class TestEncryptedFields:
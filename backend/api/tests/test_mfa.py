@@ -378,6 +378,21 @@ class TestMFAEnforcementForEndpoints:
         with pytest.raises(exceptions.AuthenticationFailed):
             check_mfa_required(request, raise_exception=True)
 
+    def test_endpoint_prefixes_follow_setting_changes(self):
+        """Overriding MFA_REQUIRED_ENDPOINTS should reset the cached prefixes."""
+        from api.mfa import _is_endpoint_mfa_required
+
+        with override_settings(MFA_REQUIRED_ENDPOINTS=["/api/v1/admin/"]):
+            assert _is_endpoint_mfa_required("/api/v1/admin/users/")
+            assert not _is_endpoint_mfa_required("/api/v1/billing/")
+
+        with override_settings(MFA_REQUIRED_ENDPOINTS=["/api/v1/billing/"]):
+            assert not _is_endpoint_mfa_required("/api/v1/admin/users/")
+            assert _is_endpoint_mfa_required("/api/v1/billing/invoices/")
+
+        with override_settings(MFA_REQUIRED_ENDPOINTS=[]):
+            assert not _is_endpoint_mfa_required("/api/v1/admin/users/")
+
 
 class TestMFADecorator:
     """Test the @require_mfa decorator."""
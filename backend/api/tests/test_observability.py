@@ -2,26 +2,43 @@
 Tests for observability: structured logging, PII redaction, metrics, and health checks.
 """
 
+import asyncio
+import io
+import json
+import logging
+import threading
+import uuid
+from decimal import Decimal
 from unittest.mock import MagicMock, patch
 
 from django.test import TestCase, override_settings
+from django.utils.translation import gettext_lazy
 from rest_framework import status
 from rest_framework.test import APIClient
 
+from api.views_monitoring import _SingleFlight
 from config.logging import (
+    QueueLogHandler,
     add_request_context,
     add_service_info,
+    is_pii_field,
+    json_default,
+    orjson_dumps,
     pii_redactor,
     redact_dict,
+    redact_dict_inplace,
     redact_value,
 )
 from config.observability import (
+    HISTOGRAM_BUCKETS,
     MetricsCollector,
     bind_context,
     clear_request_context,
     get_request_context,
     log_audit_decision,
+    metrics,
     set_request_context,
+    timed,
 )
 
 
@@ -45,6 +62,14 @@ class TestPIIRedaction(TestCase):
         self.assertEqual(redact_value("key-123", "api_key"), "[REDACTED]")
         self.assertEqual(redact_value("key-123", "apikey"), "[REDACTED]")
 
+    def test_is_pii_field_matches_substrings_case_insensitively(self):
+        """Test field-name matching covers every PII_FIELDS entry as a substring."""
+        self.assertTrue(is_pii_field("User_Email"))
+        self.assertTrue(is_pii_field("x_authorization_header"))
+        self.assertTrue(is_pii_field("ip"))
+        self.assertFalse(is_pii_field("status"))
+        self.assertFalse(is_pii_field("i"))
+
     def test_redact_value_preserves_non_pii(self):
         """Test that non-PII values are preserved."""
         self.assertEqual(redact_value("hello", "message"), "hello")
@@ -96,6 +121,24 @@ class TestPIIRedaction(TestCase):
         self.assertEqual(result["items"][0]["token"], "[REDACTED]")
         self.assertEqual(result["items"][1]["name"], "item1")
 
+    def test_redact_dict_leaves_input_unchanged(self):
+        """Test redact_dict returns a redacted copy."""
+        data = {"password": "secret123", "nested": {"token": "abc123"}}
+
+        result = redact_dict(data)
+
+        self.assertEqual(result["nested"]["token"], "[REDACTED]")
+        self.assertEqual(data, {"password": "secret123", "nested": {"token": "abc123"}})
+
+    def test_redact_dict_inplace(self):
+        """Test redact_dict_inplace updates the given dict and leaves clean values as-is."""
+        role = "admin"
+        data = {"password": "secret123", "nested": {"role": role}}
+
+        self.assertIsNone(redact_dict_inplace(data))
+        self.assertEqual(data["password"], "[REDACTED]")
+        self.assertIs(data["nested"]["role"], role)
+
     def test_redact_dict_max_depth(self):
         """Test that max depth is respected."""
         deep_data = {
@@ -142,6 +185,15 @@ class TestPIIRedactorProcessor(TestCase):
         self.assertNotIn("password", result)
         self.assertEqual(result["username"], "johndoe")
 
+    @override_settings(AUDIT_PII_POLICY="drop")
+    def test_pii_redactor_drop_ignores_matches_across_keys(self):
+        """Adjacent key names must not combine into a PII field name."""
+        event_dict = {"event": "test_event", "zi": 1, "p": 2}
+
+        result = pii_redactor(None, "info", event_dict)
+
+        self.assertEqual(result, {"event": "test_event", "zi": 1, "p": 2})
+
     def test_pii_redactor_preserves_core_fields(self):
         """Test that core log fields are preserved."""
         event_dict = {
@@ -158,6 +210,15 @@ class TestPIIRedactorProcessor(TestCase):
         self.assertEqual(result["timestamp"], "2024-01-01T00:00:00Z")
         self.assertEqual(result["level"], "info")
 
+    def test_pii_redactor_runs_in_structlog_chain(self):
+        """Redaction must not depend on the record reaching QueueLogHandler."""
+        import structlog
+        from django.conf import settings
+
+        processors = structlog.get_config()["processors"]
+        self.assertIn(pii_redactor, processors)
+        self.assertFalse(settings.CELERY_WORKER_HIJACK_ROOT_LOGGER)
+
 
 class TestRequestContext(TestCase):
     """Tests for request context management."""
@@ -225,6 +286,19 @@ class TestRequestContext(TestCase):
         self.assertEqual(context["request_id"], "req-123")
         self.assertEqual(context["custom_field"], "custom_value")
 
+    def test_bind_context_does_not_mutate_earlier_context(self):
+        """Test that binding layers fields over the context instead of mutating it."""
+        set_request_context(request_id="req-123", actor="user-1")
+        before = get_request_context()
+        bind_context(actor="user-2", step="charge")
+
+        context = get_request_context()
+
+        self.assertEqual(context["actor"], "user-2")
+        self.assertEqual(context["step"], "charge")
+        self.assertEqual(before["actor"], "user-1")
+        self.assertNotIn("step", before)
+
     def test_clear_request_context(self):
         """Test clearing request context."""
         set_request_context(request_id="req-123", actor="user-1")
@@ -292,6 +366,21 @@ class TestMetricsCollector(TestCase):
 
         self.assertEqual(self.metrics.counters["test_counter"], 7)
 
+    def test_concurrent_increments_are_not_lost(self):
+        """Test counter increments from several threads all land."""
+
+        def worker():
+            for _ in range(1000):
+                self.metrics.inc("concurrent")
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(self.metrics.counters["concurrent"], 8000)
+
     def test_counter_with_labels(self):
         """Test counter with labels."""
         self.metrics.inc("http_requests", labels={"method": "GET", "status": "200"})
@@ -306,16 +395,22 @@ class TestMetricsCollector(TestCase):
         self.metrics.observe("request_duration", 0.2)
         self.metrics.observe("request_duration", 0.3)
 
-        values = self.metrics.histograms["request_duration"]
-        self.assertEqual(len(values), 3)
-        self.assertAlmostEqual(sum(values), 0.6)
+        histogram = self.metrics.histograms["request_duration"]
+        self.assertEqual(histogram.count, 3)
+        self.assertAlmostEqual(histogram.sum, 0.6)
+        self.assertEqual(histogram.min, 0.1)
+        self.assertEqual(histogram.max, 0.3)
 
-    def test_histogram_limits_observations(self):
-        """Test that histogram limits observations to 1000."""
+    def test_histogram_keeps_aggregates_not_observations(self):
+        """Test that histograms fold observations into fixed-size state."""
         for i in range(1100):
             self.metrics.observe("test_hist", float(i))
 
-        self.assertEqual(len(self.metrics.histograms["test_hist"]), 1000)
+        histogram = self.metrics.histograms["test_hist"]
+        self.assertEqual(histogram.count, 1100)
+        self.assertEqual(histogram.max, 1099.0)
+        self.assertEqual(sum(histogram.buckets), 1100)
+        self.assertEqual(len(histogram.buckets), len(HISTOGRAM_BUCKETS) + 1)
 
     def test_set_gauge(self):
         """Test setting gauge values."""
@@ -351,9 +446,113 @@ class TestMetricsCollector(TestCase):
         self.assertIn("http_requests_total", output)
         self.assertIn("# TYPE http_request_duration_seconds histogram", output)
         self.assertIn("http_request_duration_seconds_count", output)
+        self.assertIn('http_request_duration_seconds_bucket{le="0.5"} 1', output)
+        self.assertIn('http_request_duration_seconds_bucket{le="0.25"} 0', output)
+        self.assertIn('http_request_duration_seconds_bucket{le="+Inf"} 1', output)
         self.assertIn("# TYPE active_connections gauge", output)
         self.assertIn("active_connections 10", output)
 
+    def test_to_prometheus_format_one_type_line_per_family(self):
+        """Test labelled series of one metric share a single TYPE line."""
+        self.metrics.inc("http_requests_total", labels={"method": "GET"})
+        self.metrics.inc("http_requests_total", labels={"method": "POST"})
+
+        output = self.metrics.to_prometheus_format()
+
+        self.assertEqual(output.count("# TYPE http_requests_total counter"), 1)
+        self.assertIn('http_requests_total{method="POST"} 1', output)
+
+
+class TestTimedDecorator(TestCase):
+    """Tests for the timed decorator."""
+
+    def test_timed_records_sync_and_async_calls(self):
+        """Test timed observes durations for plain and coroutine functions."""
+
+        @timed("test_timed_sync_seconds")
+        def sync_func():
+            return "sync"
+
+        @timed("test_timed_async_seconds", {"handler": "h"})
+        async def async_func():
+            return "async"
+
+        self.assertEqual(sync_func(), "sync")
+        self.assertEqual(asyncio.run(async_func()), "async")
+
+        self.assertEqual(metrics.histograms["test_timed_sync_seconds"].count, 1)
+        self.assertEqual(metrics.histograms['test_timed_async_seconds{handler="h"}'].count, 1)
+
+
+class TestQueueLogHandler(TestCase):
+    """Tests for the background-thread log handler."""
+
+    def _record(self, msg):
+        return logging.LogRecord("test", logging.INFO, __file__, 1, msg, None, None)
+
+    def test_drops_records_when_queue_full(self):
+        """A full queue drops records instead of blocking the caller."""
+        dropped_before = metrics.counters["log_records_dropped_total"]
+        handler = QueueLogHandler(maxsize=1)
+        handler.enqueue(self._record("first"))
+        handler.enqueue(self._record("second"))
+
+        self.assertEqual(handler.queue.qsize(), 1)
+        self.assertEqual(handler.dropped, 1)
+        self.assertEqual(metrics.counters["log_records_dropped_total"], dropped_before + 1)
+        handler.close()
+
+    def test_dropped_count_is_exact_across_threads(self):
+        """Concurrent drops are all counted."""
+        handler = QueueLogHandler(maxsize=1)
+        handler.enqueue(self._record("fill"))
+        record = self._record("overflow")
+
+        def drop_many():
+            for _ in range(1000):
+                handler.enqueue(record)
+
+        threads = [threading.Thread(target=drop_many) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(handler.dropped, 8000)
+        handler.close()
+
+    def test_listener_writes_json(self):
+        """Records are formatted as JSON by the listener thread."""
+        stream = io.StringIO()
+        handler = QueueLogHandler()
+        handler.target.setStream(stream)
+
+        handler.emit(self._record("hello"))
+        handler.close()
+
+        output = json.loads(stream.getvalue())
+        self.assertEqual(output["message"], "hello")
+        self.assertEqual(output["level"], "info")
+        self.assertEqual(output["service"], "django-api")
+
+    def test_json_default_renders_uuid_as_string(self):
+        """UUID log values serialize as plain strings, including nested ones."""
+        value = uuid.uuid4()
+        rendered = json.dumps({"events": [{"org_id": value}]}, default=json_default)
+
+        self.assertEqual(json.loads(rendered), {"events": [{"org_id": str(value)}]})
+
+    def test_orjson_dumps_renders_common_django_types(self):
+        """Decimals, lazy strings and sets render as JSON values rather than repr()."""
+        rendered = orjson_dumps(
+            {"amount": Decimal("9.99"), "label": gettext_lazy("Free"), "tiers": {"pro"}},
+            default=json_default,
+        )
+
+        self.assertEqual(
+            json.loads(rendered), {"amount": "9.99", "label": "Free", "tiers": ["pro"]}
+        )
+
 
 class TestAuditLogging(TestCase):
     """Tests for audit logging functionality."""
@@ -414,11 +613,6 @@ class TestHealthEndpoints(TestCase):
     @patch("api.views_monitoring.caches")
     def test_readiness_endpoint_healthy(self, mock_caches, mock_connection):
         """Test readiness probe when all services are healthy."""
-        # Mock database
-        mock_cursor = MagicMock()
-        mock_connection.cursor.return_value.__enter__ = MagicMock(return_value=mock_cursor)
-        mock_connection.cursor.return_value.__exit__ = MagicMock(return_value=False)
-
         # Mock cache
         mock_cache = MagicMock()
         mock_cache.get.return_value = "ok"
@@ -426,6 +620,8 @@ class TestHealthEndpoints(TestCase):
 
         response = self.client.get("/api/v1/health/ready")
 
+        mock_cursor = mock_connection.cursor.return_value.__enter__.return_value
+        mock_cursor.execute.assert_called_once_with("SELECT 1")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         data = response.json()
         self.assertEqual(data["status"], "ready")
@@ -436,8 +632,10 @@ class TestHealthEndpoints(TestCase):
     @patch("api.views_monitoring.caches")
     def test_readiness_endpoint_database_down(self, mock_caches, mock_connection):
         """Test readiness probe when database is down."""
-        # Mock database failure
-        mock_connection.cursor.side_effect = Exception("Connection refused")
+        # An already-open (persistent/pooled) connection whose server is gone
+        mock_connection.ensure_connection.return_value = None
+        mock_cursor = mock_connection.cursor.return_value.__enter__.return_value
+        mock_cursor.execute.side_effect = Exception("server closed the connection")
 
         # Mock cache
         mock_cache = MagicMock()
@@ -452,6 +650,47 @@ class TestHealthEndpoints(TestCase):
         self.assertEqual(data["checks"]["database"]["status"], "not_ready")
 
 
+class TestReadinessSingleFlight(TestCase):
+    """Tests for coalescing concurrent readiness probes."""
+
+    def test_concurrent_callers_share_one_execution(self):
+        """Callers arriving while a probe is running reuse its result."""
+        flight = _SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def probe():
+            calls.append(1)
+            started.set()
+            release.wait(timeout=5)
+            return "ok"
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(flight.do(probe)))
+        leader.start()
+        started.wait(timeout=5)
+        follower = threading.Thread(target=lambda: results.append(flight.do(probe)))
+        follower.start()
+        release.set()
+        leader.join(timeout=5)
+        follower.join(timeout=5)
+
+        self.assertEqual(results, ["ok", "ok"])
+        self.assertEqual(len(calls), 1)
+
+    def test_exception_propagates_and_slot_is_cleared(self):
+        """A failing probe raises for the caller and does not block later probes."""
+        flight = _SingleFlight()
+
+        def failing():
+            raise RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            flight.do(failing)
+        self.assertEqual(flight.do(lambda: "ok"), "ok")
+
+
 class TestPrometheusMetricsEndpoint(TestCase):
     """Tests for Prometheus metrics endpoint."""
 
@@ -475,10 +714,14 @@ class TestPrometheusMetricsEndpoint(TestCase):
         mock_validate.side_effect = self._mock_validate
         self.client.credentials(HTTP_AUTHORIZATION="Bearer mock-token")
 
+        metrics.inc("test_prometheus_endpoint_total")
         response = self.client.get("/api/v1/monitoring/metrics")
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn("text/plain", response["Content-Type"])
+        self.assertTrue(response.streaming)
+        body = b"".join(response.streaming_content).decode()
+        self.assertIn("# TYPE test_prometheus_endpoint_total counter\n", body)
 
     @patch("api.auth.KeycloakJWTAuthentication._validate_token")
     def test_app_metrics_json_endpoint(self, mock_validate):
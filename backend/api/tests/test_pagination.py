@@ -0,0 +1,185 @@
+from datetime import timedelta
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db.models import Count
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from api.models import Membership, Org, Team
+from api.pagination import (
+    KeysetLimitOffsetPagination,
+    decode_cursor,
+    encode_cursor,
+    keyset_page,
+)
+from api.serializers_admin_memberships import (
+    MEMBERSHIP_LIST_VALUES,
+    MembershipListSerializer,
+    serialize_membership_list,
+)
+from api.serializers_admin_teams import (
+    TEAM_LIST_COLUMNS,
+    TEAM_LIST_VALUES,
+    TeamListSerializer,
+    serialize_team_list,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+def _make_teams(org, count):
+    now = timezone.now()
+    return [
+        Team.objects.create(org=org, name=f"team-{i}", created_at=now - timedelta(minutes=i))
+        for i in range(count)
+    ]
+
+
+def test_cursor_round_trip():
+    org = Org.objects.create(name="Acme")
+    team = Team.objects.create(org=org, name="t")
+
+    created_at, pk = decode_cursor(encode_cursor(team))
+
+    assert created_at == team.created_at
+    assert pk == str(team.pk)
+
+
+def test_invalid_cursor_raises_validation_error():
+    with pytest.raises(ValidationError):
+        decode_cursor("not-a-cursor")
+
+
+def test_keyset_pages_match_offset_pages():
+    org = Org.objects.create(name="Acme")
+    teams = _make_teams(org, 5)
+    queryset = Team.objects.filter(org=org)
+
+    first, cursor = keyset_page(queryset, None, 0, 2)
+    second, cursor = keyset_page(queryset, cursor, 0, 2)
+    third, cursor = keyset_page(queryset, cursor, 0, 2)
+
+    assert [t.name for t in first + second + third] == [t.name for t in teams]
+    assert cursor is None
+
+
+def test_offset_still_supported_without_cursor():
+    org = Org.objects.create(name="Acme")
+    teams = _make_teams(org, 3)
+
+    page, cursor = keyset_page(Team.objects.filter(org=org), None, 1, 5)
+
+    assert [t.name for t in page] == [t.name for t in teams[1:]]
+    assert cursor is None
+
+
+def test_values_rows_paginate_with_cursor():
+    org = Org.objects.create(name="Acme")
+    teams = _make_teams(org, 3)
+    queryset = Team.objects.filter(org=org).values(*TEAM_LIST_VALUES[:2], "created_at")
+
+    first, cursor = keyset_page(queryset, None, 0, 2)
+    second, cursor = keyset_page(queryset, cursor, 0, 2)
+
+    assert [row["name"] for row in first + second] == [t.name for t in teams]
+    assert cursor is None
+
+
+def test_models_without_created_at_fall_back_to_offset():
+    user_model = get_user_model()
+    for i in range(3):
+        user_model.objects.create(username=f"user-{i}")
+    request = Request(APIRequestFactory().get("/", {"limit": 2, "offset": 1}))
+    paginator = KeysetLimitOffsetPagination()
+
+    page = paginator.paginate_queryset(user_model.objects.order_by("username"), request)
+
+    assert [u.username for u in page] == ["user-1", "user-2"]
+    assert paginator.get_paginated_response([]).data["next_cursor"] is None
+
+
+def _paginate(queryset, params):
+    request = Request(APIRequestFactory().get("/api/v1/teams", params))
+    paginator = KeysetLimitOffsetPagination()
+    page = paginator.paginate_queryset(queryset, request)
+    return page, paginator.get_paginated_response([]).data
+
+
+def test_cursor_next_link_walks_all_pages():
+    org = Org.objects.create(name="Acme")
+    teams = _make_teams(org, 5)
+    queryset = Team.objects.filter(org=org).order_by("-created_at")
+
+    page, data = _paginate(queryset, {"limit": 2})
+    seen = list(page)
+    while data["next"]:
+        params = parse_qs(urlsplit(data["next"]).query)
+        assert "offset" not in params
+        assert params["cursor"] == [data["next_cursor"]]
+        page, data = _paginate(queryset, {k: v[0] for k, v in params.items()})
+        assert data["count"] is None
+        assert data["previous"] is None
+        seen.extend(page)
+
+    assert [t.name for t in seen] == [t.name for t in teams]
+    assert data["next_cursor"] is None
+
+
+def test_cursor_page_skips_count(django_assert_num_queries):
+    org = Org.objects.create(name="Acme")
+    _make_teams(org, 3)
+    queryset = Team.objects.filter(org=org)
+    _, data = _paginate(queryset, {"limit": 1})
+
+    with django_assert_num_queries(1):
+        _paginate(queryset, {"limit": 1, "cursor": data["next_cursor"]})
+
+
+def test_other_orderings_fall_back_to_offset():
+    org = Org.objects.create(name="Acme")
+    _make_teams(org, 3)
+
+    page, data = _paginate(Team.objects.filter(org=org).order_by("name"), {"limit": 2})
+
+    assert [t.name for t in page] == ["team-0", "team-1"]
+    assert data["next_cursor"] is None
+    assert "offset=2" in data["next"]
+
+
+def test_team_rows_match_list_serializer():
+    org = Org.objects.create(name="Acme")
+    _make_teams(org, 2)
+    queryset = (
+        Team.objects.filter(org=org)
+        .annotate(_members_count=Count("memberships", distinct=True))
+        .order_by("-created_at")
+    )
+
+    expected = TeamListSerializer(queryset.select_related("org", "division"), many=True).data
+
+    assert serialize_team_list(queryset.values(*TEAM_LIST_VALUES)) == [dict(t) for t in expected]
+    assert serialize_team_list(
+        queryset.values(*TEAM_LIST_COLUMNS, "division__name"), org_name="Acme"
+    ) == [dict(t) for t in expected]
+
+
+def test_membership_rows_match_list_serializer():
+    org = Org.objects.create(name="Acme")
+    team = Team.objects.create(org=org, name="t")
+    user = get_user_model().objects.create_user(
+        username="member", email="member@example.com", first_name="Ada"
+    )
+    Membership.objects.create(user=user, org=org, team=team, team_roles=["team_admin"])
+    queryset = Membership.objects.filter(org=org)
+
+    expected = MembershipListSerializer(
+        queryset.select_related("user", "org", "team", "division"), many=True
+    ).data
+
+    assert serialize_membership_list(queryset.values(*MEMBERSHIP_LIST_VALUES)) == [
+        dict(m) for m in expected
+    ]
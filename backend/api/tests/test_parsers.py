@@ -0,0 +1,39 @@
+"""
+Tests for the orjson-backed DRF parser.
+"""
+
+import io
+
+from django.test import SimpleTestCase
+from rest_framework.exceptions import ParseError
+
+from api.parsers import ORJSONParser
+
+
+class TestORJSONParser(SimpleTestCase):
+    """Tests for ORJSONParser."""
+
+    def setUp(self):
+        self.parser = ORJSONParser()
+
+    def test_media_type_is_json(self):
+        """Parser accepts application/json."""
+        self.assertEqual(self.parser.media_type, "application/json")
+
+    def test_parses_nested_body(self):
+        """Nested objects and unicode strings are decoded."""
+        body = '{"name": "Café", "tags": ["a", "b"], "limits": {"seats": 5}}'.encode()
+
+        data = self.parser.parse(io.BytesIO(body))
+
+        self.assertEqual(data, {"name": "Café", "tags": ["a", "b"], "limits": {"seats": 5}})
+
+    def test_invalid_json_raises_parse_error(self):
+        """Malformed bodies surface as DRF ParseError (HTTP 400)."""
+        with self.assertRaises(ParseError):
+            self.parser.parse(io.BytesIO(b'{"name": '))
+
+    def test_rejects_nan(self):
+        """NaN is rejected, matching DRF's strict JSON parsing."""
+        with self.assertRaises(ParseError):
+            self.parser.parse(io.BytesIO(b'{"value": NaN}'))
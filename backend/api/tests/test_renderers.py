@@ -0,0 +1,66 @@
+"""
+Tests for the orjson-backed DRF renderer.
+"""
+
+import json
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from django.test import SimpleTestCase
+
+from api.renderers import ORJSONRenderer
+
+
+class TestORJSONRenderer(SimpleTestCase):
+    """Tests for ORJSONRenderer."""
+
+    def setUp(self):
+        self.renderer = ORJSONRenderer()
+
+    def test_media_type_is_json(self):
+        """Renderer advertises application/json."""
+        self.assertEqual(self.renderer.media_type, "application/json")
+        self.assertEqual(self.renderer.format, "json")
+
+    def test_renders_nested_dict(self):
+        """Nested dicts and lists round-trip through the renderer."""
+        data = {"workers": {"w1": {"active": 2, "queues": ["celery"]}}, "worker_count": 1}
+        output = self.renderer.render(data)
+
+        self.assertIsInstance(output, bytes)
+        self.assertEqual(json.loads(output), data)
+
+    def test_none_renders_empty_body(self):
+        """None renders to an empty body, matching DRF's JSONRenderer."""
+        self.assertEqual(self.renderer.render(None), b"")
+
+    def test_non_string_keys(self):
+        """Integer keys are coerced to strings instead of raising."""
+        output = self.renderer.render({1: "a"})
+        self.assertEqual(json.loads(output), {"1": "a"})
+
+    def test_native_and_fallback_types(self):
+        """datetime/UUID are handled natively, Decimal via DRF's encoder."""
+        value = uuid.uuid4()
+        data = {
+            "id": value,
+            "at": datetime(2024, 1, 1, tzinfo=timezone.utc),
+            "amount": Decimal("1.50"),
+        }
+        result = json.loads(self.renderer.render(data))
+
+        self.assertEqual(result["id"], str(value))
+        self.assertEqual(result["at"], "2024-01-01T00:00:00Z")
+        self.assertEqual(result["amount"], 1.5)
+
+    def test_utc_datetime_uses_z_suffix(self):
+        """UTC datetimes end in "Z" like DRF's JSONRenderer; other offsets are kept."""
+        data = {
+            "utc": datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc),
+            "offset": datetime(2024, 1, 1, 12, 30, tzinfo=timezone(timedelta(hours=2))),
+        }
+        result = json.loads(self.renderer.render(data))
+
+        self.assertEqual(result["utc"], "2024-01-01T12:30:00Z")
+        self.assertEqual(result["offset"], "2024-01-01T12:30:00+02:00")
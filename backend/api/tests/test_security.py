@@ -2,11 +2,14 @@
 Tests for security hardening: middleware, settings, CORS, HSTS, admin boundaries.
 """
 
+from unittest.mock import patch
+
 import pytest
 from django.http import HttpResponse
 from django.test import RequestFactory, override_settings
 
 from config.middleware import AdminHostnameMiddleware, RequestIDMiddleware
+from config.observability import get_log_buffer
 
 
 class TestRequestIDMiddleware:
@@ -47,6 +50,57 @@ class TestRequestIDMiddleware:
 
         assert result["X-Request-ID"] == "test-id-456"
 
+    def test_flushes_log_buffer_as_single_event(self, middleware, request_factory):
+        """Buffered handler events should be emitted once on response."""
+        request = request_factory.get("/")
+        middleware.process_request(request)
+        request.log_buffer.add("first", item=1)
+        request.log_buffer.add("second", item=2)
+
+        with patch("config.observability.logger") as mock_logger:
+            middleware.process_response(request, HttpResponse("OK"))
+
+        mock_logger.info.assert_called_once_with(
+            "request_events",
+            events=[{"event": "first", "item": 1}, {"event": "second", "item": 2}],
+        )
+        assert request.log_buffer.events == []
+
+    def test_flush_redacts_pii_in_buffered_events(self, middleware, request_factory):
+        """Buffered events should get the same PII redaction as top-level log fields."""
+        request = request_factory.get("/")
+        middleware.process_request(request)
+        request.log_buffer.add(
+            "division_created",
+            actor_email="alice@example.com",
+            query_params={"search": "bob@example.com"},
+        )
+
+        with patch("config.observability.logger") as mock_logger:
+            middleware.process_response(request, HttpResponse("OK"))
+
+        (event,) = mock_logger.info.call_args.kwargs["events"]
+        assert event["actor_email"] == "[REDACTED]"
+        assert "bob@example.com" not in event["query_params"]["search"]
+
+    def test_get_log_buffer_returns_request_buffer(self, middleware, request_factory):
+        """Handlers get the buffer the middleware attached."""
+        request = request_factory.get("/")
+        middleware.process_request(request)
+
+        assert get_log_buffer(request) is request.log_buffer
+
+    def test_get_log_buffer_logs_immediately_without_middleware(self, request_factory):
+        """Without the middleware, events are logged on add instead of raising."""
+        request = request_factory.get("/")
+
+        with patch("config.observability.logger") as mock_logger:
+            get_log_buffer(request).add("first", item=1)
+
+        mock_logger.info.assert_called_once_with(
+            "request_events", events=[{"event": "first", "item": 1}]
+        )
+
 
 class TestAdminHostnameMiddleware:
     """Tests for AdminHostnameMiddleware."""
@@ -189,6 +243,18 @@ class TestSecuritySettings:
         assert "axes.middleware.AxesMiddleware" in middleware
         assert "config.middleware.AdminHostnameMiddleware" in middleware
 
+    def test_admin_hostname_check_runs_before_sessions(self):
+        """Off-host admin requests should be rejected before the session is loaded."""
+        from django.conf import settings
+
+        middleware = settings.MIDDLEWARE
+        assert middleware.index("config.middleware.AdminHostnameMiddleware") < middleware.index(
+            "django.contrib.sessions.middleware.SessionMiddleware"
+        )
+        assert middleware.index("axes.middleware.AxesMiddleware") > middleware.index(
+            "django.contrib.auth.middleware.AuthenticationMiddleware"
+        )
+
     def test_security_headers_configured(self):
         """Security headers should be configured."""
         from django.conf import settings
@@ -245,6 +311,15 @@ class TestProductionSecuritySettings:
         assert 'SECRET_KEY == "changeme"' in content
         assert "raise ValueError" in content
 
+    def test_argon2_stays_first_outside_tests(self):
+        """Only the test settings swap Argon2 for the fast MD5 hasher."""
+        from django.conf import settings
+
+        from config.settings import base
+
+        assert base.PASSWORD_HASHERS[0] == "django.contrib.auth.hashers.Argon2PasswordHasher"
+        assert settings.PASSWORD_HASHERS == ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
 
 class TestCORSBehavior:
     """Tests for CORS behavior."""
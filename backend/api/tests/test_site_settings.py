@@ -0,0 +1,62 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _auth(monkeypatch, roles):
+    monkeypatch.setattr(
+        "api.auth.KeycloakJWTAuthentication._validate_token",
+        lambda self, t: {"sub": "u", "realm_roles": roles, "client_roles": [], "org_id": None},
+    )
+
+
+def test_public_site_settings_served_from_cache():
+    client = APIClient()
+    first = client.get(reverse("site-settings"))
+
+    with CaptureQueriesContext(connection) as queries:
+        second = client.get(reverse("site-settings"))
+
+    assert first.json() == second.json()
+    assert len(queries) == 0
+
+
+def test_admin_update_invalidates_public_site_settings(monkeypatch):
+    client = APIClient()
+    assert client.get(reverse("site-settings")).json()["site_name"] == "Platform"
+
+    _auth(monkeypatch, ["platform_admin"])
+    resp = client.put(
+        reverse("admin-site-settings"),
+        {"site_name": "Acme"},
+        format="json",
+        HTTP_AUTHORIZATION="Bearer x",
+    )
+    assert resp.status_code == 200
+
+    assert APIClient().get(reverse("site-settings")).json()["site_name"] == "Acme"
+
+
+def test_public_site_settings_conditional_get():
+    client = APIClient()
+    first = client.get(reverse("site-settings"))
+    etag = first["ETag"]
+    assert "max-age=300" in first["Cache-Control"]
+
+    second = client.get(reverse("site-settings"), HTTP_IF_NONE_MATCH=etag)
+
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second["ETag"] == etag
@@ -2,12 +2,22 @@
 Tests for Social OAuth authentication.
 """
 
+from unittest.mock import MagicMock, patch
+from urllib.parse import parse_qs, urlparse
+
 import pytest
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 from rest_framework.test import APIClient
 
 from api.models_social_auth import SocialAccount
+from api.views_social_auth import (
+    _SESSION,
+    _exchange_github_code,
+    decode_oauth_state,
+    encode_oauth_state,
+    load_oauth_state,
+)
 
 User = get_user_model()
 pytestmark = pytest.mark.django_db
@@ -124,6 +134,51 @@ class TestSocialLogin:
         assert "github.com" in auth_url
         assert "test-github-id" in auth_url
 
+    def test_login_url_carries_signed_redirect_state(self, client, settings):
+        """Test the redirect URL round-trips through the OAuth state parameter."""
+        settings.GITHUB_CLIENT_ID = "test-github-id"
+
+        url = reverse("auth-social-login", kwargs={"provider": "github"})
+        response = client.get(url, {"redirect": "/dashboard"})
+
+        query = parse_qs(urlparse(response.json()["auth_url"]).query)
+        assert load_oauth_state(query["state"][0]) == {
+            "redirect": "/dashboard",
+            "provider": "github",
+        }
+
+    def test_tampered_state_falls_back_to_root(self):
+        """Test an invalid or missing state redirects to the root."""
+        state = encode_oauth_state("/dashboard", "github")
+
+        assert decode_oauth_state(state + "x") == "/"
+        assert decode_oauth_state(None) == "/"
+
+
+class TestOAuthSession:
+    """Tests for the shared provider HTTP session."""
+
+    def test_shared_session_stores_no_cookies(self):
+        """Provider cookies from one user's exchange must not reach the next."""
+        assert _SESSION.cookies.get_policy().allowed_domains() == ()
+
+    def test_github_skips_email_list_when_profile_has_email(self, settings):
+        """/user/emails should only be fetched when the profile email is private."""
+        settings.GITHUB_CLIENT_ID = "test-github-id"
+        settings.GITHUB_CLIENT_SECRET = "test-github-secret"
+        token = MagicMock(**{"json.return_value": {"access_token": "gho_test"}})
+        profile = MagicMock(
+            **{"json.return_value": {"id": 1, "login": "octo", "email": "octo@example.com"}}
+        )
+
+        with patch.object(_SESSION, "post", return_value=token), patch.object(
+            _SESSION, "get", return_value=profile
+        ) as get:
+            info = _exchange_github_code(None, "code")
+
+        assert info["email"] == "octo@example.com"
+        assert [c.args[0] for c in get.call_args_list] == ["https://api.github.com/user"]
+
 
 class TestSocialAccounts:
     """Test social account management."""
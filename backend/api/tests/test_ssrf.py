@@ -18,11 +18,13 @@ import pytest
 from django.test import override_settings
 
 from api.ssrf import (
+    WEBHOOK_POOL_MAXSIZE,
     BlockedHostError,
     DNSResolutionError,
     InvalidSchemeError,
     PrivateIPError,
     SSRFProtectionError,
+    _get_session,
     is_blocked_hostname,
     is_private_ip,
     resolve_hostname,
@@ -466,7 +468,7 @@ class TestSafeRequest:
         WEBHOOK_BLOCK_PRIVATE_IPS=True,
         WEBHOOK_REQUEST_TIMEOUT=30,
     )
-    @patch("api.ssrf.requests.request")
+    @patch("api.ssrf.requests.Session.request")
     @patch("api.ssrf.resolve_hostname")
     def test_makes_request_to_resolved_ip(self, mock_resolve, mock_request):
         """Should make HTTP request to resolved IP with original Host header."""
@@ -507,7 +509,7 @@ class TestSafeRequest:
         WEBHOOK_ALLOWED_SCHEMES=["https"],
         WEBHOOK_REQUEST_TIMEOUT=45,
     )
-    @patch("api.ssrf.requests.request")
+    @patch("api.ssrf.requests.Session.request")
     @patch("api.ssrf.resolve_hostname")
     def test_uses_configured_timeout(self, mock_resolve, mock_request):
         """Should use timeout from settings."""
@@ -524,7 +526,7 @@ class TestSafeRequest:
         WEBHOOK_ALLOWED_SCHEMES=["https"],
         WEBHOOK_REQUEST_TIMEOUT=30,
     )
-    @patch("api.ssrf.requests.request")
+    @patch("api.ssrf.requests.Session.request")
     @patch("api.ssrf.resolve_hostname")
     def test_allows_custom_timeout_override(self, mock_resolve, mock_request):
         """Should allow timeout to be overridden in function call."""
@@ -541,7 +543,7 @@ class TestSafeRequest:
         WEBHOOK_ALLOWED_SCHEMES=["https"],
         WEBHOOK_BLOCK_PRIVATE_IPS=True,
     )
-    @patch("api.ssrf.requests.request")
+    @patch("api.ssrf.requests.Session.request")
     @patch("api.ssrf.resolve_hostname")
     def test_preserves_url_path_and_query(self, mock_resolve, mock_request):
         """Should preserve URL path and query parameters."""
@@ -560,7 +562,7 @@ class TestSafeRequest:
         WEBHOOK_ALLOWED_SCHEMES=["https"],
         WEBHOOK_BLOCK_PRIVATE_IPS=True,
     )
-    @patch("api.ssrf.requests.request")
+    @patch("api.ssrf.requests.Session.request")
     @patch("api.ssrf.resolve_hostname")
     def test_preserves_port_in_url(self, mock_resolve, mock_request):
         """Should preserve custom port in URL."""
@@ -577,7 +579,7 @@ class TestSafeRequest:
         WEBHOOK_ALLOWED_SCHEMES=["https"],
         WEBHOOK_BLOCK_PRIVATE_IPS=True,
     )
-    @patch("api.ssrf.requests.request")
+    @patch("api.ssrf.requests.Session.request")
     @patch("api.ssrf.resolve_hostname")
     def test_merges_custom_headers_with_host_header(self, mock_resolve, mock_request):
         """Should merge custom headers with required Host header."""
@@ -597,7 +599,7 @@ class TestSafeRequest:
         WEBHOOK_ALLOWED_SCHEMES=["https"],
         WEBHOOK_ALLOWED_HOSTS=["test.local"],
     )
-    @patch("api.ssrf.requests.request")
+    @patch("api.ssrf.requests.Session.request")
     def test_direct_request_when_allowlist_used(self, mock_request):
         """Should make direct request when allowlist bypasses IP resolution."""
         mock_request.return_value = MagicMock()
@@ -609,7 +611,7 @@ class TestSafeRequest:
         assert "test.local" in call_kwargs["url"]
 
     @override_settings(WEBHOOK_SSRF_PROTECTION_ENABLED=False)
-    @patch("api.ssrf.requests.request")
+    @patch("api.ssrf.requests.Session.request")
     def test_direct_request_when_protection_disabled(self, mock_request):
         """Should make direct request when SSRF protection is disabled."""
         mock_request.return_value = MagicMock()
@@ -625,7 +627,7 @@ class TestSafeRequest:
         WEBHOOK_ALLOWED_SCHEMES=["https"],
         WEBHOOK_BLOCK_PRIVATE_IPS=True,
     )
-    @patch("api.ssrf.requests.request")
+    @patch("api.ssrf.requests.Session.request")
     @patch("api.ssrf.resolve_hostname")
     def test_supports_different_http_methods(self, mock_resolve, mock_request):
         """Should support different HTTP methods."""
@@ -637,6 +639,21 @@ class TestSafeRequest:
         call_kwargs = mock_request.call_args[1]
         assert call_kwargs["method"] == "GET"
 
+    def test_reuses_pooled_session(self):
+        """Requests in one process should share a single pooled session."""
+        session = _get_session()
+
+        assert _get_session() is session
+        assert session.get_adapter("https://93.184.216.34")._pool_maxsize == WEBHOOK_POOL_MAXSIZE
+
+    def test_pooled_session_keeps_no_cookies(self):
+        """The shared session must not carry cookies between tenants."""
+        session = _get_session()
+
+        assert session.cookies.get_policy().allowed_domains() == ()
+        # Egress proxy / private CA settings from the environment still apply
+        assert session.trust_env is True
+
 
 class TestExceptionHierarchy:
     """Tests for exception class hierarchy."""
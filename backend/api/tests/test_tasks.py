@@ -10,6 +10,7 @@ from api.tasks import (
     audit_fan_out,
     force_fail_task,
     process_webhook_event,
+    send_password_reset_email_task,
     task_dedup_key,
 )
 
@@ -137,6 +138,51 @@ class TestForceFailTask:
         assert force_fail_task.on_failure is not None
 
 
+@pytest.mark.django_db
+class TestSendPasswordResetEmailTask:
+    """Tests for the password reset email task."""
+
+    @patch("api.email.send_email")
+    def test_unknown_email_sends_nothing(self, mock_send):
+        """No email is sent when no account matches."""
+        send_password_reset_email_task("nobody@example.com")
+
+        mock_send.assert_not_called()
+
+    @patch("api.email.send_email")
+    def test_known_email_stores_token_and_sends(self, mock_send):
+        """A matching account gets a stored token and a reset email."""
+        from django.contrib.auth import get_user_model
+
+        from api.models_local_auth import LocalUserProfile
+
+        user = get_user_model().objects.create_user(username="resetuser", email="reset@example.com")
+        profile = LocalUserProfile.objects.create(user=user, password_hash="hashed_password")
+
+        send_password_reset_email_task("RESET@example.com")
+
+        profile.refresh_from_db()
+        assert profile.password_reset_token
+        mock_send.assert_called_once()
+        assert mock_send.call_args.args[0] == ["reset@example.com"]
+
+
+class TestPasswordResetRequestView:
+    """The request view publishes exactly one task for every valid request."""
+
+    @pytest.mark.parametrize("email", ["reset@example.com", "nobody@example.com"])
+    @patch("api.views_password_reset.send_password_reset_email_task")
+    def test_always_publishes_once(self, mock_task, email):
+        """Known and unknown emails both cost exactly one publish."""
+        from django.urls import reverse
+        from rest_framework.test import APIClient
+
+        response = APIClient().post(reverse("auth-password-reset"), {"email": email}, format="json")
+
+        assert response.status_code == 200
+        mock_task.delay.assert_called_once_with(email)
+
+
 class TestCeleryConfiguration:
     """Tests for Celery configuration settings."""
 
@@ -6,12 +6,13 @@ import json
 from unittest.mock import patch
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TestCase, override_settings
 from rest_framework import status
 from rest_framework.test import APITestCase
 
 from api.models_local_auth import LocalUserProfile
-from api.views_user_billing import get_effective_tier, get_effective_features
+from api.views_user_billing import get_effective_features, get_effective_tier, update_user_license
 
 User = get_user_model()
 
@@ -49,6 +50,32 @@ class UserBillingModelTests(TestCase):
         self.assertEqual(found.id, profile.id)
 
 
+class UpdateUserLicenseTests(TestCase):
+    """Test update_user_license writes."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", email="test@example.com")
+
+    def test_creates_missing_profile(self):
+        """A user without a profile gets one with the new tier."""
+        update_user_license(self.user, "pro", {"max_users": 100})
+
+        profile = LocalUserProfile.objects.get(user=self.user)
+        self.assertEqual(profile.license_tier, "pro")
+        self.assertEqual(profile.feature_flags, {"max_users": 100})
+        self.assertEqual(profile.auth_provider, "oidc")
+
+    def test_updates_existing_profile(self):
+        """An existing profile is updated in place."""
+        profile = LocalUserProfile.objects.create(user=self.user, password_hash="hash")
+
+        update_user_license(self.user, "starter", {})
+
+        profile.refresh_from_db()
+        self.assertEqual(profile.license_tier, "starter")
+        self.assertEqual(profile.password_hash, "hash")
+
+
 class EffectiveTierTests(TestCase):
     """Test effective tier calculation."""
 
@@ -180,6 +207,28 @@ class UserBillingStatusViewTests(APITestCase):
         self.assertIsNone(response.data["stripe_customer_id"])
         self.assertIsNone(response.data["subscription"])
 
+    @patch("api.auth.KeycloakJWTAuthentication._validate_token")
+    @override_settings(STRIPE_ENABLED=False)
+    def test_billing_status_cached_until_license_update(self, mock_validate):
+        """Test billing status is cached and refreshed by update_user_license."""
+        # Keycloak users map to the Django user whose username is the "sub"
+        # claim; authenticate as self.user so the license update hits it
+        mock_validate.side_effect = lambda token, **kwargs: {
+            **self._mock_validate(token, **kwargs),
+            "sub": self.user.username,
+        }
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer mock-token")
+        cache.clear()
+
+        self.client.get("/api/v1/me/billing")
+        LocalUserProfile.objects.filter(user=self.user).update(license_tier="pro")
+        response = self.client.get("/api/v1/me/billing")
+        self.assertEqual(response.data["license_tier"], "free")
+
+        update_user_license(self.user, "pro", {"max_users": 100})
+        response = self.client.get("/api/v1/me/billing")
+        self.assertEqual(response.data["license_tier"], "pro")
+
 
 class UserCheckoutSessionViewTests(APITestCase):
     """Test user checkout session endpoint."""
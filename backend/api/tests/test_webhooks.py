@@ -2,7 +2,7 @@
 Tests for webhook delivery system.
 """
 
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import ANY, MagicMock, Mock, patch
 
 import pytest
 from django.test import TestCase
@@ -528,7 +528,7 @@ class TestWebhookSSRFProtection:
         assert "169.254.169.254" in delivery.response_body
 
     @patch("api.ssrf.resolve_hostname")
-    @patch("requests.request")
+    @patch("api.ssrf.requests.Session.request")
     def test_deliver_webhook_succeeds_for_valid_public_url(self, mock_request, mock_resolve):
         """Test that webhook delivery succeeds for valid public URLs."""
         # Mock DNS resolution to return a public IP
@@ -840,10 +840,10 @@ class TestWebhookAPI:
         assert response.status_code == status.HTTP_204_NO_CONTENT
         assert WebhookEndpoint.objects.count() == 0
 
-    @patch("api.views_webhooks.dispatch_webhook")
+    @patch("api.views_webhooks.dispatch_webhook_event")
     def test_webhook_test_endpoint(self, mock_dispatch):
         """Test the webhook test endpoint."""
-        mock_dispatch.return_value = ["delivery-id-123"]
+        mock_dispatch.delay.return_value = Mock(id="task-id-123")
 
         endpoint = WebhookEndpoint.objects.create(
             org_id="org-123",
@@ -854,11 +854,14 @@ class TestWebhookAPI:
 
         response = self.client.post(f"/api/v1/webhooks/{endpoint.id}/test")
 
-        assert response.status_code == status.HTTP_200_OK
+        assert response.status_code == status.HTTP_202_ACCEPTED
         data = response.json()
-        assert "delivery_ids" in data
-        assert data["delivery_ids"] == ["delivery-id-123"]
-        assert mock_dispatch.called
+        assert data["task_id"] == "task-id-123"
+        mock_dispatch.delay.assert_called_once_with(
+            event_type="webhook.test",
+            payload=ANY,
+            org_id="org-123",
+        )
 
     def test_list_webhook_deliveries(self):
         """Test listing deliveries for a webhook endpoint."""
@@ -887,6 +890,28 @@ class TestWebhookAPI:
         assert data["count"] == 2
         assert len(data["results"]) == 2
 
+    def test_list_webhook_deliveries_joins_endpoint(self, django_assert_max_num_queries):
+        """Test delivery listing doesn't fetch the endpoint once per row."""
+        endpoint = WebhookEndpoint.objects.create(
+            org_id="org-123",
+            name="Test Endpoint",
+            url="https://example.com/webhook",
+            secret="test-secret",
+        )
+        for i in range(5):
+            WebhookDelivery.objects.create(
+                endpoint=endpoint,
+                event_type="user.created",
+                payload={"n": i},
+            )
+        url = f"/api/v1/webhooks/{endpoint.id}/deliveries"
+        self.client.get(url)  # warm up auth user creation
+
+        with django_assert_max_num_queries(4):
+            response = self.client.get(url)
+
+        assert response.json()["results"][0]["endpoint_name"] == "Test Endpoint"
+
     def test_create_webhook_with_private_ip_url_fails(self):
         """Test that creating a webhook with private IP URL fails with 400."""
         data = {
@@ -14,6 +14,8 @@ from rest_framework.views import APIView
 from api.models import Membership
 from api.permissions import IsPlatformAdmin
 from api.serializers_admin_memberships import (
+    MEMBERSHIP_LIST_ONLY,
+    MEMBERSHIP_LIST_SELECT,
     MembershipCreateSerializer,
     MembershipListSerializer,
     MembershipSerializer,
@@ -22,6 +24,9 @@ from api.serializers_admin_memberships import (
 
 logger = structlog.get_logger(__name__)
 
+# Relations loaded for single-membership lookups
+_MEMBERSHIP_DETAIL_SELECT = ("user", "org", "team")
+
 
 class AdminMembershipListCreateView(APIView):
     """
@@ -51,8 +56,10 @@ class AdminMembershipListCreateView(APIView):
             query_params=dict(request.query_params),
         )
 
-        # Build queryset
-        queryset = Membership.objects.select_related("user", "org", "team")
+        # Build queryset, loading only the columns MembershipListSerializer reads
+        queryset = Membership.objects.select_related(*MEMBERSHIP_LIST_SELECT).only(
+            *MEMBERSHIP_LIST_ONLY
+        )
 
         # Apply filters
         user_id = request.query_params.get("user_id")
@@ -110,7 +117,7 @@ class AdminMembershipListCreateView(APIView):
         )
 
         # Re-fetch with related objects for response
-        membership = Membership.objects.select_related("user", "org", "team").get(
+        membership = Membership.objects.select_related(*_MEMBERSHIP_DETAIL_SELECT).get(
             id=membership.id
         )
         return Response(MembershipSerializer(membership).data, status=status.HTTP_201_CREATED)
@@ -135,7 +142,7 @@ class AdminMembershipDetailView(APIView):
     def get_object(self, membership_id):
         """Get membership by ID or return None."""
         try:
-            return Membership.objects.select_related("user", "org", "team").get(
+            return Membership.objects.select_related(*_MEMBERSHIP_DETAIL_SELECT).get(
                 id=membership_id
             )
         except Membership.DoesNotExist:
@@ -205,7 +212,7 @@ class AdminMembershipDetailView(APIView):
         )
 
         # Re-fetch with related objects
-        membership = Membership.objects.select_related("user", "org", "team").get(
+        membership = Membership.objects.select_related(*_MEMBERSHIP_DETAIL_SELECT).get(
             id=membership.id
         )
         return Response(MembershipSerializer(membership).data)
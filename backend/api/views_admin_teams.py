@@ -15,6 +15,8 @@ from rest_framework.views import APIView
 from api.models import Membership, Team
 from api.permissions import IsPlatformAdmin
 from api.serializers_admin_teams import (
+    TEAM_LIST_ONLY,
+    TEAM_LIST_SELECT,
     TeamCreateSerializer,
     TeamListSerializer,
     TeamSerializer,
@@ -52,8 +54,10 @@ class AdminTeamListCreateView(APIView):
         )
 
         # Build queryset with annotations for counts
-        queryset = Team.objects.select_related("org").annotate(
-            _members_count=Count("memberships", distinct=True),
+        queryset = (
+            Team.objects.select_related(*TEAM_LIST_SELECT)
+            .only(*TEAM_LIST_ONLY)
+            .annotate(_members_count=Count("memberships", distinct=True))
         )
 
         # Apply filters
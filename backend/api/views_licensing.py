@@ -9,18 +9,30 @@ from django.conf import settings
 from django.http import Http404
 from django.utils.translation import gettext_lazy as _
 from rest_framework import status
-from rest_framework.parsers import JSONParser, FormParser
+from rest_framework.parsers import FormParser
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from api.licensing import get_license, set_stripe_sync_status, update_license
 from api.models import Org
 from api.models_local_auth import LocalUserProfile
-from api.stripe_client import get_tier_features, map_price_to_tier
+from api.parsers import ORJSONParser
+from api.stripe_client import (
+    get_tier_features,
+    invalidate_customer_subscriptions,
+    map_price_to_tier,
+)
 from api.views_user_billing import update_user_license
 
 logger = structlog.get_logger(__name__)
 
+_SUBSCRIPTION_CACHE_EVENTS = frozenset({
+    "checkout.session.completed",
+    "customer.subscription.created",
+    "customer.subscription.updated",
+    "customer.subscription.deleted",
+})
+
 
 def _get_org(org_id: str) -> Org:
     try:
@@ -42,7 +54,7 @@ class OrgLicenseView(APIView):
     Org-scoped licensing endpoints (admin-only).
     """
 
-    parser_classes = [JSONParser]
+    parser_classes = [ORJSONParser]
 
     def get(self, request, org_id):
         claims = getattr(request, "token_claims", {})
@@ -175,6 +187,11 @@ class StripeWebhookView(APIView):
 
         logger.info("stripe_webhook_received", event_type=event_type)
 
+        # Subscription state changed in Stripe; drop the cached list so the
+        # next billing status read refetches it.
+        if event_type in _SUBSCRIPTION_CACHE_EVENTS:
+            invalidate_customer_subscriptions(event_data.get("customer"))
+
         # Route to appropriate handler
         handler = self._get_handler(event_type)
         if handler:
@@ -265,7 +282,7 @@ class StripeWebhookView(APIView):
 
         logger.info(
             "user_subscription_deleted",
-            user_id=profile.user.id,
+            user_id=profile.user_id,
         )
 
     def _handle_org_subscription_deleted(self, org_id: str, customer_id: str):
@@ -354,14 +371,14 @@ class StripeWebhookView(APIView):
 
             logger.info(
                 f"user_subscription_{action}",
-                user_id=profile.user.id,
+                user_id=profile.user_id,
                 tier=tier,
                 subscription_id=subscription_id,
             )
         elif subscription_status in ("past_due", "unpaid"):
             logger.warning(
                 "user_subscription_payment_issue",
-                user_id=profile.user.id,
+                user_id=profile.user_id,
                 status=subscription_status,
             )
 
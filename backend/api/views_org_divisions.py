@@ -4,25 +4,27 @@ REST API views for org-scoped division management.
 Allows org admins to manage divisions within their organization.
 """
 
-import structlog
-from django.db.models import Count
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.http import QueryDict
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 
-from api.models import Division, Team
-from api.permissions_org import IsOrgAdminForOrg, IsDivisionAdminForDivision
+from api.models import Division, Membership, Team
+from api.pagination import KeysetLimitOffsetPagination, keyset_page
+from api.permissions_org import EMPTY_CLAIMS, IsDivisionAdminForDivision, IsOrgAdminForOrg
+from api.renderers import ORJSONRenderer
 from api.serializers_admin_divisions import (
     DivisionCreateSerializer,
     DivisionListSerializer,
     DivisionSerializer,
     DivisionUpdateSerializer,
 )
-from api.serializers_admin_teams import TeamListSerializer
-
-logger = structlog.get_logger(__name__)
+from api.serializers_admin_teams import TEAM_LIST_COLUMNS, serialize_team_list
+from config.observability import get_log_buffer
 
 
 class OrgDivisionViewSet(viewsets.ModelViewSet):
@@ -42,7 +44,9 @@ class OrgDivisionViewSet(viewsets.ModelViewSet):
     """
 
     permission_classes = [IsAuthenticated, IsOrgAdminForOrg]
+    renderer_classes = [ORJSONRenderer]
     serializer_class = DivisionSerializer
+    pagination_class = KeysetLimitOffsetPagination
 
     def get_serializer_class(self):
         """Return appropriate serializer based on action."""
@@ -57,9 +61,25 @@ class OrgDivisionViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         """Get queryset filtered by org_id from URL."""
         org_id = self.kwargs.get("org_id")
+        # Count teams and memberships with correlated subqueries rather than two
+        # COUNT(DISTINCT) aggregates over the same join, which multiplies rows.
+        teams_count = (
+            Team.objects.filter(division=OuterRef("pk"))
+            .order_by()
+            .values("division")
+            .annotate(c=Count("pk"))
+            .values("c")
+        )
+        members_count = (
+            Membership.objects.filter(division=OuterRef("pk"))
+            .order_by()
+            .values("division")
+            .annotate(c=Count("pk"))
+            .values("c")
+        )
         queryset = Division.objects.filter(org_id=org_id).select_related("org").annotate(
-            _teams_count=Count("teams", distinct=True),
-            _members_count=Count("memberships", distinct=True),
+            _teams_count=Coalesce(Subquery(teams_count, output_field=IntegerField()), 0),
+            _members_count=Coalesce(Subquery(members_count, output_field=IntegerField()), 0),
         )
 
         # Apply optional filters from query params
@@ -75,35 +95,43 @@ class OrgDivisionViewSet(viewsets.ModelViewSet):
 
     def list(self, request: Request, org_id=None) -> Response:
         """List all divisions in the organization."""
-        claims = getattr(request, "token_claims", {})
-        logger.info(
+        claims = getattr(request, "token_claims", EMPTY_CLAIMS)
+        actor_id = claims.get("sub", "unknown")
+        actor_email = claims.get("email")
+        get_log_buffer(request).add(
             "org_division_list_accessed",
-            actor_id=claims.get("sub", "unknown"),
-            actor_email=claims.get("email"),
-            org_id=str(org_id),
+            actor_id=actor_id,
+            actor_email=actor_email,
+            org_id=org_id,
             query_params=dict(request.query_params),
         )
         return super().list(request)
 
     def create(self, request: Request, org_id=None) -> Response:
         """Create a new division in the organization."""
-        claims = getattr(request, "token_claims", {})
-
-        # Ensure org_id in request data matches URL
-        data = request.data.copy()
-        data["org"] = str(org_id)
+        claims = getattr(request, "token_claims", EMPTY_CLAIMS)
+        actor_id = claims.get("sub", "unknown")
+        actor_email = claims.get("email")
+
+        # Ensure org_id in request data matches URL. JSON bodies parse to a
+        # plain dict, so skip the QueryDict deep copy for them.
+        if isinstance(request.data, QueryDict):
+            data = request.data.copy()
+            data["org"] = str(org_id)
+        else:
+            data = {**request.data, "org": str(org_id)}
 
         serializer = self.get_serializer(data=data)
         serializer.is_valid(raise_exception=True)
         division = serializer.save()
 
-        logger.info(
+        get_log_buffer(request).add(
             "org_division_created",
-            actor_id=claims.get("sub", "unknown"),
-            actor_email=claims.get("email"),
-            division_id=str(division.id),
+            actor_id=actor_id,
+            actor_email=actor_email,
+            division_id=division.id,
             division_name=division.name,
-            org_id=str(division.org_id),
+            org_id=division.org_id,
             billing_mode=division.billing_mode,
         )
 
@@ -114,18 +142,21 @@ class OrgDivisionViewSet(viewsets.ModelViewSet):
 
     def retrieve(self, request: Request, org_id=None, pk=None) -> Response:
         """Get division details."""
-        claims = getattr(request, "token_claims", {})
-        logger.info(
+        claims = getattr(request, "token_claims", EMPTY_CLAIMS)
+        actor_id = claims.get("sub", "unknown")
+        get_log_buffer(request).add(
             "org_division_detail_accessed",
-            actor_id=claims.get("sub", "unknown"),
-            org_id=str(org_id),
-            division_id=str(pk),
+            actor_id=actor_id,
+            org_id=org_id,
+            division_id=pk,
         )
         return super().retrieve(request, pk=pk)
 
     def update(self, request: Request, org_id=None, pk=None) -> Response:
         """Update division."""
-        claims = getattr(request, "token_claims", {})
+        claims = getattr(request, "token_claims", EMPTY_CLAIMS)
+        actor_id = claims.get("sub", "unknown")
+        actor_email = claims.get("email")
         division = self.get_object()
 
         old_values = {
@@ -146,13 +177,13 @@ class OrgDivisionViewSet(viewsets.ModelViewSet):
             if old_values["license_tier"] != division.license_tier:
                 changes["license_tier"] = {"old": old_values["license_tier"], "new": division.license_tier}
 
-            logger.info(
+            get_log_buffer(request).add(
                 "org_division_updated",
-                actor_id=claims.get("sub", "unknown"),
-                actor_email=claims.get("email"),
-                division_id=str(division.id),
+                actor_id=actor_id,
+                actor_email=actor_email,
+                division_id=division.id,
                 division_name=division.name,
-                org_id=str(division.org_id),
+                org_id=division.org_id,
                 changes=changes,
             )
 
@@ -160,21 +191,23 @@ class OrgDivisionViewSet(viewsets.ModelViewSet):
 
     def destroy(self, request: Request, org_id=None, pk=None) -> Response:
         """Delete division."""
-        claims = getattr(request, "token_claims", {})
+        claims = getattr(request, "token_claims", EMPTY_CLAIMS)
+        actor_id = claims.get("sub", "unknown")
+        actor_email = claims.get("email")
         division = self.get_object()
-        division_id = str(division.id)
+        division_id = division.id
         division_name = division.name
 
         response = super().destroy(request, pk=pk)
 
         if response.status_code == status.HTTP_204_NO_CONTENT:
-            logger.info(
+            get_log_buffer(request).add(
                 "org_division_deleted",
-                actor_id=claims.get("sub", "unknown"),
-                actor_email=claims.get("email"),
+                actor_id=actor_id,
+                actor_email=actor_email,
                 division_id=division_id,
                 division_name=division_name,
-                org_id=str(org_id),
+                org_id=org_id,
             )
 
         return response
@@ -183,37 +216,45 @@ class OrgDivisionViewSet(viewsets.ModelViewSet):
     def teams(self, request: Request, org_id=None, pk=None) -> Response:
         """Get all teams in this division."""
         division = self.get_object()
-        claims = getattr(request, "token_claims", {})
+        claims = getattr(request, "token_claims", EMPTY_CLAIMS)
+        actor_id = claims.get("sub", "unknown")
+        actor_email = claims.get("email")
 
-        logger.info(
+        get_log_buffer(request).add(
             "org_division_teams_accessed",
-            actor_id=claims.get("sub", "unknown"),
-            actor_email=claims.get("email"),
-            org_id=str(org_id),
-            division_id=str(pk),
+            actor_id=actor_id,
+            actor_email=actor_email,
+            org_id=org_id,
+            division_id=pk,
         )
 
-        # Build queryset with annotations
-        queryset = Team.objects.filter(division_id=pk).select_related(
-            "org", "division"
-        ).annotate(
-            _members_count=Count("memberships", distinct=True),
-        ).order_by("-created_at")
+        queryset = Team.objects.filter(division_id=pk)
 
         # Pagination
         limit = min(int(request.query_params.get("limit", 50)), 1000)
         offset = int(request.query_params.get("offset", 0))
 
+        # Count on the bare filter; annotations are only needed for the page
         total_count = queryset.count()
-        results = queryset[offset : offset + limit]
-
-        serializer = TeamListSerializer(results, many=True)
+        rows, next_cursor = keyset_page(
+            queryset.annotate(
+                _members_count=Count("memberships", distinct=True),
+            ).values(*TEAM_LIST_COLUMNS),
+            request.query_params.get("cursor"),
+            offset,
+            limit,
+        )
 
         return Response(
             {
                 "count": total_count,
                 "limit": limit,
                 "offset": offset,
-                "results": serializer.data,
+                "next_cursor": next_cursor,
+                # Every team here shares the division (and its org) loaded above,
+                # so the names come from it instead of joining per row
+                "results": serialize_team_list(
+                    rows, org_name=division.org.name, division_name=division.name
+                ),
             }
         )
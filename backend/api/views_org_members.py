@@ -4,9 +4,12 @@ REST API views for org-scoped member management.
 Allows org admins to manage members (users with memberships) within their organization.
 """
 
+import logging
+
 import structlog
 from django.contrib.auth import get_user_model
 from django.db.models import Q
+from django.http import QueryDict
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
@@ -14,11 +17,14 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from api.models import Membership, Org
-from api.permissions_org import IsOrgAdminForOrg
+from api.pagination import keyset_page
+from api.permissions_org import EMPTY_CLAIMS, IsOrgAdminForOrg
+from api.renderers import ORJSONRenderer
 from api.serializers_admin_memberships import (
+    MEMBERSHIP_LIST_VALUES,
     MembershipCreateSerializer,
-    MembershipListSerializer,
     MembershipSerializer,
+    serialize_membership_list,
 )
 
 User = get_user_model()
@@ -37,6 +43,7 @@ class OrgMemberListCreateView(APIView):
         - division_id: Filter by division membership
         - limit: Number of results to return (default: 50, max: 1000)
         - offset: Number of results to skip (default: 0)
+        - cursor: Opaque next_cursor from the previous page (replaces offset)
 
     POST /api/v1/orgs/{org_id}/members
         Add a member to the organization (create membership).
@@ -51,29 +58,32 @@ class OrgMemberListCreateView(APIView):
     """
 
     permission_classes = [IsAuthenticated, IsOrgAdminForOrg]
+    renderer_classes = [ORJSONRenderer]
 
     def get(self, request: Request, org_id) -> Response:
         """List all members in the organization."""
-        claims = getattr(request, "token_claims", {})
-        logger.info(
-            "org_member_list_accessed",
-            actor_id=claims.get("sub", "unknown"),
-            actor_email=claims.get("email"),
-            org_id=str(org_id),
-            query_params=dict(request.query_params),
-        )
+        claims = getattr(request, "token_claims", EMPTY_CLAIMS)
+        actor_id = claims.get("sub", "unknown")
+        actor_email = claims.get("email")
+        # Skip copying the query params when INFO is filtered out
+        if logger.is_enabled_for(logging.INFO):
+            logger.info(
+                "org_member_list_accessed",
+                actor_id=actor_id,
+                actor_email=actor_email,
+                org_id=org_id,
+                query_params=dict(request.query_params),
+            )
 
-        # Verify org exists
-        try:
-            Org.objects.get(id=org_id)
-        except Org.DoesNotExist:
+        # Verify org exists (platform admins pass IsOrgAdminForOrg for any org_id)
+        if not Org.objects.filter(id=org_id).exists():
             return Response(
                 {"error": "Organization not found"},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
         # Build queryset for memberships in this org
-        queryset = Membership.objects.filter(org_id=org_id).select_related("user", "org", "team", "division")
+        queryset = Membership.objects.filter(org_id=org_id)
 
         # Apply filters
         search = request.query_params.get("search")
@@ -92,34 +102,42 @@ class OrgMemberListCreateView(APIView):
         if division_id:
             queryset = queryset.filter(division_id=division_id)
 
-        # Order by created_at descending
-        queryset = queryset.order_by("-created_at")
-
         # Pagination
         limit = min(int(request.query_params.get("limit", 50)), 1000)
         offset = int(request.query_params.get("offset", 0))
 
+        # Count on the bare filter; joins are only needed for the page
         total_count = queryset.count()
-        results = queryset[offset : offset + limit]
-
-        serializer = MembershipListSerializer(results, many=True)
+        rows, next_cursor = keyset_page(
+            queryset.values(*MEMBERSHIP_LIST_VALUES),
+            request.query_params.get("cursor"),
+            offset,
+            limit,
+        )
 
         return Response(
             {
                 "count": total_count,
                 "limit": limit,
                 "offset": offset,
-                "results": serializer.data,
+                "next_cursor": next_cursor,
+                "results": serialize_membership_list(rows),
             }
         )
 
     def post(self, request: Request, org_id) -> Response:
         """Add a member to the organization."""
-        claims = getattr(request, "token_claims", {})
-
-        # Ensure org_id in request data matches URL
-        data = request.data.copy()
-        data["org"] = str(org_id)
+        claims = getattr(request, "token_claims", EMPTY_CLAIMS)
+        actor_id = claims.get("sub", "unknown")
+        actor_email = claims.get("email")
+
+        # Ensure org_id in request data matches URL. JSON bodies parse to a
+        # plain dict, so skip the QueryDict deep copy for them.
+        if isinstance(request.data, QueryDict):
+            data = request.data.copy()
+            data["org"] = str(org_id)
+        else:
+            data = {**request.data, "org": str(org_id)}
 
         # Map user_id to user if provided
         if "user_id" in data:
@@ -133,19 +151,17 @@ class OrgMemberListCreateView(APIView):
 
         logger.info(
             "org_member_added",
-            actor_id=claims.get("sub", "unknown"),
-            actor_email=claims.get("email"),
-            membership_id=str(membership.id),
-            user_id=str(membership.user_id),
-            org_id=str(membership.org_id),
-            team_id=str(membership.team_id) if membership.team_id else None,
+            actor_id=actor_id,
+            actor_email=actor_email,
+            membership_id=membership.id,
+            user_id=membership.user_id,
+            org_id=membership.org_id,
+            team_id=membership.team_id,
             org_roles=membership.org_roles,
         )
 
-        # Re-fetch with related objects for response
-        membership = Membership.objects.select_related("user", "org", "team", "division").get(
-            id=membership.id
-        )
+        # The serializer resolved user/org/division/team during validation, so the
+        # saved instance already has its related objects cached for the response.
         return Response(MembershipSerializer(membership).data, status=status.HTTP_201_CREATED)
 
 
@@ -161,37 +177,32 @@ class OrgMemberDetailView(APIView):
 
     def delete(self, request: Request, org_id, user_id) -> Response:
         """Remove member from organization."""
-        claims = getattr(request, "token_claims", {})
+        claims = getattr(request, "token_claims", EMPTY_CLAIMS)
+        actor_id = claims.get("sub", "unknown")
+        actor_email = claims.get("email")
 
-        # Find all memberships for this user in this org
-        memberships = Membership.objects.filter(user_id=user_id, org_id=org_id)
+        # Delete all memberships for this user in this org; the count doubles as the existence check
+        _, deleted = Membership.objects.filter(user_id=user_id, org_id=org_id).delete()
+        membership_count = deleted.get(Membership._meta.label, 0)
 
-        if not memberships.exists():
+        if not membership_count:
             return Response(
                 {"error": "User is not a member of this organization"},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
         # Get user email for logging
-        try:
-            user = User.objects.get(id=user_id)
-            user_email = user.email
-        except User.DoesNotExist:
-            user_email = "unknown"
-
-        # Count memberships before deletion
-        membership_count = memberships.count()
-
-        # Delete all memberships
-        memberships.delete()
+        user_email = (
+            User.objects.filter(id=user_id).values_list("email", flat=True).first() or "unknown"
+        )
 
         logger.info(
             "org_member_removed",
-            actor_id=claims.get("sub", "unknown"),
-            actor_email=claims.get("email"),
-            user_id=str(user_id),
+            actor_id=actor_id,
+            actor_email=actor_email,
+            user_id=user_id,
             user_email=user_email,
-            org_id=str(org_id),
+            org_id=org_id,
             memberships_removed=membership_count,
         )
 
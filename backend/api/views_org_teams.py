@@ -4,21 +4,27 @@ REST API views for org-scoped team management.
 Allows org admins to manage teams within their organization.
 """
 
+import logging
+
 import structlog
 from django.db.models import Count
+from django.http import QueryDict
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from api.models import Membership, Team
-from api.permissions_org import IsOrgAdminForOrg
+from api.models import Membership, Org, Team
+from api.pagination import keyset_page
+from api.permissions_org import EMPTY_CLAIMS, IsOrgAdminForOrg
+from api.renderers import ORJSONRenderer
 from api.serializers_admin_teams import (
+    TEAM_LIST_COLUMNS,
     TeamCreateSerializer,
-    TeamListSerializer,
     TeamSerializer,
     TeamUpdateSerializer,
+    serialize_team_list,
 )
 
 logger = structlog.get_logger(__name__)
@@ -34,28 +40,31 @@ class OrgTeamListCreateView(APIView):
         - division_id: Filter teams by division
         - limit: Number of results to return (default: 50, max: 1000)
         - offset: Number of results to skip (default: 0)
+        - cursor: Opaque next_cursor from the previous page (replaces offset)
 
     POST /api/v1/orgs/{org_id}/teams
         Create a new team in this organization.
     """
 
     permission_classes = [IsAuthenticated, IsOrgAdminForOrg]
+    renderer_classes = [ORJSONRenderer]
 
     def get(self, request: Request, org_id) -> Response:
         """List all teams in the organization."""
-        claims = getattr(request, "token_claims", {})
-        logger.info(
-            "org_team_list_accessed",
-            actor_id=claims.get("sub", "unknown"),
-            actor_email=claims.get("email"),
-            org_id=str(org_id),
-            query_params=dict(request.query_params),
-        )
+        claims = getattr(request, "token_claims", EMPTY_CLAIMS)
+        actor_id = claims.get("sub", "unknown")
+        actor_email = claims.get("email")
+        # Skip copying the query params when INFO is filtered out
+        if logger.is_enabled_for(logging.INFO):
+            logger.info(
+                "org_team_list_accessed",
+                actor_id=actor_id,
+                actor_email=actor_email,
+                org_id=org_id,
+                query_params=dict(request.query_params),
+            )
 
-        # Build queryset with annotations for counts
-        queryset = Team.objects.filter(org_id=org_id).select_related("org", "division").annotate(
-            _members_count=Count("memberships", distinct=True),
-        )
+        queryset = Team.objects.filter(org_id=org_id)
 
         # Apply filters
         search = request.query_params.get("search")
@@ -66,34 +75,46 @@ class OrgTeamListCreateView(APIView):
         if division_id:
             queryset = queryset.filter(division_id=division_id)
 
-        # Order by created_at descending
-        queryset = queryset.order_by("-created_at")
-
         # Pagination
         limit = min(int(request.query_params.get("limit", 50)), 1000)
         offset = int(request.query_params.get("offset", 0))
 
+        # Count on the bare filter; annotations are only needed for the page
         total_count = queryset.count()
-        results = queryset[offset : offset + limit]
-
-        serializer = TeamListSerializer(results, many=True)
+        # All rows share this org, so read its name once instead of joining per row
+        org_name = Org.objects.filter(id=org_id).values_list("name", flat=True).first()
+        rows, next_cursor = keyset_page(
+            queryset.annotate(
+                _members_count=Count("memberships", distinct=True),
+            ).values(*TEAM_LIST_COLUMNS, "division__name"),
+            request.query_params.get("cursor"),
+            offset,
+            limit,
+        )
 
         return Response(
             {
                 "count": total_count,
                 "limit": limit,
                 "offset": offset,
-                "results": serializer.data,
+                "next_cursor": next_cursor,
+                "results": serialize_team_list(rows, org_name=org_name),
             }
         )
 
     def post(self, request: Request, org_id) -> Response:
         """Create a new team in the organization."""
-        claims = getattr(request, "token_claims", {})
-
-        # Ensure org_id in request data matches URL
-        data = request.data.copy()
-        data["org"] = str(org_id)
+        claims = getattr(request, "token_claims", EMPTY_CLAIMS)
+        actor_id = claims.get("sub", "unknown")
+        actor_email = claims.get("email")
+
+        # Ensure org_id in request data matches URL. JSON bodies parse to a
+        # plain dict, so skip the QueryDict deep copy for them.
+        if isinstance(request.data, QueryDict):
+            data = request.data.copy()
+            data["org"] = str(org_id)
+        else:
+            data = {**request.data, "org": str(org_id)}
 
         serializer = TeamCreateSerializer(data=data)
         if not serializer.is_valid():
@@ -103,11 +124,11 @@ class OrgTeamListCreateView(APIView):
 
         logger.info(
             "org_team_created",
-            actor_id=claims.get("sub", "unknown"),
-            actor_email=claims.get("email"),
-            team_id=str(team.id),
+            actor_id=actor_id,
+            actor_email=actor_email,
+            team_id=team.id,
             team_name=team.name,
-            org_id=str(team.org_id),
+            org_id=team.org_id,
         )
 
         return Response(TeamSerializer(team).data, status=status.HTTP_201_CREATED)
@@ -145,12 +166,13 @@ class OrgTeamDetailView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        claims = getattr(request, "token_claims", {})
+        claims = getattr(request, "token_claims", EMPTY_CLAIMS)
+        actor_id = claims.get("sub", "unknown")
         logger.info(
             "org_team_detail_accessed",
-            actor_id=claims.get("sub", "unknown"),
-            org_id=str(org_id),
-            team_id=str(team_id),
+            actor_id=actor_id,
+            org_id=org_id,
+            team_id=team_id,
         )
 
         serializer = TeamSerializer(team)
@@ -165,7 +187,9 @@ class OrgTeamDetailView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        claims = getattr(request, "token_claims", {})
+        claims = getattr(request, "token_claims", EMPTY_CLAIMS)
+        actor_id = claims.get("sub", "unknown")
+        actor_email = claims.get("email")
         old_name = team.name
 
         serializer = TeamUpdateSerializer(team, data=request.data, partial=True)
@@ -181,11 +205,11 @@ class OrgTeamDetailView(APIView):
 
         logger.info(
             "org_team_updated",
-            actor_id=claims.get("sub", "unknown"),
-            actor_email=claims.get("email"),
-            team_id=str(team.id),
+            actor_id=actor_id,
+            actor_email=actor_email,
+            team_id=team.id,
             team_name=team.name,
-            org_id=str(team.org_id),
+            org_id=team.org_id,
             changes=changes,
         )
 
@@ -200,7 +224,9 @@ class OrgTeamDetailView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        claims = getattr(request, "token_claims", {})
+        claims = getattr(request, "token_claims", EMPTY_CLAIMS)
+        actor_id = claims.get("sub", "unknown")
+        actor_email = claims.get("email")
         team_name = team.name
 
         # Hard delete the team
@@ -208,11 +234,11 @@ class OrgTeamDetailView(APIView):
 
         logger.info(
             "org_team_deleted",
-            actor_id=claims.get("sub", "unknown"),
-            actor_email=claims.get("email"),
-            team_id=str(team_id),
+            actor_id=actor_id,
+            actor_email=actor_email,
+            team_id=team_id,
             team_name=team_name,
-            org_id=str(org_id),
+            org_id=org_id,
         )
 
         return Response(
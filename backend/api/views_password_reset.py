@@ -12,6 +12,7 @@ from rest_framework.response import Response
 from rest_framework.throttling import AnonRateThrottle
 from rest_framework.views import APIView
 
+from api.email import send_email_async
 from api.models_local_auth import LocalUserProfile, RefreshToken
 from api.serializers_local_auth import (
     EmailVerificationSerializer,
@@ -19,6 +20,7 @@ from api.serializers_local_auth import (
     PasswordResetRequestSerializer,
     ResendVerificationSerializer,
 )
+from api.tasks import send_password_reset_email_task
 
 User = get_user_model()
 
@@ -58,37 +60,13 @@ class PasswordResetRequestView(APIView):
             "message": "If an account with that email exists, a password reset link has been sent."
         }
 
-        try:
-            user = User.objects.get(email__iexact=email)
-            profile = user.local_profile
-        except (User.DoesNotExist, LocalUserProfile.DoesNotExist):
-            return Response(response_message)
-
-        # Generate password reset token
-        token = profile.generate_password_reset_token()
-
-        # Send password reset email
-        self._send_reset_email(user, token)
+        # The lookup, token and email all happen in the worker, so every
+        # request does exactly one publish and response time does not reveal
+        # whether the account exists.
+        send_password_reset_email_task.delay(email)
 
         return Response(response_message)
 
-    def _send_reset_email(self, user: User, token: str) -> None:
-        """Send password reset email."""
-        from api.email import send_email
-
-        frontend_url = getattr(settings, "FRONTEND_URL", "http://localhost:3000")
-        reset_url = f"{frontend_url}/reset-password?token={token}"
-
-        send_email(
-            to=[user.email],
-            subject="Reset your password",
-            template="email/password_reset.html",
-            context={
-                "user": user,
-                "reset_url": reset_url,
-            },
-        )
-
 
 class PasswordResetConfirmView(APIView):
     """
@@ -124,12 +102,16 @@ class PasswordResetConfirmView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Set new password
+        # Set new password and clear the reset token in a single UPDATE
         profile.set_password(new_password)
-        profile.clear_password_reset_token()
+        profile.password_reset_token = ""
+        profile.password_reset_sent_at = None
+        profile.save(
+            update_fields=["password_hash", "password_reset_token", "password_reset_sent_at"]
+        )
 
-        # Revoke all refresh tokens for security
-        RefreshToken.revoke_all_for_user(profile.user)
+        # Revoke all refresh tokens for security (by id, without loading the user)
+        RefreshToken.revoke_all_for_user(profile.user_id)
 
         return Response({"message": "Password has been reset successfully"})
 
@@ -221,18 +203,16 @@ class ResendVerificationView(APIView):
         return Response(response_message)
 
     def _send_verification_email(self, user: User, token: str) -> None:
-        """Send email verification email."""
-        from api.email import send_email
-
+        """Queue email verification email for background delivery."""
         frontend_url = getattr(settings, "FRONTEND_URL", "http://localhost:3000")
         verification_url = f"{frontend_url}/verify-email?token={token}"
 
-        send_email(
+        send_email_async(
             to=[user.email],
             subject="Verify your email address",
             template="email/verify_email.html",
             context={
-                "user": user,
+                "user": {"first_name": user.first_name, "email": user.email},
                 "verification_url": verification_url,
             },
         )
@@ -4,6 +4,12 @@ Site settings API views.
 Provides endpoints to get and update site-wide settings.
 """
 
+import hashlib
+
+from django.core.cache import cache
+from django.http import HttpResponseNotModified
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags, quote_etag
 from rest_framework import serializers, status
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
@@ -12,6 +18,12 @@ from rest_framework.views import APIView
 from api.models_site_settings import SiteSettings
 from api.permissions import IsPlatformAdmin
 
+# The public payload is cached under a versioned key; bumping the version on
+# update makes readers miss and reload instead of deleting keys in place.
+SITE_SETTINGS_VERSION_KEY = "site_settings:ver"
+SITE_SETTINGS_CACHE_TTL = 3600
+SITE_SETTINGS_BROWSER_MAX_AGE = 300
+
 
 class SiteSettingsSerializer(serializers.ModelSerializer):
     """Serializer for site settings."""
@@ -46,6 +58,29 @@ class SiteSettingsPublicSerializer(serializers.ModelSerializer):
         ]
 
 
+def _load_public_site_settings() -> tuple[str, dict]:
+    settings = SiteSettings.get_settings()
+    etag = quote_etag(hashlib.sha256(settings.updated_at.isoformat().encode()).hexdigest()[:16])
+    return etag, dict(SiteSettingsPublicSerializer(settings).data)
+
+
+def get_public_site_settings_with_etag() -> tuple[str, dict]:
+    """Return the ETag and public payload, both cached once per version."""
+    version = cache.get(SITE_SETTINGS_VERSION_KEY, 0)
+    return cache.get_or_set(
+        f"site_settings:v{version}",
+        _load_public_site_settings,
+        SITE_SETTINGS_CACHE_TTL,
+    )
+
+
+def invalidate_site_settings_cache() -> None:
+    """Bump the cache version so the next public read reloads from the database."""
+    # add() only sets a missing key, so concurrent updates can't reset the counter
+    cache.add(SITE_SETTINGS_VERSION_KEY, 0, timeout=None)
+    cache.incr(SITE_SETTINGS_VERSION_KEY)
+
+
 class SiteSettingsView(APIView):
     """
     Get site settings (public).
@@ -58,9 +93,15 @@ class SiteSettingsView(APIView):
     permission_classes = [AllowAny]
 
     def get(self, request):
-        settings = SiteSettings.get_settings()
-        serializer = SiteSettingsPublicSerializer(settings)
-        return Response(serializer.data)
+        etag, data = get_public_site_settings_with_etag()
+        if_none_match = request.META.get("HTTP_IF_NONE_MATCH")
+        if if_none_match and (if_none_match.strip() == "*" or etag in parse_etags(if_none_match)):
+            response = HttpResponseNotModified()
+        else:
+            response = Response(data)
+        response["ETag"] = etag
+        patch_cache_control(response, public=True, max_age=SITE_SETTINGS_BROWSER_MAX_AGE)
+        return response
 
 
 class SiteSettingsAdminView(APIView):
@@ -86,6 +127,7 @@ class SiteSettingsAdminView(APIView):
         serializer = SiteSettingsSerializer(settings, data=request.data, partial=True)
         serializer.is_valid(raise_exception=True)
         serializer.save()
+        invalidate_site_settings_cache()
         return Response(serializer.data)
 
     def patch(self, request):
@@ -5,13 +5,23 @@ Provides API endpoints for social login (Google, GitHub) that work with SPAs.
 Returns JWT tokens instead of session-based authentication.
 """
 
+import functools
+import http.cookiejar
+from urllib.parse import quote_plus, urlencode
+
+import requests
 import structlog
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core import signing
+from django.core.signals import setting_changed
 from django.db import transaction
+from django.db.models import F
+from django.dispatch import receiver
 from rest_framework import status
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
+from requests.adapters import HTTPAdapter
 from rest_framework.views import APIView
 
 from api.local_jwt import generate_access_token, generate_refresh_token
@@ -19,9 +29,52 @@ from api.local_jwt import generate_access_token, generate_refresh_token
 logger = structlog.get_logger(__name__)
 User = get_user_model()
 
+# Shared HTTP session so OAuth calls reuse keep-alive connections (and skip the
+# TLS handshake) to the provider hosts across logins. It is shared by every
+# user's exchange, so provider cookies (_gh_sess, logged_in, ...) are never
+# stored.
+_SESSION = requests.Session()
+_SESSION.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+_SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=50))
+
+
+# The post-login redirect travels in the OAuth ``state`` parameter, signed with
+# SECRET_KEY, so the flow needs no server-side session storage.
+_STATE_SALT = "api.social_auth.state"
+_STATE_MAX_AGE = 600
+
+
+def encode_oauth_state(redirect_url: str, provider: str) -> str:
+    """Sign the frontend redirect URL and provider for the OAuth ``state`` parameter."""
+    return signing.dumps(
+        {"redirect": redirect_url, "provider": provider}, salt=_STATE_SALT, compress=True
+    )
+
+
+def load_oauth_state(state: str | None) -> dict:
+    """Return the payload of a signed ``state``, or an empty dict if missing or invalid."""
+    if not state:
+        return {}
+    try:
+        payload = signing.loads(state, salt=_STATE_SALT, max_age=_STATE_MAX_AGE)
+    except signing.BadSignature:
+        return {}
+    return payload if isinstance(payload, dict) else {}
 
-def get_enabled_providers() -> list:
-    """Get list of enabled social providers from settings."""
+
+def decode_oauth_state(state: str | None) -> str:
+    """Return the redirect URL from a signed ``state``, or "/" if missing or invalid."""
+    return load_oauth_state(state).get("redirect", "/")
+
+
+@functools.lru_cache(maxsize=1)
+def get_enabled_providers() -> tuple:
+    """
+    Get the enabled social providers from settings.
+
+    Settings don't change at runtime, so the result is computed once; the
+    cache is reset when tests override the provider settings.
+    """
     providers = []
 
     if getattr(settings, "GOOGLE_CLIENT_ID", None):
@@ -36,7 +89,173 @@ def get_enabled_providers() -> list:
             "name": "GitHub",
         })
 
-    return providers
+    return tuple(providers)
+
+
+@functools.lru_cache(maxsize=1)
+def get_enabled_provider_ids() -> frozenset:
+    """Get the ids of the enabled social providers."""
+    return frozenset(p["id"] for p in get_enabled_providers())
+
+
+@functools.lru_cache(maxsize=1)
+def _google_auth_base() -> str:
+    """Google authorize URL with the per-process constant params encoded."""
+    params = {
+        "client_id": settings.GOOGLE_CLIENT_ID,
+        "response_type": "code",
+        "scope": "openid email profile",
+        "access_type": "offline",
+        "prompt": "select_account",
+    }
+    return f"https://accounts.google.com/o/oauth2/v2/auth?{urlencode(params)}"
+
+
+@functools.lru_cache(maxsize=1)
+def _github_auth_base() -> str:
+    """GitHub authorize URL with the per-process constant params encoded."""
+    params = {
+        "client_id": settings.GITHUB_CLIENT_ID,
+        "scope": "user:email",
+    }
+    return f"https://github.com/login/oauth/authorize?{urlencode(params)}"
+
+
+@receiver(setting_changed)
+def _reset_enabled_providers(setting, **kwargs):
+    if setting in ("GOOGLE_CLIENT_ID", "GITHUB_CLIENT_ID"):
+        get_enabled_providers.cache_clear()
+        get_enabled_provider_ids.cache_clear()
+        _google_auth_base.cache_clear()
+        _github_auth_base.cache_clear()
+
+
+def _google_auth_url(callback_url: str, state: str) -> str:
+    """Build Google OAuth URL."""
+    return (
+        f"{_google_auth_base()}&redirect_uri={quote_plus(callback_url)}"
+        f"&state={quote_plus(state)}"
+    )
+
+
+def _github_auth_url(callback_url: str, state: str) -> str:
+    """Build GitHub OAuth URL."""
+    return (
+        f"{_github_auth_base()}&redirect_uri={quote_plus(callback_url)}"
+        f"&state={quote_plus(state)}"
+    )
+
+
+def _exchange_google_code(request, code: str) -> dict:
+    """Exchange Google auth code for user info."""
+    # Build callback URL (must match the one used in login)
+    callback_url = request.build_absolute_uri("/api/v1/auth/social/callback?provider=google")
+
+    # Exchange code for tokens
+    token_response = _SESSION.post(
+        "https://oauth2.googleapis.com/token",
+        data={
+            "code": code,
+            "client_id": settings.GOOGLE_CLIENT_ID,
+            "client_secret": settings.GOOGLE_CLIENT_SECRET,
+            "redirect_uri": callback_url,
+            "grant_type": "authorization_code",
+        },
+        timeout=10,
+    )
+    token_response.raise_for_status()
+    tokens = token_response.json()
+
+    # Get user info
+    user_response = _SESSION.get(
+        "https://www.googleapis.com/oauth2/v2/userinfo",
+        headers={"Authorization": f"Bearer {tokens['access_token']}"},
+        timeout=10,
+    )
+    user_response.raise_for_status()
+    user_info = user_response.json()
+
+    return {
+        "provider_id": user_info["id"],
+        "email": user_info["email"],
+        "name": user_info.get("name", ""),
+        "first_name": user_info.get("given_name", ""),
+        "last_name": user_info.get("family_name", ""),
+        "picture": user_info.get("picture", ""),
+    }
+
+
+def _exchange_github_code(request, code: str) -> dict:
+    """Exchange GitHub auth code for user info."""
+    # Exchange code for access token
+    token_response = _SESSION.post(
+        "https://github.com/login/oauth/access_token",
+        data={
+            "code": code,
+            "client_id": settings.GITHUB_CLIENT_ID,
+            "client_secret": settings.GITHUB_CLIENT_SECRET,
+        },
+        headers={"Accept": "application/json"},
+        timeout=10,
+    )
+    token_response.raise_for_status()
+    tokens = token_response.json()
+
+    if "error" in tokens:
+        raise ValueError(tokens.get("error_description", tokens["error"]))
+
+    access_token = tokens["access_token"]
+    headers = {
+        "Authorization": f"token {access_token}",
+        "Accept": "application/vnd.github.v3+json",
+    }
+
+    # Get user info
+    user_response = _SESSION.get("https://api.github.com/user", headers=headers, timeout=10)
+    user_response.raise_for_status()
+    user_info = user_response.json()
+
+    # Get user email (might be private); only then is the email list needed
+    email = user_info.get("email")
+    if not email:
+        email_response = _SESSION.get(
+            "https://api.github.com/user/emails", headers=headers, timeout=10
+        )
+        email_response.raise_for_status()
+        emails = email_response.json()
+        # Get primary email
+        for e in emails:
+            if e.get("primary"):
+                email = e["email"]
+                break
+        if not email and emails:
+            email = emails[0]["email"]
+
+    # Parse name
+    name = user_info.get("name", "") or user_info.get("login", "")
+    parts = name.split(" ", 1)
+    first_name = parts[0] if parts else ""
+    last_name = parts[1] if len(parts) > 1 else ""
+
+    return {
+        "provider_id": str(user_info["id"]),
+        "email": email,
+        "name": name,
+        "first_name": first_name,
+        "last_name": last_name,
+        "picture": user_info.get("avatar_url", ""),
+    }
+
+
+# Per-provider handlers; SocialLoginView and SocialCallbackView dispatch on these
+_LOGIN_URL_BUILDERS = {
+    "google": _google_auth_url,
+    "github": _github_auth_url,
+}
+_CODE_EXCHANGERS = {
+    "google": _exchange_google_code,
+    "github": _exchange_github_code,
+}
 
 
 class SocialProvidersView(APIView):
@@ -67,8 +286,7 @@ class SocialLoginView(APIView):
     def get(self, request, provider):
         """Get OAuth login URL for provider."""
         # Validate provider
-        enabled = {p["id"] for p in get_enabled_providers()}
-        if provider not in enabled:
+        if provider not in get_enabled_provider_ids():
             return Response(
                 {"error": f"Provider '{provider}' is not configured"},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -80,19 +298,17 @@ class SocialLoginView(APIView):
         # Get frontend redirect URL (where to send user after OAuth)
         redirect_url = request.query_params.get("redirect", "/")
 
-        # Store redirect URL in session for callback
-        request.session["social_auth_redirect"] = redirect_url
+        # Carry the redirect URL to the callback in the signed OAuth state
+        state = encode_oauth_state(redirect_url, provider)
 
         # Build OAuth URL based on provider
-        if provider == "google":
-            auth_url = self._get_google_auth_url(callback_url)
-        elif provider == "github":
-            auth_url = self._get_github_auth_url(callback_url)
-        else:
+        build_auth_url = _LOGIN_URL_BUILDERS.get(provider)
+        if build_auth_url is None:
             return Response(
                 {"error": "Provider not supported"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
+        auth_url = build_auth_url(callback_url, state)
 
         logger.info(
             "social_login_initiated",
@@ -102,42 +318,6 @@ class SocialLoginView(APIView):
 
         return Response({"auth_url": auth_url})
 
-    def _get_google_auth_url(self, callback_url: str) -> str:
-        """Build Google OAuth URL."""
-        import urllib.parse
-
-        client_id = settings.GOOGLE_CLIENT_ID
-        scope = "openid email profile"
-
-        params = {
-            "client_id": client_id,
-            "redirect_uri": callback_url,
-            "response_type": "code",
-            "scope": scope,
-            "access_type": "offline",
-            "prompt": "select_account",
-        }
-
-        base_url = "https://accounts.google.com/o/oauth2/v2/auth"
-        return f"{base_url}?{urllib.parse.urlencode(params)}"
-
-    def _get_github_auth_url(self, callback_url: str) -> str:
-        """Build GitHub OAuth URL."""
-        import urllib.parse
-
-        client_id = settings.GITHUB_CLIENT_ID
-        scope = "user:email"
-
-        params = {
-            "client_id": client_id,
-            "redirect_uri": callback_url,
-            "scope": scope,
-        }
-
-        base_url = "https://github.com/login/oauth/authorize"
-        return f"{base_url}?{urllib.parse.urlencode(params)}"
-
-
 class SocialCallbackView(APIView):
     """
     GET /api/v1/auth/social/callback - OAuth callback handler
@@ -150,7 +330,10 @@ class SocialCallbackView(APIView):
 
     def get(self, request):
         """Handle OAuth callback."""
-        provider = request.query_params.get("provider")
+        # The signed state carries the provider and redirect URL; the provider
+        # query param is only a fallback for states issued before it was added.
+        oauth_state = load_oauth_state(request.query_params.get("state"))
+        provider = oauth_state.get("provider") or request.query_params.get("provider")
         code = request.query_params.get("code")
         error = request.query_params.get("error")
 
@@ -172,17 +355,16 @@ class SocialCallbackView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        exchange_code = _CODE_EXCHANGERS.get(provider)
+        if exchange_code is None:
+            return Response(
+                {"error": "Unsupported provider"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
         # Exchange code for user info
         try:
-            if provider == "google":
-                user_info = self._exchange_google_code(request, code)
-            elif provider == "github":
-                user_info = self._exchange_github_code(request, code)
-            else:
-                return Response(
-                    {"error": "Unsupported provider"},
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
+            user_info = exchange_code(request, code)
         except Exception as e:
             logger.error(
                 "social_auth_exchange_failed",
@@ -211,8 +393,7 @@ class SocialCallbackView(APIView):
         access_token = generate_access_token(user, roles=roles)
         refresh_token = generate_refresh_token(user)
 
-        # Get redirect URL from session
-        redirect_url = request.session.pop("social_auth_redirect", "/")
+        redirect_url = oauth_state.get("redirect", "/")
 
         logger.info(
             "social_login_success",
@@ -234,117 +415,6 @@ class SocialCallbackView(APIView):
             },
         })
 
-    def _exchange_google_code(self, request, code: str) -> dict:
-        """Exchange Google auth code for user info."""
-        import requests
-
-        # Build callback URL (must match the one used in login)
-        callback_url = request.build_absolute_uri("/api/v1/auth/social/callback?provider=google")
-
-        # Exchange code for tokens
-        token_response = requests.post(
-            "https://oauth2.googleapis.com/token",
-            data={
-                "code": code,
-                "client_id": settings.GOOGLE_CLIENT_ID,
-                "client_secret": settings.GOOGLE_CLIENT_SECRET,
-                "redirect_uri": callback_url,
-                "grant_type": "authorization_code",
-            },
-            timeout=10,
-        )
-        token_response.raise_for_status()
-        tokens = token_response.json()
-
-        # Get user info
-        user_response = requests.get(
-            "https://www.googleapis.com/oauth2/v2/userinfo",
-            headers={"Authorization": f"Bearer {tokens['access_token']}"},
-            timeout=10,
-        )
-        user_response.raise_for_status()
-        user_info = user_response.json()
-
-        return {
-            "provider_id": user_info["id"],
-            "email": user_info["email"],
-            "name": user_info.get("name", ""),
-            "first_name": user_info.get("given_name", ""),
-            "last_name": user_info.get("family_name", ""),
-            "picture": user_info.get("picture", ""),
-        }
-
-    def _exchange_github_code(self, request, code: str) -> dict:
-        """Exchange GitHub auth code for user info."""
-        import requests
-
-        # Exchange code for access token
-        token_response = requests.post(
-            "https://github.com/login/oauth/access_token",
-            data={
-                "code": code,
-                "client_id": settings.GITHUB_CLIENT_ID,
-                "client_secret": settings.GITHUB_CLIENT_SECRET,
-            },
-            headers={"Accept": "application/json"},
-            timeout=10,
-        )
-        token_response.raise_for_status()
-        tokens = token_response.json()
-
-        if "error" in tokens:
-            raise ValueError(tokens.get("error_description", tokens["error"]))
-
-        access_token = tokens["access_token"]
-
-        # Get user info
-        user_response = requests.get(
-            "https://api.github.com/user",
-            headers={
-                "Authorization": f"token {access_token}",
-                "Accept": "application/vnd.github.v3+json",
-            },
-            timeout=10,
-        )
-        user_response.raise_for_status()
-        user_info = user_response.json()
-
-        # Get user email (might be private)
-        email = user_info.get("email")
-        if not email:
-            email_response = requests.get(
-                "https://api.github.com/user/emails",
-                headers={
-                    "Authorization": f"token {access_token}",
-                    "Accept": "application/vnd.github.v3+json",
-                },
-                timeout=10,
-            )
-            email_response.raise_for_status()
-            emails = email_response.json()
-            # Get primary email
-            for e in emails:
-                if e.get("primary"):
-                    email = e["email"]
-                    break
-            if not email and emails:
-                email = emails[0]["email"]
-
-        # Parse name
-        name = user_info.get("name", "") or user_info.get("login", "")
-        parts = name.split(" ", 1)
-        first_name = parts[0] if parts else ""
-        last_name = parts[1] if len(parts) > 1 else ""
-
-        return {
-            "provider_id": str(user_info["id"]),
-            "email": email,
-            "name": name,
-            "first_name": first_name,
-            "last_name": last_name,
-            "picture": user_info.get("avatar_url", ""),
-        }
-
     @transaction.atomic
     def _get_or_create_user(self, provider: str, user_info: dict):
         """Get or create user from social auth info."""
@@ -358,23 +428,30 @@ class SocialCallbackView(APIView):
         provider_id = user_info["provider_id"]
 
         # Check if social account already exists
+        # The user and profile are loaded in the same query; the callback reads
+        # local_profile for roles right after.
         try:
-            social_account = SocialAccount.objects.get(
+            social_account = SocialAccount.objects.select_related(
+                "user", "user__local_profile"
+            ).get(
                 provider=provider,
                 provider_id=provider_id,
             )
             # Update user info
             user = social_account.user
-            user.first_name = user_info.get("first_name", "") or user.first_name
-            user.last_name = user_info.get("last_name", "") or user.last_name
-            user.save(update_fields=["first_name", "last_name"])
+            first_name = user_info.get("first_name", "") or user.first_name
+            last_name = user_info.get("last_name", "") or user.last_name
+            if (first_name, last_name) != (user.first_name, user.last_name):
+                user.first_name = first_name
+                user.last_name = last_name
+                user.save(update_fields=["first_name", "last_name"])
             return user
         except SocialAccount.DoesNotExist:
             pass
 
         # Check if user with this email exists
         try:
-            user = User.objects.get(email__iexact=email)
+            user = User.objects.select_related("local_profile").get(email__iexact=email)
             # Link social account to existing user
             SocialAccount.objects.create(
                 user=user,
@@ -400,16 +477,16 @@ class SocialCallbackView(APIView):
             provider_id=provider_id,
         )
 
-        # Create local profile with default role
+        # Create local profile with default role. The user was just inserted,
+        # so no profile can exist yet; setting profile.user also caches it on
+        # user.local_profile for the callback.
         from api.models_local_auth import LocalUserProfile
 
-        LocalUserProfile.objects.get_or_create(
+        LocalUserProfile.objects.create(
             user=user,
-            defaults={
-                "auth_provider": f"social:{provider}",
-                "email_verified": True,  # Social auth emails are pre-verified
-                "roles": ["user"],
-            },
+            auth_provider=f"social:{provider}",
+            email_verified=True,  # Social auth emails are pre-verified
+            roles=["user"],
         )
 
         return user
@@ -426,15 +503,11 @@ class SocialAccountsView(APIView):
         """List user's connected social accounts."""
         from api.models_social_auth import SocialAccount
 
-        accounts = SocialAccount.objects.filter(user=request.user)
-        data = [
-            {
-                "id": acc.id,
-                "provider": acc.provider,
-                "connected_at": acc.created_at,
-            }
-            for acc in accounts
-        ]
+        data = list(
+            SocialAccount.objects.filter(user=request.user).values(
+                "id", "provider", connected_at=F("created_at")
+            )
+        )
 
         return Response({"accounts": data})
 
@@ -463,9 +536,9 @@ class SocialAccountDisconnectView(APIView):
             hasattr(request.user, "local_profile")
             and request.user.local_profile.password_hash
         )
-        other_social_count = SocialAccount.objects.filter(user=request.user).exclude(id=account_id).count()
-
-        if not has_password and other_social_count == 0:
+        if not has_password and not (
+            SocialAccount.objects.filter(user=request.user).exclude(id=account_id).exists()
+        ):
             return Response(
                 {"error": "Cannot disconnect last authentication method. Set a password first."},
                 status=status.HTTP_400_BAD_REQUEST,
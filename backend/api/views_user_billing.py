@@ -8,8 +8,12 @@ Provides endpoints for individual user subscriptions:
 - Create Stripe customer for user
 """
 
+from typing import Optional
+
 import structlog
 from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
@@ -29,6 +33,8 @@ from api.stripe_client import (
 
 logger = structlog.get_logger(__name__)
 
+BILLING_PROFILE_CACHE_TTL = 300
+
 
 def _get_or_create_profile(user) -> LocalUserProfile:
     """Get or create LocalUserProfile for a user."""
@@ -39,6 +45,56 @@ def _get_or_create_profile(user) -> LocalUserProfile:
     return profile
 
 
+def _billing_profile_cache_key(user_id) -> str:
+    return f"billing_profile:{user_id}"
+
+
+def get_billing_profile(user) -> dict:
+    """
+    Return the user's billing fields, reading through the cache.
+
+    Only stripe_customer_id, license_tier and feature_flags are cached; code
+    that writes them must call invalidate_billing_profile().
+    """
+    key = _billing_profile_cache_key(user.id)
+    billing = cache.get(key)
+    if billing is None:
+        profile = _get_or_create_profile(user)
+        billing = {
+            "stripe_customer_id": profile.stripe_customer_id,
+            "license_tier": profile.license_tier,
+            "feature_flags": profile.feature_flags,
+        }
+        cache.set(key, billing, BILLING_PROFILE_CACHE_TTL)
+    return billing
+
+
+def invalidate_billing_profile(user_id) -> None:
+    """Drop the cached billing fields for a user."""
+    cache.delete(_billing_profile_cache_key(user_id))
+
+
+def _update_profile(user, **fields) -> None:
+    """
+    Write fields to the user's profile with a single UPDATE.
+
+    If the user has no profile yet, it is created through
+    _get_or_create_profile() (which tolerates concurrent creators) and the
+    UPDATE is repeated.
+    """
+    fields["updated_at"] = timezone.now()
+    profiles = LocalUserProfile.objects.filter(user=user)
+    if not profiles.update(**fields):
+        _get_or_create_profile(user)
+        profiles.update(**fields)
+
+
+def _set_stripe_customer_id(user, customer_id: str) -> None:
+    """Store a new Stripe customer id on the user's profile."""
+    _update_profile(user, stripe_customer_id=customer_id)
+    invalidate_billing_profile(user.id)
+
+
 class UserBillingStatusView(APIView):
     """
     Get billing status for the current user.
@@ -50,12 +106,14 @@ class UserBillingStatusView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        profile = _get_or_create_profile(request.user)
+        billing = get_billing_profile(request.user)
+        customer_id = billing["stripe_customer_id"]
+        license_tier = billing["license_tier"]
 
         # Get subscription info if Stripe is enabled and customer exists
         subscription = None
-        if settings.STRIPE_ENABLED and profile.stripe_customer_id:
-            subscriptions = get_customer_subscriptions(profile.stripe_customer_id)
+        if settings.STRIPE_ENABLED and customer_id:
+            subscriptions = get_customer_subscriptions(customer_id)
             # Get active subscription
             active_subs = [s for s in subscriptions if s.get("status") == "active"]
             if active_subs:
@@ -71,9 +129,9 @@ class UserBillingStatusView(APIView):
             "user_id": request.user.id,
             "email": request.user.email,
             "stripe_enabled": settings.STRIPE_ENABLED,
-            "stripe_customer_id": profile.stripe_customer_id,
-            "license_tier": profile.license_tier,
-            "feature_flags": profile.feature_flags or get_tier_features(profile.license_tier),
+            "stripe_customer_id": customer_id,
+            "license_tier": license_tier,
+            "feature_flags": billing["feature_flags"] or get_tier_features(license_tier),
             "subscription": subscription,
         })
 
@@ -103,10 +161,10 @@ class UserCheckoutSessionView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        profile = _get_or_create_profile(request.user)
+        customer_id = get_billing_profile(request.user)["stripe_customer_id"]
 
         # Ensure user has a Stripe customer
-        if not profile.stripe_customer_id:
+        if not customer_id:
             try:
                 customer_id = create_customer(
                     org_id=f"user_{request.user.id}",
@@ -114,8 +172,7 @@ class UserCheckoutSessionView(APIView):
                     email=request.user.email,
                     metadata={"type": "user", "user_id": str(request.user.id)},
                 )
-                profile.stripe_customer_id = customer_id
-                profile.save(update_fields=["stripe_customer_id", "updated_at"])
+                _set_stripe_customer_id(request.user, customer_id)
             except StripeOperationError as e:
                 logger.error(
                     "user_checkout_customer_creation_failed",
@@ -133,7 +190,7 @@ class UserCheckoutSessionView(APIView):
             cancel_url = f"{settings.FRONTEND_URL}/settings/billing"
 
             checkout_url = create_checkout_session(
-                customer_id=profile.stripe_customer_id,
+                customer_id=customer_id,
                 price_id=price_id,
                 org_id=f"user_{request.user.id}",
                 success_url=success_url,
@@ -175,9 +232,9 @@ class UserBillingPortalView(APIView):
                 status=status.HTTP_503_SERVICE_UNAVAILABLE,
             )
 
-        profile = _get_or_create_profile(request.user)
+        customer_id = get_billing_profile(request.user)["stripe_customer_id"]
 
-        if not profile.stripe_customer_id:
+        if not customer_id:
             return Response(
                 {"detail": _("No billing account found")},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -186,7 +243,7 @@ class UserBillingPortalView(APIView):
         try:
             return_url = f"{settings.FRONTEND_URL}/settings/billing"
             portal_url = create_billing_portal_session(
-                customer_id=profile.stripe_customer_id,
+                customer_id=customer_id,
                 return_url=return_url,
             )
             return Response({"url": portal_url})
@@ -225,9 +282,7 @@ class CreateUserStripeCustomerView(APIView):
                 status=status.HTTP_503_SERVICE_UNAVAILABLE,
             )
 
-        profile = _get_or_create_profile(request.user)
-
-        if profile.stripe_customer_id:
+        if get_billing_profile(request.user)["stripe_customer_id"]:
             return Response(
                 {"detail": _("User already has a billing account")},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -240,8 +295,7 @@ class CreateUserStripeCustomerView(APIView):
                 email=request.user.email,
                 metadata={"type": "user", "user_id": str(request.user.id)},
             )
-            profile.stripe_customer_id = customer_id
-            profile.save(update_fields=["stripe_customer_id", "updated_at"])
+            _set_stripe_customer_id(request.user, customer_id)
 
             return Response({
                 "customer_id": customer_id,
@@ -265,7 +319,15 @@ class CreateUserStripeCustomerView(APIView):
             )
 
 
-def get_effective_tier(user, org=None) -> str:
+def _get_local_profile(user) -> Optional[LocalUserProfile]:
+    """Return the user's LocalUserProfile, or None if there isn't one."""
+    try:
+        return user.local_profile
+    except LocalUserProfile.DoesNotExist:
+        return None
+
+
+def get_effective_tier(user, org=None, profile=None) -> str:
     """
     Get the effective license tier for a user.
 
@@ -274,17 +336,16 @@ def get_effective_tier(user, org=None) -> str:
     Args:
         user: The Django User object
         org: Optional Org object
+        profile: Optional LocalUserProfile already loaded for the user
 
     Returns:
         The effective license tier string
     """
     # Check user's personal tier first
-    try:
-        profile = user.local_profile
-        if profile.license_tier and profile.license_tier != "free":
-            return profile.license_tier
-    except LocalUserProfile.DoesNotExist:
-        pass
+    if profile is None:
+        profile = _get_local_profile(user)
+    if profile and profile.license_tier and profile.license_tier != "free":
+        return profile.license_tier
 
     # Fall back to org tier
     if org and org.license_tier and org.license_tier != "free":
@@ -293,7 +354,7 @@ def get_effective_tier(user, org=None) -> str:
     return "free"
 
 
-def get_effective_features(user, org=None) -> dict:
+def get_effective_features(user, org=None, profile=None) -> dict:
     """
     Get the effective feature flags for a user.
 
@@ -302,11 +363,14 @@ def get_effective_features(user, org=None) -> dict:
     Args:
         user: The Django User object
         org: Optional Org object
+        profile: Optional LocalUserProfile already loaded for the user
 
     Returns:
         Combined feature flags dict
     """
-    tier = get_effective_tier(user, org)
+    if profile is None:
+        profile = _get_local_profile(user)
+    tier = get_effective_tier(user, org, profile=profile)
     base_features = get_tier_features(tier)
 
     # Merge org features
@@ -314,12 +378,8 @@ def get_effective_features(user, org=None) -> dict:
         base_features = {**base_features, **org.feature_flags}
 
     # Merge user features (highest priority)
-    try:
-        profile = user.local_profile
-        if profile.feature_flags:
-            base_features = {**base_features, **profile.feature_flags}
-    except LocalUserProfile.DoesNotExist:
-        pass
+    if profile and profile.feature_flags:
+        base_features = {**base_features, **profile.feature_flags}
 
     return base_features
 
@@ -333,10 +393,8 @@ def update_user_license(user, tier: str, feature_flags: dict) -> None:
         tier: The new license tier
         feature_flags: Feature flags dict
     """
-    profile = _get_or_create_profile(user)
-    profile.license_tier = tier
-    profile.feature_flags = feature_flags
-    profile.save(update_fields=["license_tier", "feature_flags", "updated_at"])
+    _update_profile(user, license_tier=tier, feature_flags=feature_flags)
+    invalidate_billing_profile(user.id)
 
     logger.info(
         "user_license_updated",
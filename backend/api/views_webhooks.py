@@ -9,13 +9,14 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from api.models import WebhookDelivery, WebhookEndpoint
+from api.pagination import KeysetLimitOffsetPagination
 from api.permissions import IsPlatformAdmin
 from api.serializers_webhooks import (
     WebhookDeliverySerializer,
     WebhookEndpointDetailSerializer,
     WebhookEndpointSerializer,
 )
-from api.webhooks import dispatch_webhook
+from api.tasks import dispatch_webhook_event
 
 logger = structlog.get_logger(__name__)
 
@@ -32,7 +33,8 @@ class WebhookEndpointListCreateView(generics.ListCreateAPIView):
 
     def get_queryset(self):
         """Filter by org_id if provided."""
-        queryset = super().get_queryset()
+        # The list serializer never returns the secret, so don't load it
+        queryset = super().get_queryset().defer("secret")
         org_id = self.request.query_params.get("org_id")
         if org_id:
             queryset = queryset.filter(org_id=org_id)
@@ -87,15 +89,24 @@ class WebhookEndpointDetailView(generics.RetrieveUpdateDestroyAPIView):
 class WebhookDeliveryListView(generics.ListAPIView):
     """
     GET /api/v1/webhooks/{id}/deliveries - List deliveries for a webhook endpoint
+
+    Newest first; pass the returned next_cursor as ?cursor= to page without OFFSET.
     """
 
     permission_classes = [IsAuthenticated, IsPlatformAdmin]
     serializer_class = WebhookDeliverySerializer
+    pagination_class = KeysetLimitOffsetPagination
 
     def get_queryset(self):
         """Get deliveries for the specified endpoint."""
         endpoint_id = self.kwargs.get("pk")
-        return WebhookDelivery.objects.filter(endpoint_id=endpoint_id).order_by("-created_at")
+        # Each row renders endpoint.name/url; join the endpoint instead of
+        # fetching it per delivery
+        return (
+            WebhookDelivery.objects.filter(endpoint_id=endpoint_id)
+            .select_related("endpoint")
+            .defer("endpoint__secret", "endpoint__events", "endpoint__headers")
+        )
 
 
 class WebhookTestView(APIView):
@@ -107,9 +118,10 @@ class WebhookTestView(APIView):
 
     def post(self, request, pk):
         """Send a test webhook to the specified endpoint."""
-        try:
-            endpoint = WebhookEndpoint.objects.get(pk=pk)
-        except WebhookEndpoint.DoesNotExist:
+        # Only three columns are needed; skip the secret/JSON columns and
+        # model instantiation
+        endpoint = WebhookEndpoint.objects.filter(pk=pk).values("id", "org_id", "name").first()
+        if endpoint is None:
             return Response(
                 {"error": "Webhook endpoint not found"},
                 status=status.HTTP_404_NOT_FOUND,
@@ -119,27 +131,27 @@ class WebhookTestView(APIView):
         test_payload = {
             "event": "webhook.test",
             "message": "This is a test webhook delivery",
-            "endpoint_id": str(endpoint.id),
-            "endpoint_name": endpoint.name,
+            "endpoint_id": str(endpoint["id"]),
+            "endpoint_name": endpoint["name"],
         }
 
         logger.info(
             "webhook_test_triggered",
-            endpoint_id=str(endpoint.id),
-            org_id=endpoint.org_id,
+            endpoint_id=str(endpoint["id"]),
+            org_id=endpoint["org_id"],
         )
 
-        # Dispatch the test webhook
-        delivery_ids = dispatch_webhook(
+        # Fan out on a worker; the request only pays for one enqueue
+        result = dispatch_webhook_event.delay(
             event_type="webhook.test",
             payload=test_payload,
-            org_id=endpoint.org_id,
+            org_id=endpoint["org_id"],
         )
 
         return Response(
             {
                 "message": "Test webhook queued for delivery",
-                "delivery_ids": delivery_ids,
+                "task_id": result.id,
             },
-            status=status.HTTP_200_OK,
+            status=status.HTTP_202_ACCEPTED,
         )
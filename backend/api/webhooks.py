@@ -97,26 +97,31 @@ def dispatch_webhook(event_type: str, payload: dict, org_id: str = None) -> list
         endpoint_count=len(matching_endpoints),
     )
 
-    delivery_ids = []
-    for endpoint in matching_endpoints:
-        # Create a delivery record
-        delivery = WebhookDelivery.objects.create(
-            endpoint=endpoint,
-            event_type=event_type,
-            payload=payload,
-            status=WebhookDelivery.Status.PENDING,
-        )
+    # One INSERT for all delivery records, then queue a delivery task per record
+    deliveries = WebhookDelivery.objects.bulk_create(
+        [
+            WebhookDelivery(
+                endpoint=endpoint,
+                event_type=event_type,
+                payload=payload,
+                status=WebhookDelivery.Status.PENDING,
+            )
+            for endpoint in matching_endpoints
+        ]
+    )
 
-        delivery_ids.append(str(delivery.id))
+    delivery_ids = []
+    for delivery in deliveries:
+        delivery_id = str(delivery.id)
+        delivery_ids.append(delivery_id)
 
-        # Queue the delivery task
-        deliver_webhook.delay(str(delivery.id))
+        deliver_webhook.delay(delivery_id)
 
         logger.info(
             "webhook_delivery_queued",
-            delivery_id=str(delivery.id),
-            endpoint_id=str(endpoint.id),
-            endpoint_name=endpoint.name,
+            delivery_id=delivery_id,
+            endpoint_id=str(delivery.endpoint.id),
+            endpoint_name=delivery.endpoint.name,
             event_type=event_type,
         )
 
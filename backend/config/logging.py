@@ -7,11 +7,25 @@ This module provides:
 - Audit logging with policy version and decision info
 """
 
+import copy
+import functools
+import logging
+import os
+import queue
 import re
-from typing import Any
-
+import threading
+import uuid
+from decimal import Decimal
+from logging.handlers import QueueHandler, QueueListener
+from types import MappingProxyType
+from typing import Any, Mapping
+
+import orjson
 import structlog
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.functional import Promise
 
 # Fields that should be redacted in logs
 PII_FIELDS = {
@@ -32,6 +46,33 @@ PII_FIELDS = {
     "ip",
 }
 
+# Event keys that pii_redactor never masks
+_UNREDACTED_KEYS = frozenset({"event", "message", "timestamp", "level"})
+
+# All PII field names as one alternation, so a field name is scanned once
+# in C instead of once per entry in PII_FIELDS
+_PII_FIELD_RE = re.compile(
+    "|".join(re.escape(f) for f in sorted(PII_FIELDS, key=len, reverse=True))
+)
+_MIN_PII_FIELD_LEN = min(len(f) for f in PII_FIELDS)
+
+
+@functools.lru_cache(maxsize=4096)
+def is_pii_field(field_name: str) -> bool:
+    """Return True if the field name contains any PII_FIELDS entry (case-insensitive)."""
+    if len(field_name) < _MIN_PII_FIELD_LEN:
+        return False
+    return _PII_FIELD_RE.search(field_name.lower()) is not None
+
+
+@functools.lru_cache(maxsize=4096)
+def _classify_key(key: str) -> str:
+    """Classify an event key for pii_redactor: "skip", "pii" or "ok"."""
+    if key in _UNREDACTED_KEYS:
+        return "skip"
+    return "pii" if is_pii_field(key) else "ok"
+
+
 # Regex patterns for PII detection
 PII_PATTERNS = [
     (re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"), "[EMAIL_REDACTED]"),
@@ -39,6 +80,18 @@ PII_PATTERNS = [
     (re.compile(r"\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b"), "[CARD_REDACTED]"),
 ]
 
+# PII_PATTERNS fused into one regex so each string is scanned once; the
+# matching group's index picks the replacement
+_FUSED_PII_RE = re.compile("|".join(f"({pattern.pattern})" for pattern, _ in PII_PATTERNS))
+_PII_REPLACEMENTS = {i: replacement for i, (_, replacement) in enumerate(PII_PATTERNS, 1)}
+# Shortest string any pattern can match ("a@b.cc")
+_MIN_PII_VALUE_LEN = 6
+_DIGIT_RE = re.compile(r"\d")
+
+
+def _pii_replacement(match: re.Match) -> str:
+    return _PII_REPLACEMENTS[match.lastindex]
+
 
 def redact_value(value: Any, field_name: str = "") -> Any:
     """
@@ -52,21 +105,20 @@ def redact_value(value: Any, field_name: str = "") -> Any:
         The redacted value or original if no redaction needed
     """
     # Check if field name indicates PII
-    field_lower = field_name.lower()
-    for pii_field in PII_FIELDS:
-        if pii_field in field_lower:
-            if isinstance(value, str):
-                return "[REDACTED]"
-            elif isinstance(value, dict):
-                return {k: "[REDACTED]" for k in value}
+    if is_pii_field(field_name):
+        if isinstance(value, str):
             return "[REDACTED]"
+        elif isinstance(value, dict):
+            return {k: "[REDACTED]" for k in value}
+        return "[REDACTED]"
 
-    # Check string values for PII patterns
+    # Check string values for PII patterns; every pattern needs an "@" or digits
     if isinstance(value, str):
-        result = value
-        for pattern, replacement in PII_PATTERNS:
-            result = pattern.sub(replacement, result)
-        return result
+        if len(value) < _MIN_PII_VALUE_LEN or (
+            "@" not in value and _DIGIT_RE.search(value) is None
+        ):
+            return value
+        return _FUSED_PII_RE.sub(_pii_replacement, value)
 
     return value
 
@@ -75,33 +127,55 @@ def redact_dict(data: dict, depth: int = 0, max_depth: int = 5) -> dict:
     """
     Recursively redact PII from a dictionary.
 
+    ``data`` is left unchanged; use redact_dict_inplace() to skip the copy.
+
     Args:
         data: Dictionary to redact
-        depth: Current recursion depth
-        max_depth: Maximum recursion depth to prevent infinite loops
+        depth: Depth of ``data`` itself
+        max_depth: Dicts nested deeper than this are left untouched
 
     Returns:
-        Dictionary with PII redacted
-    """
-    if depth > max_depth:
-        return data
-
-    result = {}
-    for key, value in data.items():
-        if isinstance(value, dict):
-            result[key] = redact_dict(value, depth + 1, max_depth)
-        elif isinstance(value, list):
-            result[key] = [
-                redact_dict(v, depth + 1, max_depth)
-                if isinstance(v, dict)
-                else redact_value(v, key)
-                for v in value
-            ]
-        else:
-            result[key] = redact_value(value, key)
+        A new dictionary with PII redacted
+    """
+    result = copy.deepcopy(data)
+    redact_dict_inplace(result, depth, max_depth)
     return result
 
 
+def redact_dict_inplace(data: dict, depth: int = 0, max_depth: int = 5) -> None:
+    """
+    Redact PII from a dictionary and the dicts nested in it, in place.
+
+    Nested dicts (directly or inside lists) are walked with an explicit
+    stack, and only values that actually change are written back.
+
+    Args:
+        data: Dictionary to redact
+        depth: Depth of ``data`` itself
+        max_depth: Dicts nested deeper than this are left untouched
+    """
+    stack = [(data, depth)]
+    while stack:
+        current, level = stack.pop()
+        if level > max_depth:
+            continue
+        for key, value in current.items():
+            if isinstance(value, dict):
+                stack.append((value, level + 1))
+            elif isinstance(value, list):
+                for i, item in enumerate(value):
+                    if isinstance(item, dict):
+                        stack.append((item, level + 1))
+                    else:
+                        redacted = redact_value(item, key)
+                        if redacted is not item:
+                            value[i] = redacted
+            else:
+                redacted = redact_value(value, key)
+                if redacted is not value:
+                    current[key] = redacted
+
+
 def pii_redactor(logger, method_name: str, event_dict: dict) -> dict:
     """
     Structlog processor that redacts PII from log events.
@@ -114,19 +188,21 @@ def pii_redactor(logger, method_name: str, event_dict: dict) -> dict:
     pii_policy = getattr(settings, "AUDIT_PII_POLICY", "mask")
 
     if pii_policy == "drop":
-        # Remove PII fields entirely
+        # Remove PII fields entirely. Most events carry none, so check all
+        # keys with one regex pass first; "\x00" keeps matches within a key.
+        if _PII_FIELD_RE.search("\x00".join(event_dict).lower()) is None:
+            return event_dict
         for field in list(event_dict.keys()):
-            field_lower = field.lower()
-            for pii_field in PII_FIELDS:
-                if pii_field in field_lower:
-                    del event_dict[field]
-                    break
+            if is_pii_field(field):
+                del event_dict[field]
     else:
-        # Mask PII (default behavior)
-        for key in list(event_dict.keys()):
-            if key in ("event", "message", "timestamp", "level"):
-                continue
-            event_dict[key] = redact_value(event_dict[key], key)
+        # Mask PII (default behavior). Keys recur across log lines, so their
+        # classification is cached; under a non-PII key only strings can
+        # need redacting.
+        for key, value in event_dict.items():
+            kind = _classify_key(key)
+            if kind == "pii" or (kind == "ok" and isinstance(value, str)):
+                event_dict[key] = redact_value(value, key)
 
     return event_dict
 
@@ -145,33 +221,153 @@ def add_request_context(logger, method_name: str, event_dict: dict) -> dict:
     return event_dict
 
 
+@functools.lru_cache(maxsize=1)
+def _service_fragment() -> Mapping[str, str]:
+    """Service identification fields, built once since settings don't change at runtime."""
+    return MappingProxyType(
+        {
+            "service": "django-api",
+            "environment": getattr(settings, "ENVIRONMENT", "development"),
+        }
+    )
+
+
+@receiver(setting_changed)
+def _reset_service_fragment(setting, **kwargs):
+    if setting == "ENVIRONMENT":
+        _service_fragment.cache_clear()
+
+
 def add_service_info(logger, method_name: str, event_dict: dict) -> dict:
     """
     Structlog processor that adds service identification info.
     """
-    event_dict["service"] = "django-api"
-    event_dict["environment"] = getattr(settings, "ENVIRONMENT", "development")
+    event_dict.update(_service_fragment())
     return event_dict
 
 
+def json_default(obj: Any) -> Any:
+    """
+    JSON fallback for values the log serializer can't handle natively.
+
+    UUIDs render as plain strings so handlers can log model ids directly
+    instead of calling str() on each one (orjson does this natively; the
+    branch covers stdlib json). Decimals and lazy translation strings render
+    as strings and sets as lists; anything else falls back to repr().
+    """
+    if isinstance(obj, (uuid.UUID, Decimal, Promise)):
+        return str(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    return repr(obj)
+
+
+def orjson_dumps(obj: Any, default=None, **kwargs) -> str:
+    """Serialize a log event with orjson; the formatter needs str, not bytes."""
+    return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def json_formatter() -> structlog.stdlib.ProcessorFormatter:
+    """
+    Build the formatter that renders log records as redacted JSON.
+
+    Structlog events arrive pre-processed (context, timestamp, level); plain
+    stdlib records from Django and third-party libraries get the same
+    timestamp/level/service fields via the foreign pre-chain.
+    """
+    return structlog.stdlib.ProcessorFormatter(
+        foreign_pre_chain=[
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.stdlib.add_log_level,
+            add_service_info,
+        ],
+        processors=[
+            structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+            pii_redactor,
+            structlog.processors.EventRenamer("message"),
+            structlog.processors.format_exc_info,
+            structlog.processors.JSONRenderer(serializer=orjson_dumps, default=json_default),
+        ],
+    )
+
+
+class QueueLogHandler(QueueHandler):
+    """
+    Logging handler that moves formatting and output off the calling thread.
+
+    Request threads only enqueue the record. PII redaction, JSON rendering
+    and the stream write run on a QueueListener thread. The queue is bounded
+    so a stalled stream cannot grow memory without limit; records that do
+    not fit are dropped and counted in ``dropped`` and the
+    ``log_records_dropped_total`` metric.
+    """
+
+    def __init__(self, maxsize: int = 10000):
+        super().__init__(queue.Queue(maxsize))
+        self.target = logging.StreamHandler()
+        self.target.setFormatter(json_formatter())
+        self.dropped = 0
+        self._listener = None
+        self._listener_pid = None
+        self._start_lock = threading.Lock()
+
+    def prepare(self, record):
+        # Leave the record untouched; the listener thread formats it
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            from config.observability import metrics
+
+            # Request threads drop concurrently; += is not atomic
+            with self.lock:
+                self.dropped += 1
+            metrics.inc("log_records_dropped_total")
+
+    def emit(self, record):
+        self._ensure_listener()
+        super().emit(record)
+
+    def _ensure_listener(self):
+        # Threads do not survive fork, so (re)start the listener per process
+        pid = os.getpid()
+        if self._listener_pid == pid:
+            return
+        with self._start_lock:
+            if self._listener_pid != pid:
+                self._listener = QueueListener(self.queue, self.target)
+                self._listener.start()
+                self._listener_pid = pid
+
+    def close(self):
+        # Called by logging.shutdown() at exit; stopping drains the queue
+        if self._listener is not None and self._listener_pid == os.getpid():
+            self._listener.stop()
+            self._listener_pid = None
+        self.target.close()
+        super().close()
+
+
 def configure_structlog():
     """
     Configure structlog with all processors for production logging.
 
     Call this from settings.py after Django settings are loaded.
     """
-    processors = [
+    processors = (
         structlog.contextvars.merge_contextvars,
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.add_log_level,
         add_service_info,
         add_request_context,
-        pii_redactor,
-        structlog.processors.EventRenamer("message"),
         structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
-        structlog.processors.JSONRenderer(),
-    ]
+        pii_redactor,
+        # Rendering runs in json_formatter() on the log thread
+        structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+    )
 
     structlog.configure(
         processors=processors,
@@ -179,7 +375,7 @@ def configure_structlog():
             getattr(settings, "LOG_LEVEL", "INFO").upper()
         ),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
@@ -5,7 +5,7 @@ from django.conf import settings
 from django.http import HttpResponseForbidden
 from django.utils.deprecation import MiddlewareMixin
 
-from config.observability import clear_request_context, metrics, set_request_context
+from config.observability import LogBuffer, clear_request_context, metrics, set_request_context
 
 
 class RequestIDMiddleware(MiddlewareMixin):
@@ -18,6 +18,7 @@ class RequestIDMiddleware(MiddlewareMixin):
             request_id = str(uuid.uuid4())
         request.request_id = request_id
         request._start_time = time.perf_counter()
+        request.log_buffer = LogBuffer()
 
         # Extract actor and org_id from token claims if available
         claims = getattr(request, "token_claims", {})
@@ -60,6 +61,11 @@ class RequestIDMiddleware(MiddlewareMixin):
                 },
             )
 
+        # Emit buffered handler events while the request context is still bound
+        log_buffer = getattr(request, "log_buffer", None)
+        if log_buffer is not None:
+            log_buffer.flush()
+
         # Clear request context
         clear_request_context()
 
@@ -79,8 +85,9 @@ class AdminHostnameMiddleware(MiddlewareMixin):
         If not set or DEBUG=True, admin is accessible on all hosts.
 
     Usage:
-        Add 'config.middleware.AdminHostnameMiddleware' to MIDDLEWARE after
-        SessionMiddleware and AuthenticationMiddleware.
+        Add 'config.middleware.AdminHostnameMiddleware' to MIDDLEWARE right
+        after SecurityMiddleware. It only reads the path and host, so
+        rejected requests never load a session or user.
 
     Production setup:
         1. Set ADMIN_HOSTNAME=admin.example.com in environment
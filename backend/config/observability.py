@@ -4,38 +4,32 @@ Observability utilities: request context, metrics, and tracing.
 This module provides:
 - Thread-local request context storage for logging
 - Prometheus-style metrics collection
+- Per-request log event buffering
 - Audit logging helpers
 """
 
+import bisect
 import contextvars
+import inspect
+import threading
 import time
+from collections import ChainMap, Counter
 from dataclasses import dataclass, field
-from functools import wraps
-from typing import Any, Callable, Dict
+from functools import lru_cache, wraps
+from typing import Any, Callable, Dict, Iterator, Mapping
 
 import structlog
 
 logger = structlog.get_logger(__name__)
 
-# Context variables for request-scoped data
-_request_context: contextvars.ContextVar[Dict[str, Any]] = contextvars.ContextVar(
-    "request_context", default={}
+# Context variables for request-scoped data. The value is a ChainMap so
+# bind_context() layers new fields on top instead of copying the whole dict;
+# layers are never mutated once set, so sharing them across contexts is safe.
+_request_context: contextvars.ContextVar[ChainMap] = contextvars.ContextVar(
+    "request_context", default=ChainMap()
 )
 
 
-@dataclass
-class RequestContext:
-    """Request context data for logging and tracing."""
-
-    request_id: str = ""
-    trace_id: str = ""
-    actor: str = ""
-    org_id: str = ""
-    path: str = ""
-    method: str = ""
-    user_agent: str = ""
-
-
 def set_request_context(
     request_id: str = "",
     trace_id: str = "",
@@ -63,104 +57,240 @@ def set_request_context(
     }
     # Filter out empty values
     context = {k: v for k, v in context.items() if v}
-    _request_context.set(context)
+    _request_context.set(ChainMap(context))
 
 
-def get_request_context() -> Dict[str, Any]:
-    """Get the current request context."""
+def get_request_context() -> Mapping[str, Any]:
+    """Get the current request context (read-only; use bind_context to add fields)."""
     return _request_context.get()
 
 
 def clear_request_context() -> None:
     """Clear the request context."""
-    _request_context.set({})
+    _request_context.set(ChainMap())
 
 
 def bind_context(**kwargs) -> None:
     """Add additional context to the current request context."""
-    context = _request_context.get().copy()
-    context.update(kwargs)
-    _request_context.set(context)
+    _request_context.set(_request_context.get().new_child(kwargs))
+
+
+@dataclass
+class LogBuffer:
+    """
+    Collects structured log events for a single request.
+
+    Handlers call ``get_log_buffer(request).add(event, **fields)`` instead of
+    ``logger.info``; RequestIDMiddleware flushes the buffer as one
+    ``request_events`` log line when the response is returned, so the
+    processor chain runs once per request rather than once per event.
+    """
+
+    events: list = field(default_factory=list)
+
+    def add(self, event: str, **fields) -> None:
+        """Append an event to the buffer."""
+        fields["event"] = event
+        self.events.append(fields)
+
+    def flush(self) -> None:
+        """Emit all buffered events as a single log call and reset the buffer."""
+        if not self.events:
+            return
+        from config.logging import pii_redactor, redact_dict_inplace
+
+        events, self.events = self.events, []
+        # The redactor in the logging chain only inspects top-level keys, so
+        # apply the PII policy to each buffered event (and what it nests)
+        for event in events:
+            redact_dict_inplace(pii_redactor(None, "info", event))
+        logger.info("request_events", events=events)
+
+
+def get_log_buffer(request) -> LogBuffer:
+    """
+    Return the request's LogBuffer.
+
+    Requests that did not pass through RequestIDMiddleware (management
+    commands, tests calling views directly) get a fresh buffer that is
+    flushed on every add, so events are logged rather than lost.
+    """
+    log_buffer = getattr(request, "log_buffer", None)
+    if log_buffer is None:
+        return _UnbufferedLogBuffer()
+    return log_buffer
+
+
+class _UnbufferedLogBuffer(LogBuffer):
+    """LogBuffer that logs each event as soon as it is added."""
+
+    def add(self, event: str, **fields) -> None:
+        super().add(event, **fields)
+        self.flush()
+
+
+# Upper bounds (seconds) of the histogram buckets, as in prometheus_client
+HISTOGRAM_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass
+class HistogramState:
+    """
+    Running aggregates for one histogram series.
+
+    Observations are folded into count/sum/min/max and fixed bucket counters
+    as they arrive, so memory stays constant and reads need no pass over
+    raw values.
+    """
+
+    count: int = 0
+    sum: float = 0.0
+    min: float = 0.0
+    max: float = 0.0
+    # Non-cumulative per-bucket counts; the extra last slot is the +Inf bucket
+    buckets: list = field(default_factory=lambda: [0] * (len(HISTOGRAM_BUCKETS) + 1))
+
+    def observe(self, value: float) -> None:
+        """Fold one observation into the aggregates."""
+        if self.count:
+            if value < self.min:
+                self.min = value
+            elif value > self.max:
+                self.max = value
+        else:
+            self.min = self.max = value
+        self.count += 1
+        self.sum += value
+        self.buckets[bisect.bisect_left(HISTOGRAM_BUCKETS, value)] += 1
+
+
+@lru_cache(maxsize=2048)
+def _label_key(name: str, label_items: frozenset) -> str:
+    """Build a metric key; label sets repeat, so the sort and join are cached."""
+    label_str = ",".join(f'{k}="{v}"' for k, v in sorted(label_items))
+    return f"{name}{{{label_str}}}"
 
 
 # Metrics storage (simple in-memory for development)
 # In production, use prometheus_client or similar
 @dataclass
 class MetricsCollector:
-    """Simple metrics collector for observability."""
+    """
+    Simple metrics collector for observability.
 
-    counters: Dict[str, int] = field(default_factory=dict)
-    histograms: Dict[str, list] = field(default_factory=dict)
+    Updates are serialized by a lock so concurrent request threads don't
+    lose increments. State is per process; with several worker processes,
+    use prometheus_client's multiprocess mode for accurate totals.
+    """
+
+    counters: Counter = field(default_factory=Counter)
+    histograms: Dict[str, HistogramState] = field(default_factory=dict)
     gauges: Dict[str, float] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
 
     def inc(self, name: str, value: int = 1, labels: Dict[str, str] = None) -> None:
         """Increment a counter."""
         key = self._make_key(name, labels)
-        self.counters[key] = self.counters.get(key, 0) + value
+        with self._lock:
+            self.counters[key] += value
 
     def observe(self, name: str, value: float, labels: Dict[str, str] = None) -> None:
         """Record a histogram observation."""
         key = self._make_key(name, labels)
-        if key not in self.histograms:
-            self.histograms[key] = []
-        self.histograms[key].append(value)
-        # Keep only last 1000 observations
-        if len(self.histograms[key]) > 1000:
-            self.histograms[key] = self.histograms[key][-1000:]
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = HistogramState()
+            histogram.observe(value)
 
     def set_gauge(self, name: str, value: float, labels: Dict[str, str] = None) -> None:
         """Set a gauge value."""
         key = self._make_key(name, labels)
-        self.gauges[key] = value
+        with self._lock:
+            self.gauges[key] = value
 
     def _make_key(self, name: str, labels: Dict[str, str] = None) -> str:
         """Create a metric key from name and labels."""
         if not labels:
             return name
-        label_str = ",".join(f'{k}="{v}"' for k, v in sorted(labels.items()))
-        return f"{name}{{{label_str}}}"
+        return _label_key(name, frozenset(labels.items()))
 
     def get_metrics(self) -> Dict[str, Any]:
         """Get all metrics as a dictionary."""
-        return {
-            "counters": dict(self.counters),
-            "histograms": {
-                k: {
-                    "count": len(v),
-                    "sum": sum(v) if v else 0,
-                    "avg": sum(v) / len(v) if v else 0,
-                    "min": min(v) if v else 0,
-                    "max": max(v) if v else 0,
-                }
-                for k, v in self.histograms.items()
-            },
-            "gauges": dict(self.gauges),
-        }
+        # Hold the lock so concurrent updates can't resize the dicts mid-copy
+        with self._lock:
+            return {
+                "counters": dict(self.counters),
+                "histograms": {
+                    k: {
+                        "count": h.count,
+                        "sum": h.sum,
+                        "avg": h.sum / h.count if h.count else 0,
+                        "min": h.min,
+                        "max": h.max,
+                    }
+                    for k, h in self.histograms.items()
+                },
+                "gauges": dict(self.gauges),
+            }
 
     def to_prometheus_format(self) -> str:
         """Export metrics in Prometheus text format."""
-        lines = []
-
-        # Counters
-        for key, value in self.counters.items():
-            lines.append(f"# TYPE {key.split('{')[0]} counter")
-            lines.append(f"{key} {value}")
-
-        # Histograms (simplified - just count, sum, avg)
-        for key, values in self.histograms.items():
-            base_name = key.split("{")[0]
-            labels = key[len(base_name) :] if "{" in key else ""
-            if values:
-                lines.append(f"# TYPE {base_name} histogram")
-                lines.append(f"{base_name}_count{labels} {len(values)}")
-                lines.append(f"{base_name}_sum{labels} {sum(values)}")
-
-        # Gauges
-        for key, value in self.gauges.items():
-            lines.append(f"# TYPE {key.split('{')[0]} gauge")
-            lines.append(f"{key} {value}")
-
-        return "\n".join(lines)
+        return "\n".join(self.iter_prometheus_lines())
+
+    def iter_prometheus_lines(self) -> Iterator[str]:
+        """
+        Return an iterator over the Prometheus text format lines.
+
+        The metrics are snapshotted under the lock when this is called; the
+        lines are formatted lazily, so a streaming response never holds the
+        whole export in memory. Series are grouped by metric family so each
+        family gets a single ``# TYPE`` line, as the exposition format requires.
+        """
+        with self._lock:
+            counters = list(self.counters.items())
+            histograms = [
+                (key, h.count, h.sum, list(h.buckets)) for key, h in self.histograms.items()
+            ]
+            gauges = list(self.gauges.items())
+
+        families: Dict[str, tuple] = {}
+
+        def family(base_name: str, kind: str) -> list:
+            if base_name not in families:
+                families[base_name] = (kind, [])
+            return families[base_name][1]
+
+        for series in counters:
+            family(series[0].split("{", 1)[0], "counter").append(series)
+        for series in histograms:
+            family(series[0].split("{", 1)[0], "histogram").append(series)
+        for series in gauges:
+            family(series[0].split("{", 1)[0], "gauge").append(series)
+
+        return self._format_families(families)
+
+    @staticmethod
+    def _format_families(families: Dict[str, tuple]) -> Iterator[str]:
+        for base_name, (kind, members) in families.items():
+            yield f"# TYPE {base_name} {kind}"
+            if kind != "histogram":
+                for key, value in members:
+                    yield f"{key} {value}"
+                continue
+            for key, count, total, buckets in members:
+                _, _, rest = key.partition("{")
+                labels = f"{{{rest}" if rest else ""
+                # Splice the "le" label into any existing label set
+                bucket_prefix = (
+                    f"{base_name}_bucket{labels[:-1]}," if labels else f"{base_name}_bucket{{"
+                )
+                cumulative = 0
+                for bound, bucket_count in zip((*HISTOGRAM_BUCKETS, "+Inf"), buckets):
+                    cumulative += bucket_count
+                    yield f'{bucket_prefix}le="{bound}"}} {cumulative}'
+                yield f"{base_name}_count{labels} {count}"
+                yield f"{base_name}_sum{labels} {total}"
 
 
 # Global metrics collector
@@ -171,21 +301,35 @@ def timed(metric_name: str, labels: Dict[str, str] = None):
     """
     Decorator to measure function execution time.
 
+    Works on both plain and ``async def`` functions.
+
     Usage:
         @timed("http_request_duration_seconds", {"handler": "my_view"})
         def my_view(request):
             ...
     """
+    observe = metrics.observe
 
     def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                start = time.perf_counter_ns()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    observe(metric_name, (time.perf_counter_ns() - start) / 1e9, labels)
+
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            start = time.perf_counter()
+            start = time.perf_counter_ns()
             try:
                 return func(*args, **kwargs)
             finally:
-                duration = time.perf_counter() - start
-                metrics.observe(metric_name, duration, labels)
+                observe(metric_name, (time.perf_counter_ns() - start) / 1e9, labels)
 
         return wrapper
 
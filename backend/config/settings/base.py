@@ -13,7 +13,15 @@ BASE_DIR = Path(__file__).resolve().parents[2]
 
 SECRET_KEY = os.getenv("DJANGO_SECRET_KEY", "changeme")
 DEBUG = os.getenv("DJANGO_DEBUG", "true").lower() == "true"
-ALLOWED_HOSTS = os.getenv("DJANGO_ALLOWED_HOSTS", "localhost,127.0.0.1").split(",")
+# Stripped and de-duplicated (order kept): Django and django-cors-headers scan
+# these lists on every request
+ALLOWED_HOSTS = list(
+    dict.fromkeys(
+        h.strip()
+        for h in os.getenv("DJANGO_ALLOWED_HOSTS", "localhost,127.0.0.1").split(",")
+        if h.strip()
+    )
+)
 
 INSTALLED_APPS = [
     "daphne",  # Django Channels ASGI server - must be before django.contrib.staticfiles
@@ -51,6 +59,10 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    # Serves hashed, precompressed static files before any per-request work
+    "whitenoise.middleware.WhiteNoiseMiddleware",
+    # Cheap path/host check; rejects off-host admin requests before sessions load
+    "config.middleware.AdminHostnameMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -59,8 +71,8 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "csp.middleware.CSPMiddleware",
+    # Must follow AuthenticationMiddleware (see django-axes docs)
     "axes.middleware.AxesMiddleware",
-    "config.middleware.AdminHostnameMiddleware",
     "config.middleware.RequestIDMiddleware",
     "api.idempotency.IdempotencyMiddleware",
     "wagtail.contrib.redirects.middleware.RedirectMiddleware",
@@ -87,16 +99,24 @@ TEMPLATES = [
 WSGI_APPLICATION = "config.wsgi.application"
 ASGI_APPLICATION = "config.asgi.application"
 
-# Django Channels - WebSocket support with Redis backend
+# Django Channels - WebSocket support with Redis backend. The pub/sub layer
+# lets Redis fan group messages out to subscribers instead of each consumer
+# polling per-channel lists; delivery is at-most-once, which suits the
+# notification pushes in api/consumers.py.
 CHANNEL_LAYERS = {
     "default": {
-        "BACKEND": "channels_redis.core.RedisChannelLayer",
+        "BACKEND": "channels_redis.pubsub.RedisPubSubChannelLayer",
         "CONFIG": {
             "hosts": [(os.getenv("REDIS_HOST", "redis"), int(os.getenv("REDIS_PORT", "6379")))],
         },
     },
 }
 
+_POSTGRES_PGBOUNCER = os.getenv("POSTGRES_PGBOUNCER", "false").lower() == "true"
+# psycopg's connection pool; off by default behind PgBouncer, which already pools.
+# Total server connections = processes * POSTGRES_POOL_MAX_SIZE.
+_POSTGRES_POOL = os.getenv("POSTGRES_POOL", str(not _POSTGRES_PGBOUNCER)).lower() == "true"
+
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.postgresql",
@@ -105,29 +125,78 @@ DATABASES = {
         "PASSWORD": os.getenv("POSTGRES_PASSWORD", "changeme"),
         "HOST": os.getenv("POSTGRES_HOST", "postgres"),
         "PORT": os.getenv("POSTGRES_PORT", "5432"),
+        # Reuse connections across requests instead of reconnecting each time;
+        # health checks drop connections the server closed while idle. Django
+        # rejects persistent connections when pooling, and PgBouncer already
+        # keeps server connections warm, so neither holds its own.
+        "CONN_MAX_AGE": (
+            0
+            if _POSTGRES_POOL
+            else int(os.getenv("POSTGRES_CONN_MAX_AGE", "0" if _POSTGRES_PGBOUNCER else "600"))
+        ),
+        "CONN_HEALTH_CHECKS": True,
+        # Server-side cursors don't survive PgBouncer transaction pooling
+        "DISABLE_SERVER_SIDE_CURSORS": _POSTGRES_PGBOUNCER,
+        "OPTIONS": (
+            {
+                "pool": {
+                    "min_size": int(os.getenv("POSTGRES_POOL_MIN_SIZE", "2")),
+                    "max_size": int(os.getenv("POSTGRES_POOL_MAX_SIZE", "8")),
+                    # Fail fast instead of queueing when the pool is exhausted
+                    "timeout": int(os.getenv("POSTGRES_POOL_TIMEOUT", "10")),
+                }
+            }
+            if _POSTGRES_POOL
+            else {}
+        ),
     }
 }
 
+# redis-py picks the hiredis C parser automatically when it is installed.
+# Values stay pickled: cache_page stores HttpResponse objects, which msgpack
+# cannot encode. A connection is bound to one DB, so each cache keeps its own
+# pool; the blocking pool makes callers wait for a free connection at the cap
+# instead of failing with "Too many connections".
+_REDIS_CACHE_OPTIONS = {
+    "CLIENT_CLASS": "django_redis.client.DefaultClient",
+    "CONNECTION_POOL_CLASS": "redis.BlockingConnectionPool",
+    "CONNECTION_POOL_KWARGS": {
+        "max_connections": int(os.getenv("REDIS_MAX_CONNECTIONS", "50")),
+        "timeout": 5,
+    },
+}
+
 CACHES = {
     "default": {
         "BACKEND": "django_redis.cache.RedisCache",
         "LOCATION": f"redis://{os.getenv('REDIS_HOST', 'redis')}:{os.getenv('REDIS_PORT', '6379')}/{os.getenv('REDIS_DB_CACHE', '0')}",
-        "OPTIONS": {"CLIENT_CLASS": "django_redis.client.DefaultClient"},
+        "OPTIONS": _REDIS_CACHE_OPTIONS,
     },
     "idempotency": {
         "BACKEND": "django_redis.cache.RedisCache",
         "LOCATION": f"redis://{os.getenv('REDIS_HOST', 'redis')}:{os.getenv('REDIS_PORT', '6379')}/{os.getenv('REDIS_DB_RATELIMIT', '1')}",
-        "OPTIONS": {"CLIENT_CLASS": "django_redis.client.DefaultClient"},
+        "OPTIONS": _REDIS_CACHE_OPTIONS,
     },
     # Isolated cache for Cerbos authorization decisions (security-sensitive)
     "cerbos": {
         "BACKEND": "django_redis.cache.RedisCache",
         "LOCATION": f"redis://{os.getenv('REDIS_HOST', 'redis')}:{os.getenv('REDIS_PORT', '6379')}/{os.getenv('REDIS_DB_CERBOS', '3')}",
-        "OPTIONS": {"CLIENT_CLASS": "django_redis.client.DefaultClient"},
+        "OPTIONS": _REDIS_CACHE_OPTIONS,
         "KEY_PREFIX": "cerbos",
     },
+    # Sessions get their own DB so clearing the default cache never logs users out
+    "sessions": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": f"redis://{os.getenv('REDIS_HOST', 'redis')}:{os.getenv('REDIS_PORT', '6379')}/{os.getenv('REDIS_DB_SESSIONS', '4')}",
+        "OPTIONS": _REDIS_CACHE_OPTIONS,
+    },
 }
 
+# Admin/CMS sessions live in Redis so authenticated requests skip the
+# django_session lookup; the API itself authenticates with tokens
+SESSION_ENGINE = "django.contrib.sessions.backends.cache"
+SESSION_CACHE_ALIAS = "sessions"
+
 AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
     {"NAME": "django.contrib.auth.password_validation.MinimumLengthValidator"},
@@ -153,12 +222,18 @@ REST_FRAMEWORK = {
         "api.auth_access_key.AccessKeyAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": ["rest_framework.permissions.IsAuthenticated"],
+    "DEFAULT_RENDERER_CLASSES": [
+        "api.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
     "DEFAULT_PARSER_CLASSES": [
-        "rest_framework.parsers.JSONParser",
+        "api.parsers.ORJSONParser",
         "rest_framework.parsers.FormParser",
         "rest_framework.parsers.MultiPartParser",
     ],
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.LimitOffsetPagination",
+    # Keyset pagination with a ?cursor= param; ?offset= still works. Lists that
+    # are not ordered newest first fall back to plain LIMIT/OFFSET.
+    "DEFAULT_PAGINATION_CLASS": "api.pagination.KeysetLimitOffsetPagination",
     "PAGE_SIZE": 50,
     "DEFAULT_THROTTLE_CLASSES": [
         "rest_framework.throttling.AnonRateThrottle",
@@ -180,13 +255,21 @@ SPECTACULAR_SETTINGS = {
     "DESCRIPTION": "Multi-tenant API with Keycloak OIDC auth and Cerbos policy-based authorization",
     "VERSION": "1.0.0",
     "SERVE_INCLUDE_SCHEMA": False,
+    # One schema for every caller; config/urls.py caches it on that basis
+    "SERVE_PUBLIC": True,
     "COMPONENT_SPLIT_REQUEST": True,
     "SWAGGER_UI_SETTINGS": {
         "persistAuthorization": True,
     },
 }
 
-CORS_ALLOWED_ORIGINS = os.getenv("CORS_ALLOWED_ORIGINS", "http://localhost:3000").split(",")
+CORS_ALLOWED_ORIGINS = list(
+    dict.fromkeys(
+        o.strip()
+        for o in os.getenv("CORS_ALLOWED_ORIGINS", "http://localhost:3000").split(",")
+        if o.strip()
+    )
+)
 CORS_ALLOW_CREDENTIALS = True
 
 # Content Security Policy (CSP) configuration
@@ -227,7 +310,11 @@ if USE_S3:
 else:
     STORAGES = {
         "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
-        "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+        # collectstatic writes gzip/brotli variants and content-hashed names,
+        # so WhiteNoise can serve them with far-future cache headers
+        "staticfiles": {
+            "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
+        },
     }
 
 # Structlog logging configuration with request context and PII redaction
@@ -239,35 +326,56 @@ ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
 _LOG_LEVEL_INT = getattr(logging, LOG_LEVEL.upper(), logging.INFO)
 
 structlog.configure(
-    processors=[
+    # A tuple: fixed for the process lifetime and iterated on every log call
+    processors=(
         structlog.contextvars.merge_contextvars,
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.add_log_level,
         add_service_info,
         add_request_context,
-        pii_redactor,
-        structlog.processors.EventRenamer("message"),
         structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
-        structlog.processors.JSONRenderer(),
-    ],
+        # Redact before the event leaves structlog, so output that bypasses
+        # QueueLogHandler is covered too; the formatter redacts again (idempotent)
+        pii_redactor,
+        # JSON rendering runs on the log listener thread
+        # (see config.logging.json_formatter / QueueLogHandler)
+        structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+    ),
     wrapper_class=structlog.make_filtering_bound_logger(_LOG_LEVEL_INT),
     context_class=dict,
-    logger_factory=structlog.PrintLoggerFactory(),
+    logger_factory=structlog.stdlib.LoggerFactory(),
     cache_logger_on_first_use=True,
 )
 
+# Log records are enqueued on the request thread and written by a background
+# listener, so formatting and stream I/O stay off the response path.
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
     "handlers": {
         "console": {
-            "class": "logging.StreamHandler",
+            "()": "config.logging.QueueLogHandler",
+            "maxsize": int(os.getenv("LOG_QUEUE_MAXSIZE", "10000")),
         },
     },
     "root": {
         "handlers": ["console"],
-        "level": "INFO",
+        "level": _LOG_LEVEL_INT,
+    },
+    "loggers": {
+        # Replace Django's default synchronous console/mail_admins handlers so
+        # django.request and django.server records also go through the queue
+        "django": {
+            "handlers": ["console"],
+            "level": _LOG_LEVEL_INT,
+            "propagate": False,
+        },
+        "django.server": {
+            "handlers": ["console"],
+            "level": _LOG_LEVEL_INT,
+            "propagate": False,
+        },
     },
 }
 
@@ -313,6 +421,9 @@ MFA_ACR_VALUES = [
 # Cerbos
 CERBOS_URL = os.getenv("CERBOS_URL", "http://cerbos:3592")
 CERBOS_DECISION_CACHE_TTL = int(os.getenv("CERBOS_DECISION_CACHE_TTL", "30"))
+# Per-process LRU in front of the Redis decision cache (0 TTL disables it)
+CERBOS_LOCAL_CACHE_TTL = int(os.getenv("CERBOS_LOCAL_CACHE_TTL", "5"))
+CERBOS_LOCAL_CACHE_SIZE = int(os.getenv("CERBOS_LOCAL_CACHE_SIZE", "10000"))
 
 # Cerbos TLS settings - MUST be true in production
 CERBOS_TLS_VERIFY = os.getenv("CERBOS_TLS_VERIFY", "false").lower() == "true"
@@ -327,6 +438,9 @@ CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = TIME_ZONE
+# Keep the LOGGING config (QueueLogHandler, JSON + PII redaction) in workers
+# instead of Celery's own root-logger handlers
+CELERY_WORKER_HIJACK_ROOT_LOGGER = False
 
 # Celery reliability settings
 CELERY_TASK_ACKS_LATE = True  # Acknowledge after task completes (not before)
@@ -345,6 +459,10 @@ CELERY_TASK_TRACK_STARTED = True  # Track when tasks start
 CELERY_TASK_TIME_LIMIT = 300  # Hard limit: 5 minutes
 CELERY_TASK_SOFT_TIME_LIMIT = 240  # Soft limit: 4 minutes (raises SoftTimeLimitExceeded)
 CELERY_RESULT_EXPIRES = 86400  # Results expire after 24 hours
+# Nothing polls task results, so don't write one per task. Tasks whose callers
+# read the result opt back in with @shared_task(ignore_result=False).
+CELERY_TASK_IGNORE_RESULT = True
+CELERY_RESULT_BACKEND_TRANSPORT_OPTIONS = {"global_keyprefix": "celery-results:"}
 
 # Dead letter queue routing
 CELERY_TASK_QUEUES = {
@@ -361,6 +479,13 @@ CELERY_TASK_DEFAULT_QUEUE = "default"
 CELERY_TASK_DEFAULT_EXCHANGE = "default"
 CELERY_TASK_DEFAULT_ROUTING_KEY = "default"
 
+# Monitoring: deadline for Celery inspect broadcasts, and optional list of
+# known worker hostnames (e.g. "celery@worker-1,celery@worker-2") to target
+CELERY_INSPECT_TIMEOUT = float(os.getenv("CELERY_INSPECT_TIMEOUT", "1.0"))
+CELERY_MONITOR_WORKERS = [
+    w.strip() for w in os.getenv("CELERY_MONITOR_WORKERS", "").split(",") if w.strip()
+]
+
 # Task deduplication TTL (in Redis)
 CELERY_TASK_DEDUP_TTL = int(os.getenv("CELERY_TASK_DEDUP_TTL", "3600"))  # 1 hour default
 
@@ -492,9 +617,12 @@ DEFAULT_FROM_EMAIL = os.getenv("DEFAULT_FROM_EMAIL", "noreply@example.com")
 # Wagtail CMS settings
 WAGTAIL_SITE_NAME = os.getenv("WAGTAIL_SITE_NAME", "Django Boilerplate CMS")
 WAGTAILADMIN_BASE_URL = os.getenv("WAGTAILADMIN_BASE_URL", "http://localhost:8000")
+# PostgreSQL full-text search: queries hit the GIN-indexed tsvector columns of
+# wagtailsearch's index entries (created by its migrations) instead of scanning
+# page rows. Run `manage.py update_index` after deploying new search_fields.
 WAGTAILSEARCH_BACKENDS = {
     "default": {
-        "BACKEND": "wagtail.search.backends.database",
+        "BACKEND": "wagtail.search.backends.database.postgres.postgres",
     }
 }
 # Allow more form fields for complex page models
@@ -47,5 +47,8 @@ X_FRAME_OPTIONS = "DENY"
 # Admin paths (/admin/, /cms/) are excluded via CSP_EXCLUDE_URL_PREFIXES to allow
 # Django admin and Wagtail CMS inline styles while maintaining strong CSP for the main app.
 
+# Static files are collected at build time; don't scan app finders per request
+WHITENOISE_USE_FINDERS = False
+
 # Logging - ensure no sensitive data in production logs
 AXES_VERBOSE = False  # Don't log verbose info in production
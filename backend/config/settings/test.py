@@ -1,10 +1,12 @@
+import logging
+
 from .base import *  # noqa: F401,F403
 
 # Test signing key for audit log integrity tests
 AUDIT_SIGNING_KEY = "test-signing-key-for-audit-logs"
 
-# Test encryption keys for field encryption tests
-FIELD_ENCRYPTION_KEYS = ["test-encryption-key-32-bytes-lon"]  # 32 chars for Fernet
+# Test encryption key for field encryption tests - only for tests!
+FIELD_ENCRYPTION_KEYS = ["0YWTBYHQnZek-VOlZPk-a2j8nHm0WqkhHpPHH9k6oVQ="]
 
 DATABASES = {
     "default": {
@@ -13,10 +15,22 @@ DATABASES = {
     }
 }
 
+# Let Wagtail pick the search backend for SQLite
+WAGTAILSEARCH_BACKENDS = {
+    "default": {"BACKEND": "wagtail.search.backends.database"},
+}
+
+# The manifest only exists after collectstatic
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+}
+
 CACHES = {
     "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
     "idempotency": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
     "cerbos": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "sessions": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
 }
 
 # Use in-memory channel layer for testing (no Redis required)
@@ -78,3 +92,12 @@ AXES_ENABLED = False  # Disable axes in tests to avoid lockouts
 
 # Disable rate limiting in tests
 REST_FRAMEWORK["DEFAULT_THROTTLE_CLASSES"] = []  # noqa: F405
+
+# Argon2 is deliberately slow; tests only need hashes that round-trip
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+# Only write warnings and errors during test runs; INFO events are still
+# processed by structlog, so logging code paths stay covered
+LOGGING["root"]["level"] = logging.WARNING  # noqa: F405
+for _logger in LOGGING["loggers"].values():  # noqa: F405
+    _logger["level"] = logging.WARNING
@@ -1,5 +1,7 @@
 from django.contrib import admin
 from django.urls import include, path
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_headers
 from drf_spectacular.views import (
     SpectacularAPIView,
     SpectacularRedocView,
@@ -11,13 +13,21 @@ from wagtail.documents import urls as wagtaildocs_urls
 
 from config.views import healthcheck
 
+# Schema generation introspects every view and serializer; the schema is the
+# same for every caller (SERVE_PUBLIC), so serve it from the cache. Vary on
+# Accept so JSON and YAML renderings are cached separately.
+SCHEMA_CACHE_TTL = 3600
+schema_view = cache_page(SCHEMA_CACHE_TTL, key_prefix="openapi-schema")(
+    vary_on_headers("Accept")(SpectacularAPIView.as_view())
+)
+
 urlpatterns = [
     # Django admin - access controlled by AdminHostnameMiddleware in production
     path("admin/", admin.site.urls),
     path("healthz", healthcheck, name="healthz"),
     path("api/v1/", include("api.urls")),
     # OpenAPI schema and documentation
-    path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
+    path("api/schema/", schema_view, name="schema"),
     path("api/docs/", SpectacularSwaggerView.as_view(url_name="schema"), name="swagger-ui"),
     path("api/redoc/", SpectacularRedocView.as_view(url_name="schema"), name="redoc"),
     # Wagtail CMS
@@ -0,0 +1,58 @@
+# Generated by Django 6.0 on 2026-10-17 12:00
+
+import json
+import uuid
+
+from django.db import migrations
+
+
+def _html_to_stream(html):
+    if not html:
+        return "[]"
+    return json.dumps([{"type": "paragraph", "value": html, "id": str(uuid.uuid4())}])
+
+
+def _stream_to_html(raw):
+    try:
+        blocks = json.loads(raw or "[]")
+    except ValueError:
+        return raw
+    return "".join(block["value"] for block in blocks if block.get("type") == "paragraph")
+
+
+def _convert(apps, convert):
+    HomePage = apps.get_model('home', 'HomePage')
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+    Revision = apps.get_model('wagtailcore', 'Revision')
+
+    for page in HomePage.objects.only('body'):
+        HomePage.objects.filter(pk=page.pk).update(body=convert(page.body))
+
+    # Keep revisions revertable after the field type changes
+    content_type = ContentType.objects.filter(app_label='home', model='homepage').first()
+    if content_type is None:
+        return
+    for revision in Revision.objects.filter(content_type=content_type).only('content'):
+        if 'body' in revision.content:
+            revision.content['body'] = convert(revision.content['body'])
+            revision.save(update_fields=['content'])
+
+
+def forwards(apps, schema_editor):
+    _convert(apps, _html_to_stream)
+
+
+def backwards(apps, schema_editor):
+    _convert(apps, _stream_to_html)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('home', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, backwards),
+    ]
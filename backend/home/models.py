@@ -1,7 +1,9 @@
 from django.db import models
 from wagtail.admin.panels import FieldPanel
-from wagtail.fields import RichTextField
+from wagtail import blocks
+from wagtail.fields import StreamField
 from wagtail.models import Page
+from wagtail.search import index
 
 
 class HomePage(Page):
@@ -9,12 +11,16 @@ class HomePage(Page):
     The main landing page for the site.
     """
 
-    body = RichTextField(blank=True)
+    body = StreamField([("paragraph", blocks.RichTextBlock())], blank=True)
 
     content_panels = Page.content_panels + [
         FieldPanel("body"),
     ]
 
+    search_fields = Page.search_fields + [
+        index.SearchField("body"),
+    ]
+
     class Meta:
         verbose_name = "Home Page"
         verbose_name_plural = "Home Pages"
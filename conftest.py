@@ -15,27 +15,17 @@ if str(SRC) not in sys.path:
 @pytest.fixture(autouse=True)
 def test_settings_and_patches():
     """
-    Autouse fixture for test settings overrides.
+    Give each test its own settings layer and a fresh EncryptionManager.
+
+    Caches, the database and the encryption key come from config.settings.test,
+    so nothing is overridden here; the empty override only keeps direct
+    assignments such as ``settings.FIELD_ENCRYPTION_KEYS = []`` from leaking
+    into later tests, without firing setting_changed for caches or databases.
     """
-    caches = {
-        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
-        "idempotency": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
-        "cerbos": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
-    }
-    # Test encryption key - only for tests!
-    test_encryption_key = "0YWTBYHQnZek-VOlZPk-a2j8nHm0WqkhHpPHH9k6oVQ="
-    with override_settings(
-        CACHES=caches,
-        DATABASES={
-            "default": {
-                "ENGINE": "django.db.backends.sqlite3",
-                "NAME": ":memory:",
-            }
-        },
-        FIELD_ENCRYPTION_KEYS=[test_encryption_key],
-    ):
+    from api.encryption import EncryptionManager
+
+    with override_settings():
         # Reset EncryptionManager singleton to pick up test settings
-        from api.encryption import EncryptionManager
         EncryptionManager.reset()
         yield
         # Reset again after tests to clean up